@@ -0,0 +1,11 @@
+"""퇴마록 headless balance simulator.
+
+Runs thousands of seeded games at once as NumPy arrays and writes
+per-minute distributions. See `python -m balance --help`.
+
+Needs numpy; Parquet output also needs pyarrow (CSV otherwise).
+"""
+
+from .sim import METRICS, SimConfig, simulate
+
+__all__ = ["METRICS", "SimConfig", "simulate"]
@@ -0,0 +1,106 @@
+"""CLI: python -m balance --runs 4000 --out balance_out"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .sim import METRICS, SimConfig, simulate
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # CSV only
+    pa = None
+
+QUANTILES = (0.1, 0.5, 0.9)
+BLOCK = 250     # runs per work item; seeds are per block, so output doesn't depend on --jobs
+
+
+def _chunk(args):
+    cfg, runs, seed = args
+    return simulate(cfg, runs, seed)
+
+
+def run_all(cfg, runs, seed, jobs):
+    """Run the games in BLOCK-sized chunks over `jobs` processes."""
+    sizes = [min(BLOCK, runs - i) for i in range(0, runs, BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    work = [(cfg, n, s) for n, s in zip(sizes, seeds)]
+    if jobs <= 1 or len(work) == 1:
+        parts = [_chunk(w) for w in work]
+    else:
+        with ProcessPoolExecutor(jobs) as ex:
+            parts = list(ex.map(_chunk, work))
+    return {m: np.concatenate([p[m] for p in parts]) for m in METRICS}
+
+
+def long_table(out):
+    """One row per (run, minute)."""
+    runs, minutes = out[METRICS[0]].shape
+    cols = {
+        "run": np.repeat(np.arange(runs), minutes),
+        "minute": np.tile(np.arange(1, minutes + 1), runs),
+    }
+    for m in METRICS:
+        cols[m] = out[m].ravel()
+    return cols
+
+
+def summary_table(out):
+    """Per-minute mean and quantiles of every metric across runs."""
+    minutes = out[METRICS[0]].shape[1]
+    cols = {"minute": np.arange(1, minutes + 1)}
+    for m in METRICS:
+        cols[f"{m}_mean"] = out[m].mean(0)
+        for q, v in zip(QUANTILES, np.quantile(out[m], QUANTILES, axis=0)):
+            cols[f"{m}_p{int(q * 100)}"] = v
+    return cols
+
+
+def write_table(cols, path, fmt):
+    if fmt == "parquet":
+        pq.write_table(pa.table(cols), path + ".parquet")
+        return path + ".parquet"
+    names = list(cols)
+    with open(path + ".csv", "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(names)
+        w.writerows(zip(*(cols[n].tolist() for n in names)))
+    return path + ".csv"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m balance", description=__doc__)
+    ap.add_argument("--runs", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--out", default="balance_out", help="output directory")
+    ap.add_argument("--format", choices=("parquet", "csv"), default="parquet" if pa else "csv")
+    for name, val in vars(SimConfig()).items():
+        ap.add_argument("--" + name.replace("_", "-"), type=type(val), default=val)
+    args = ap.parse_args(argv)
+    if args.format == "parquet" and pa is None:
+        ap.error("parquet output needs pyarrow; use --format csv")
+
+    cfg = SimConfig(**{k: getattr(args, k) for k in vars(SimConfig())})
+    t0 = time.perf_counter()
+    out = run_all(cfg, args.runs, args.seed, args.jobs)
+    t1 = time.perf_counter()
+    os.makedirs(args.out, exist_ok=True)
+    paths = [
+        write_table(long_table(out), os.path.join(args.out, "runs"), args.format),
+        write_table(summary_table(out), os.path.join(args.out, "summary"), args.format),
+    ]
+    print(f"✅ {args.runs} runs × {cfg.minutes:g} min in {t1 - t0:.1f}s ({args.jobs} jobs)")
+    for p in paths:
+        print(f"   {p}")
+    med = np.median(out["level"], 0)
+    print("   median level by minute: " + " ".join(f"{v:g}" for v in med))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Vectorised balance simulation.
+
+Every array has one row per run, and enemies live in a fixed block of
+slots per run. One tick advances every run at once. The spawn counts
+follow game time exactly (updateSpawning is deterministic apart from the
+type roll), so they are scalars shared by all runs. Only the type rolls,
+the kills and the exp differ between runs.
+
+The model is radial. An enemy is its distance from the player. It closes
+at its own speed until it reaches CONTACT. Player damage is spread evenly
+over the enemies within `reach`, which approximates a mix of area and
+single-target weapons. Orbs drop where enemies die. The pending exp is
+collected with a mean delay of `pickup_delay` and expires at the game's
+ORB_LIFE. The player never dies. A run ends at the time limit or when
+구미호왕 is killed.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import tables
+
+CONTACT = 20.0
+SLOT_SLACK = 96         # room above the cap for one tick of spawns
+
+
+@dataclass
+class SimConfig:
+    minutes: float = 15.0
+    dt: float = 0.5
+    char: int = 0
+    cap: int = tables.ENEMY_CAP
+    dps_base: float = 16.0      # 부적 Lv1: (5+3) dmg every 0.5 s, before atk
+    dps_per_level: float = 0.25  # extra fraction of dps_base per player level
+    reach: float = 200.0
+    pickup_delay: float = 2.0
+    exp_mul: float = 1.0
+
+    @property
+    def ticks(self):
+        return int(round(self.minutes * 60 / self.dt))
+
+
+# Sampled at the end of each minute. evictions and dps_required cover that
+# minute; contact is the mean number of enemies touching the player.
+METRICS = ("enemies", "evictions", "level", "dps_required", "kills", "contact")
+
+ENEMY_TABLE = np.array([d[1:4] for d in tables.ENEMY_DEFS], dtype=np.float32)  # hp, spd, exp
+
+
+def _type_table(t):
+    """Spawnable type ids and their roll probabilities at game time t."""
+    avail = np.array([i for i, d in enumerate(tables.ENEMY_DEFS) if t >= d[4]])
+    w = 1 + np.arange(len(avail)) * 0.5
+    return avail, w / w.sum()
+
+
+def _ranks(rows, n):
+    """Position of each entry within its run, for `rows` sorted ascending."""
+    counts = np.bincount(rows, minlength=n)
+    return np.arange(len(rows)) - (np.cumsum(counts) - counts)[rows], counts
+
+
+class Swarm:
+    """Regular enemies of every run. A free slot has dist = inf, so slot
+    liveness needs no mask of its own. Free slots sit on a per-run stack,
+    so spawning costs O(spawns), not O(slots)."""
+
+    def __init__(self, runs, slots):
+        shape = (runs, slots)
+        self.dist = np.full(shape, np.inf, np.float32)
+        self.hp = np.zeros(shape, np.float32)
+        self.spd = np.zeros(shape, np.float32)
+        self.exp = np.zeros(shape, np.float32)
+        self.free = np.tile(np.arange(slots - 1, -1, -1, dtype=np.int32), (runs, 1))
+        self.n_free = np.full(runs, slots)
+        self.slots = slots
+
+    @property
+    def count(self):
+        return self.slots - self.n_free
+
+    def take(self, want):
+        """Pop want[r] free slots for each run r; returns (rows, cols)."""
+        rows = np.repeat(np.arange(len(want)), want)
+        j, _ = _ranks(rows, len(want))
+        cols = self.free[rows, self.n_free[rows] - 1 - j]
+        self.n_free -= want
+        return rows, cols
+
+    def release(self, rows, cols):
+        """Free slots; `rows` sorted ascending, as np.nonzero returns them."""
+        self.dist[rows, cols] = np.inf
+        j, counts = _ranks(rows, len(self.n_free))
+        self.free[rows, self.n_free[rows] + j] = cols
+        self.n_free += counts
+
+    def spawn(self, want, kinds_for, t, at):
+        """Place up to want[r] enemies in each run r at distance `at`.
+
+        Returns (enemies that found no slot, hp added, rows, kinds), the first
+        two per run.
+        """
+        got = np.minimum(want, self.n_free)
+        rows, cols = self.take(got)
+        kinds = kinds_for(rows)
+        hp = ENEMY_TABLE[kinds, 0] * np.float32(tables.hp_scale(t))
+        self.dist[rows, cols] = at
+        self.hp[rows, cols] = hp
+        self.spd[rows, cols] = ENEMY_TABLE[kinds, 1]
+        self.exp[rows, cols] = ENEMY_TABLE[kinds, 2]
+        return want - got, np.bincount(rows, weights=hp, minlength=len(want)), rows, kinds
+
+    def evict(self, keep):
+        """Drop the farthest enemies of each run beyond keep[r] (evictFarthest)."""
+        excess = np.maximum(self.count - keep, 0)
+        over = np.flatnonzero(excess)
+        if not len(over):
+            return excess
+        k = keep[over]
+        # one partition pass serves every distinct keep count (they differ only by boss count)
+        order = np.argpartition(self.dist[over], np.unique(k), axis=1)
+        local = np.repeat(np.arange(len(over)), excess[over])
+        j, _ = _ranks(local, len(over))
+        self.release(over[local], order[local, k[local] + j])
+        return excess
+
+
+def simulate(cfg, runs, seed=0):
+    """Run `runs` seeded games and return per-minute arrays of shape (runs, minutes)."""
+    rng = np.random.default_rng(seed)
+    R = runs
+    dt = np.float32(cfg.dt)
+    atk = tables.CHARS[cfg.char][1]
+    sw = Swarm(R, cfg.cap + SLOT_SLACK)
+
+    # bosses sit outside the slot block, one column per wave
+    waves = int(cfg.minutes * 60 // tables.BOSS_INTERVAL)
+    b_dist = np.full((R, waves), np.inf, np.float32)
+    b_hp = np.zeros((R, waves), np.float32)
+    b_spd = np.zeros(waves, np.float32)
+    b_exp = np.zeros(waves)
+    b_win = np.zeros(waves, bool)
+
+    level = np.ones(R, np.int32)
+    have = np.zeros(R)
+    pending = np.zeros(R)
+    to_next = np.full(R, tables.exp_to_next(1))
+    kills = np.zeros(R, np.int64)
+    evicted = np.zeros(R, np.int64)
+    contact = np.zeros(R, np.int64)
+    spawned_hp = np.zeros(R)
+    live = np.ones(R, bool)
+
+    n_min = int(np.ceil(cfg.minutes))
+    out = {m: np.zeros((R, n_min)) for m in METRICS}
+    take = 1 - np.exp(-cfg.dt / cfg.pickup_delay)
+    expire = cfg.dt / tables.ORB_LIFE
+    per_min = int(round(60 / cfg.dt))
+
+    spawn_timer = 0.0
+    boss_wave = 0
+    t = 0.0
+    for tick in range(cfg.ticks):
+        t_prev, t = t, (tick + 1) * cfg.dt
+
+        # ── Spawning (updateSpawning) ──
+        spawn_timer += cfg.dt * tables.spawn_rate(t)
+        count = int(spawn_timer)
+        spawn_timer -= count
+        if count:
+            avail, p = _type_table(t)
+            roll = lambda rows: avail[rng.choice(len(avail), len(rows), p=p)]
+            short, hp, rows, kinds = sw.spawn(count * live, roll, t, tables.SPAWN_DIST)
+            evicted += short
+            spawned_hp += hp
+            # 삼두구 arrives as a formation of three
+            extra = np.bincount(rows[kinds == tables.FORMATION_TYPE], minlength=R) * (tables.FORMATION_SIZE - 1)
+            if extra.any():
+                formation = lambda rows: np.full(len(rows), tables.FORMATION_TYPE)
+                short, hp, _, _ = sw.spawn(extra, formation, t, tables.SPAWN_DIST)
+                evicted += short
+                spawned_hp += hp
+        if int(t) % tables.BURST_INTERVAL == 0 and int(t) != int(t_prev):
+            grunts = lambda rows: np.zeros(len(rows), np.int64)
+            short, hp, _, _ = sw.spawn(tables.burst_count(t) * live, grunts, t, tables.BURST_DIST)
+            evicted += short
+            spawned_hp += hp
+
+        # ── Cap (bosses count toward it but are never evicted) ──
+        n_boss = np.isfinite(b_dist).sum(1)
+        evicted += sw.evict(np.maximum(cfg.cap - n_boss, 0))
+
+        if boss_wave < waves and t >= (boss_wave + 1) * tables.BOSS_INTERVAL:
+            kind = tables.BOSS_ORDER[boss_wave % len(tables.BOSS_ORDER)]
+            hp0, b_spd[boss_wave], b_exp[boss_wave] = tables.BOSS_DEFS[kind]
+            hp0 *= 1 + (boss_wave + 1) * tables.BOSS_HP_PER_WAVE
+            b_win[boss_wave] = kind == tables.VICTORY_BOSS
+            b_dist[live, boss_wave] = 350
+            b_hp[live, boss_wave] = hp0
+            spawned_hp += live * hp0
+            boss_wave += 1
+
+        # ── Approach and damage ──
+        sw.dist -= sw.spd * dt
+        np.maximum(sw.dist, CONTACT, out=sw.dist)
+        b_dist -= b_spd * dt
+        np.maximum(b_dist, CONTACT, out=b_dist)
+        near = sw.dist <= cfg.reach
+        b_near = b_dist <= cfg.reach
+        n_near = near.sum(1) + b_near.sum(1)
+        dps = cfg.dps_base * atk * (1 + cfg.dps_per_level * (level - 1))
+        share = (dps * cfg.dt / np.maximum(n_near, 1)).astype(np.float32)[:, None]
+        sw.hp -= near * share
+        b_hp -= b_near * share
+
+        rows, cols = np.nonzero(near & (sw.hp <= 0))
+        kills += np.bincount(rows, minlength=R)
+        pending += np.bincount(rows, weights=sw.exp[rows, cols], minlength=R) * cfg.exp_mul
+        sw.release(rows, cols)
+        b_dead = b_near & (b_hp <= 0)
+        if b_dead.any():
+            kills += b_dead.sum(1)
+            pending += (b_dead * b_exp).sum(1) * cfg.exp_mul
+            b_dist[b_dead] = np.inf
+            won = (b_dead & b_win).any(1)
+            if won.any():
+                live &= ~won
+                b_dist[won] = np.inf
+                rows, cols = np.nonzero(np.isfinite(sw.dist) & won[:, None])
+                sw.release(rows, cols)
+        contact += (sw.dist <= CONTACT).sum(1) + (b_dist <= CONTACT).sum(1)
+
+        # ── Orbs and levels: one level-up per pickup batch, as in updateOrbs ──
+        got = pending * take
+        pending -= got + pending * expire
+        have += got * live
+        up = have >= to_next
+        have -= to_next * up
+        level += up
+        to_next = np.where(up, tables.exp_to_next(level), to_next)
+
+        # ── Per-minute samples ──
+        if (tick + 1) % per_min == 0 or tick == cfg.ticks - 1:
+            m = min(int(np.ceil(t / 60)) - 1, n_min - 1)
+            span = t - m * 60
+            out["enemies"][:, m] = sw.count + np.isfinite(b_dist).sum(1)
+            out["evictions"][:, m] = evicted
+            out["level"][:, m] = level
+            out["dps_required"][:, m] = spawned_hp / span
+            out["kills"][:, m] = kills
+            out["contact"][:, m] = contact * cfg.dt / span
+            evicted[:] = 0
+            contact[:] = 0
+            spawned_hp[:] = 0
+    return out
@@ -0,0 +1,53 @@
+"""Balance tables, read from game.js through gamedata.
+
+The spawn/burst distances, formation size and orb lifetime below are not
+in the extracted tables; keep them in step with updateSpawning(),
+spawnEnemy() and ORB_LIFE by hand.
+"""
+
+import gamedata
+
+_data = gamedata.load()
+_bal = _data.balance
+
+# ── Enemies (ENEMY_DEFS) ──
+# name, hp, spd, exp, minTime
+ENEMY_DEFS = [(e.name, e.hp, e.spd, e.exp, e.min_time) for e in _data.enemies]
+FORMATION_TYPE = next(i for i, e in enumerate(_data.enemies) if e.pattern == "formation")
+FORMATION_SIZE = 3      # spawns as a group of 3
+
+# ── Bosses (spawnBoss) ──
+# boss type -> hp, spd, exp; boss waves cycle BOSS_ORDER every BOSS_INTERVAL
+BOSS_DEFS = {b.type: (b.hp, b.spd, b.exp) for b in _data.bosses}
+BOSS_ORDER = list(_bal.boss_order)
+BOSS_INTERVAL = _bal.boss_interval
+BOSS_HP_PER_WAVE = _bal.boss_hp_per_wave
+VICTORY_BOSS = next(b.type for b in _data.bosses if b.pattern == "boss2")   # killing 구미호왕 ends the run
+
+# ── Characters (CHARS): name, atk, range ──
+CHARS = [(c.name, c.atk, c.range) for c in _data.chars]
+
+# ── Spawning (updateSpawning / spawnEnemy) ──
+SPAWN_DIST = 380
+BURST_DIST = 400
+BURST_INTERVAL = _bal.burst_interval
+ENEMY_CAP = _bal.enemy_cap
+ORB_LIFE = 15
+
+
+def spawn_rate(t):
+    """Enemies per second at game time t."""
+    return _bal.eval(_bal.spawn_rate, gameTime=t)
+
+
+def burst_count(t):
+    return int(_bal.eval(_bal.burst_count, gameTime=t))
+
+
+def hp_scale(t):
+    return _bal.eval(_bal.hp_scale, gameTime=t)
+
+
+def exp_to_next(level):
+    """Exp needed to leave `level` (the first level-up costs 15); `level` may be an array."""
+    return _bal.eval(_bal.exp_to_next, level=level)
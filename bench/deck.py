@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Deck generator benchmark: startup, per-slide build and save times.
+
+Each scenario runs `--repeat` times and reports, for each stage, the best and
+median seconds. The optional captures are:
+- --memory: traced peak memory per stage (tracemalloc), with slower timings
+- --profile: the top cProfile entries per stage
+- --profile-dir: the raw .prof files as well
+Results are printed as JSON, so runs can be diffed for regressions.
+
+    python3 bench/deck.py                           all scenarios
+    python3 bench/deck.py --scenario deck,table-1000 --repeat 10 --out deck.json
+    python3 bench/deck.py --memory --profile --locale en --palette light
+
+Scenarios:
+  startup       fresh interpreters: bare startup, `import pptx`, `import make_ppt`, data load
+  deck          the 11 registered slides, built directly (no cache), then prs.save
+  cache         make_ppt.build() against an empty cache, a warm cache, and an up-to-date output
+  slides-100    100 slides, cycling through the builders
+  table-1000    one slide with a 125×8 table (1,000 cells)
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+STARTUP_PROBE = """
+import json, time
+t0 = time.perf_counter()
+from pptx import Presentation
+t1 = time.perf_counter()
+import make_ppt
+t2 = time.perf_counter()
+make_ppt.gamedata.load()
+t3 = time.perf_counter()
+print(json.dumps({"import pptx": t1 - t0, "import make_ppt": t2 - t1, "gamedata.load": t3 - t2}))
+"""
+
+
+class Stages:
+    """Per-stage timings with optional tracemalloc peaks and cProfile captures."""
+
+    def __init__(self, memory=False, profile=False):
+        self.memory = memory
+        self.profile = profile
+        self.times = defaultdict(list)
+        self.peaks = {}
+        self.profiles = {}
+
+    @contextmanager
+    def stage(self, name):
+        prof = self.profiles.setdefault(name, cProfile.Profile()) if self.profile else None
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        if prof:
+            prof.enable()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            if prof:
+                prof.disable()
+            self.times[name].append(dt)
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                self.peaks[name] = max(self.peaks.get(name, 0), peak)
+
+    def add(self, name, seconds):
+        self.times[name].append(seconds)
+
+    def report(self, top):
+        stages = {}
+        for name, times in self.times.items():
+            row = {"best_s": round(min(times), 5), "median_s": round(statistics.median(times), 5), "runs": len(times)}
+            if name in self.peaks:
+                row["peak_kb"] = round(self.peaks[name] / 1024, 1)
+            if name in self.profiles:
+                row["profile"] = top_functions(self.profiles[name], top)
+            stages[name] = row
+        return stages
+
+
+def top_functions(prof, top):
+    stats = pstats.Stats(prof)
+    rows = sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:top]
+    return [{"func": f"{os.path.basename(file)}:{line}({fn})", "ncalls": nc, "tottime": round(tt, 5),
+             "cumtime": round(ct, 5)} for (file, line, fn), (_, nc, tt, ct, _) in rows]
+
+
+# ── Scenarios ──
+def scenario_startup(st, args):
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        st.add("interpreter", time.perf_counter() - t0)
+        out = subprocess.run([sys.executable, "-c", STARTUP_PROBE], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        for name, seconds in json.loads(out).items():
+            st.add(name, seconds)
+
+
+def new_deck():
+    import make_ppt
+    prs = make_ppt.Presentation()
+    prs.slide_width = make_ppt.SW
+    prs.slide_height = make_ppt.SH
+    return prs
+
+
+def save(st, prs):
+    with st.stage("save"):
+        buf = io.BytesIO()
+        prs.save(buf)
+    return buf.tell()
+
+
+def scenario_deck(st, args):
+    import make_ppt
+    with st.stage("gamedata.load"):
+        d = make_ppt.localise(make_ppt.gamedata.load())
+    prs = new_deck()
+    for i, (builder, _) in enumerate(make_ppt.SLIDES, 1):
+        with st.stage(f"slide {i:02d} {builder.__name__}"):
+            builder(prs.slides.add_slide(prs.slide_layouts[6]), d)
+    return {"slides": len(prs.slides), "pptx_bytes": save(st, prs)}
+
+
+def scenario_cache(st, args):
+    import make_ppt
+    cache = tempfile.mkdtemp(prefix="deck-bench-")
+    saved, make_ppt.CACHE_DIR = make_ppt.CACHE_DIR, os.path.join(cache, "deck")
+    output = os.path.join(cache, "deck.pptx")
+    try:
+        with st.stage("build, empty cache"):
+            make_ppt.build(output, quiet=True)
+        os.remove(output)
+        with st.stage("build, warm cache"):
+            make_ppt.build(output, quiet=True)
+        with st.stage("build, up to date"):
+            make_ppt.build(output, quiet=True)
+    finally:
+        make_ppt.CACHE_DIR = saved
+        shutil.rmtree(cache)
+    return {}
+
+
+def scenario_slides_100(st, args):
+    import make_ppt
+    d = make_ppt.localise(make_ppt.gamedata.load())
+    prs = new_deck()
+    with st.stage("build 100 slides"):
+        for i in range(100):
+            builder, _ = make_ppt.SLIDES[i % len(make_ppt.SLIDES)]
+            builder(prs.slides.add_slide(prs.slide_layouts[6]), d)
+    return {"slides": len(prs.slides), "pptx_bytes": save(st, prs)}
+
+
+def scenario_table_1000(st, args):
+    import make_ppt
+    from pptx.util import Inches
+    rows = [[f"열{c}" for c in range(8)]] + [[f"{r}-{c}" for c in range(8)] for r in range(124)]
+    prs = new_deck()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    with st.stage("add_table 1000 cells"):
+        make_ppt.add_table(slide, Inches(0.3), Inches(0.3), Inches(12.7), Inches(6.9), rows)
+    return {"cells": sum(map(len, rows)), "pptx_bytes": save(st, prs)}
+
+
+SCENARIOS = {
+    "startup": scenario_startup,
+    "deck": scenario_deck,
+    "cache": scenario_cache,
+    "slides-100": scenario_slides_100,
+    "table-1000": scenario_table_1000,
+}
+
+
+def main():
+    t0 = time.perf_counter()
+    import make_ppt
+    import_s = time.perf_counter() - t0
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", default=",".join(SCENARIOS), help="comma list of " + ", ".join(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--locale", default="ko", choices=make_ppt.LOCALES)
+    parser.add_argument("--palette", default="dark", choices=tuple(make_ppt.PALETTES))
+    parser.add_argument("--memory", action="store_true", help="tracemalloc peak per stage")
+    parser.add_argument("--profile", action="store_true", help="top cProfile entries per stage")
+    parser.add_argument("--profile-dir", help="also write one .prof file per stage here")
+    parser.add_argument("--top", type=int, default=12, help="cProfile entries kept per stage")
+    parser.add_argument("--out")
+    args = parser.parse_args()
+    names = args.scenario.split(",")
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario {', '.join(unknown)}")
+    args.profile = args.profile or bool(args.profile_dir)
+
+    make_ppt.use_locale(args.locale)
+    make_ppt.use_palette(args.palette)
+
+    import pptx
+    results = {
+        "python": platform.python_version(),
+        "pptx": pptx.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "locale": args.locale,
+        "palette": args.palette,
+        "memory": args.memory,
+        "import_make_ppt_s": round(import_s, 5),
+        "scenarios": {},
+    }
+    if args.memory:
+        tracemalloc.start()
+    for name in names:
+        st = Stages(memory=args.memory and name != "startup", profile=args.profile and name != "startup")
+        info = {}
+        for _ in range(1 if name == "startup" else args.repeat):
+            info = SCENARIOS[name](st, args) or info
+        total = sum(min(t) for t in st.times.values())
+        results["scenarios"][name] = {**info, "total_best_s": round(total, 5), "stages": st.report(args.top)}
+        if args.profile_dir:
+            os.makedirs(args.profile_dir, exist_ok=True)
+            for stage, prof in st.profiles.items():
+                safe = "".join(c if c.isalnum() else "_" for c in stage)
+                prof.dump_stats(os.path.join(args.profile_dir, f"{name}-{safe}.prof"))
+    if args.memory:
+        tracemalloc.stop()
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+// ============================================
+// 퇴마록 - headless simulation benchmark
+// ============================================
+// Loads game.js into a Node vm context with stub canvas/audio/storage and
+// drives the fixed-step simulation through scripted scenarios, so engine
+// changes can be compared without a browser.
+//
+//   node bench/headless.js                       all scenarios, JSON to stdout
+//   node bench/headless.js --scenario boss-swarm --out bench.json
+//   node --expose-gc bench/headless.js --soa --draw --minutes 5
+//
+// Options: --scenario <name>[,<name>]  --minutes N (length of the 'run-*'
+// scenarios, default 15)  --seed N  --soa (?soa=1 enemy store)  --draw (also
+// call drawGame every frame against the stub 2d context)  --out <file>
+'use strict';
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { PerformanceObserver } = require('perf_hooks');
+
+const args = process.argv.slice(2);
+function arg(name, def) {
+    const i = args.indexOf('--' + name);
+    if (i < 0) return def;
+    const v = args[i + 1];
+    return v === undefined || v.startsWith('--') ? true : v;
+}
+const OPTS = {
+    scenarios: arg('scenario', null),
+    minutes: parseFloat(arg('minutes', 15)),
+    seed: parseInt(arg('seed', 1), 10) >>> 0,
+    soa: !!arg('soa', false),
+    draw: !!arg('draw', false),
+    out: arg('out', null),
+};
+const GAME_JS = path.join(__dirname, '..', 'game.js');
+
+// ============================================
+// BROWSER STUBS
+// ============================================
+// Every 2d-context method is a shared no-op; property writes are kept so
+// code that reads back fillStyle/globalAlpha still behaves.
+const noop = () => {};
+const gradient = { addColorStop: noop };
+const ctxMethods = {
+    measureText: (s) => ({ width: String(s).length * 6 }),
+    createLinearGradient: () => gradient, createRadialGradient: () => gradient,
+    createPattern: () => null, getImageData: (x, y, w, h) => ({ data: new Uint8ClampedArray(w * h * 4) }),
+    getTransform: () => ({ a: 1, b: 0, c: 0, d: 1, e: 0, f: 0 }),
+};
+function makeCtx(cv) {
+    return new Proxy({ canvas: cv }, {
+        get(o, k) { return k in o ? o[k] : (ctxMethods[k] || noop); },
+        set(o, k, v) { o[k] = v; return true; },
+    });
+}
+function makeStubCanvas(w, h) {
+    const cv = { width: w || 300, height: h || 150, style: {}, addEventListener: noop, removeEventListener: noop,
+        getBoundingClientRect: () => ({ left: 0, top: 0, width: cv.width, height: cv.height }) };
+    const c2d = makeCtx(cv);
+    cv.getContext = () => c2d;
+    return cv;
+}
+function makeAudioParam() {
+    return { value: 0, setValueAtTime: noop, linearRampToValueAtTime: noop, exponentialRampToValueAtTime: noop,
+        setTargetAtTime: noop, cancelScheduledValues: noop };
+}
+function makeAudioNode() {
+    const n = { connect: (d) => d, disconnect: noop, start: noop, stop: noop, addEventListener: noop,
+        gain: makeAudioParam(), frequency: makeAudioParam(), playbackRate: makeAudioParam(),
+        buffer: null, onended: null, type: '' };
+    return n;
+}
+function StubAudioContext() {
+    this.currentTime = 0; this.sampleRate = 44100; this.state = 'running';
+    this.destination = makeAudioNode();
+}
+StubAudioContext.prototype = {
+    resume: () => Promise.resolve(), suspend: () => Promise.resolve(),
+    createGain: makeAudioNode, createOscillator: makeAudioNode, createBufferSource: makeAudioNode,
+    createDynamicsCompressor: makeAudioNode, createBiquadFilter: makeAudioNode, createMediaElementSource: makeAudioNode,
+    createBuffer: (ch, len, rate) => { const d = []; for (let i = 0; i < ch; i++) d.push(new Float32Array(len));
+        return { numberOfChannels: ch, length: len, sampleRate: rate, duration: len / rate, getChannelData: (i) => d[i] }; },
+    decodeAudioData: () => Promise.resolve({ duration: 0, length: 0, numberOfChannels: 2, sampleRate: 44100, getChannelData: () => new Float32Array(0) }),
+};
+function StubAudio() { this.volume = 1; this.currentTime = 0; this.paused = true; }
+StubAudio.prototype = { play() { this.paused = false; return Promise.resolve(); }, pause() { this.paused = true; }, addEventListener: noop, removeEventListener: noop, load: noop };
+
+function makeSandbox(search) {
+    const elements = {};
+    const store = {};
+    const sandbox = {
+        console, performance, setTimeout, clearTimeout, setInterval, clearInterval, queueMicrotask,
+        URLSearchParams, TextEncoder, TextDecoder,
+        location: { search, href: 'http://localhost/' + search, origin: 'http://localhost' },
+        navigator: { userAgent: 'node-headless', hardwareConcurrency: 1 },
+        innerWidth: 400, innerHeight: 700, devicePixelRatio: 1,
+        addEventListener: noop, removeEventListener: noop,
+        requestAnimationFrame: () => 0, cancelAnimationFrame: noop,
+        localStorage: { getItem: (k) => (k in store ? store[k] : null), setItem: (k, v) => { store[k] = String(v); }, removeItem: (k) => { delete store[k]; } },
+        document: {
+            getElementById: (id) => elements[id] || (elements[id] = makeStubCanvas(400, 700)),
+            createElement: () => makeStubCanvas(), addEventListener: noop, removeEventListener: noop,
+            body: { appendChild: noop }, hidden: false, visibilityState: 'visible',
+        },
+        AudioContext: StubAudioContext, Audio: StubAudio,
+        OffscreenCanvas: function (w, h) { return makeStubCanvas(w, h); },
+    };
+    sandbox.window = sandbox; sandbox.self = sandbox; sandbox.globalThis = sandbox;
+    return sandbox;
+}
+
+// Fresh context per scenario so caches, pools and counters start cold.
+function loadGame() {
+    const search = '?seed=' + OPTS.seed + (OPTS.soa ? '&soa=1' : '');
+    const sandbox = vm.createContext(makeSandbox(search));
+    vm.runInContext(fs.readFileSync(GAME_JS, 'utf8'), sandbox, { filename: 'game.js' });
+    const run = (src) => vm.runInContext(src, sandbox);
+    return { sandbox, run };
+}
+
+// ============================================
+// SCENARIOS
+// ============================================
+// setup(run) puts the game into the scenario's starting state; frames is the
+// number of SIM_STEP ticks. The player is made unkillable so every scenario
+// runs its full length, and victory is ignored so runs can go past 9:00.
+const SCENARIOS = [];
+for (let c = 0; c < 6; c++) {
+    SCENARIOS.push({
+        name: 'run-char' + c,
+        desc: 'full run, character ' + c + ', autopilot picks the first level-up choice',
+        frames: () => Math.round(OPTS.minutes * 60 * 60),
+        setup: (run) => run(`selectedChar = ${c}; initGame(); player.hp = player.maxHp = 1e9;`),
+    });
+}
+SCENARIOS.push({
+    name: 'max-evolution',
+    desc: 'all five evolutions plus 귀살검 Lv5 and six Lv5 passives, from 10:00 for 3 minutes',
+    frames: () => 3 * 60 * 60,
+    setup: (run) => run(`
+        selectedChar = 0; initGame();
+        player.weapons = EVOLUTIONS.map(evo => ({ id: evo.weapon, level: 6, cd: 0, evolved: true }));
+        player.weapons.push({ id: 7, level: 5, cd: 0, evolved: false });
+        player.passives = [0, 1, 2, 3, 5, 7].map(id => ({ id, level: 5 }));
+        computePlayerStats();
+        player.hp = player.maxHp = 1e9;
+        gameTime = 600; nextBossTime = 720; bossWave = 3;`),
+});
+SCENARIOS.push({
+    name: 'boss-swarm',
+    desc: 'all three bosses plus a 200-enemy swarm kept topped up, from 9:00 for 1 minute',
+    frames: () => 60 * 60,
+    setup: (run) => run(`
+        selectedChar = 1; initGame();
+        player.weapons = [0, 1, 3, 5].map(id => ({ id, level: 5, cd: 0, evolved: false }));
+        player.passives = [0, 2, 5].map(id => ({ id, level: 3 }));
+        computePlayerStats();
+        player.hp = player.maxHp = 1e9;
+        gameTime = 540; nextBossTime = 1e9; bossWave = 3;
+        enemyCap = ENEMY_CAP_MAX;
+        spawnBoss(1, 3); spawnBoss(3, 3); spawnBoss(2, 3);`),
+    // Refill the swarm each tick; bosses are re-added if one dies.
+    perFrame: `
+        if (!enemies.some(e => e.type === 99)) spawnBoss(2, 3);
+        for (let i = enemies.length; i < 203; i++) {
+            const a = rand() * Math.PI * 2, d = 120 + rand() * 260;
+            spawnEnemy(i % ENEMY_DEFS.length, player.x + Math.cos(a) * d, player.y + Math.sin(a) * d);
+        }`,
+});
+
+// ============================================
+// MEASUREMENT
+// ============================================
+function percentile(sorted, p) {
+    if (!sorted.length) return 0;
+    return sorted[Math.min(sorted.length - 1, Math.floor(p / 100 * sorted.length))];
+}
+function summarize(values) {
+    const s = Float64Array.from(values).sort();
+    let sum = 0;
+    for (const v of s) sum += v;
+    const r3 = (v) => Math.round(v * 1000) / 1000;
+    return { mean: r3(sum / (s.length || 1)), p50: r3(percentile(s, 50)), p90: r3(percentile(s, 90)),
+        p95: r3(percentile(s, 95)), p99: r3(percentile(s, 99)), max: r3(s.length ? s[s.length - 1] : 0) };
+}
+
+const ENTITY_EXPR = 'enemies.length + "," + projectiles.length + "," + orbs.length + "," + particles.length + "," + dmgNums.length';
+const ENTITY_KEYS = ['enemies', 'projectiles', 'orbs', 'particles', 'dmgNums'];
+
+async function runScenario(sc) {
+    const { sandbox, run } = loadGame();
+    sc.setup(run);
+    const frames = sc.frames();
+    // Autopilot: circle the arena, drop a bomb whenever it is ready, take the
+    // first level-up choice. Steering goes through keys so getInput() is used.
+    const tickSrc = `(function (i) {
+        if (state === 'levelUp') selectChoice(0);
+        if (state !== 'playing') state = 'playing';
+        const a = gameTime * 0.35;
+        keys.ArrowLeft = Math.sin(a) > 0.38; keys.ArrowRight = Math.sin(a) < -0.38;
+        keys.ArrowUp = Math.cos(a) > 0.38; keys.ArrowDown = Math.cos(a) < -0.38;
+        keys[' '] = bombCooldown <= 0;
+        ${sc.perFrame || ''}
+    })`;
+    const tick = run(tickSrc);
+    const step = run('step');
+    const draw = OPTS.draw ? run('drawGame') : null;
+    const entities = run(`(() => ${ENTITY_EXPR})`);
+
+    const gcs = [];
+    const obs = new PerformanceObserver((list) => { for (const e of list.getEntries()) gcs.push(e.duration); });
+    obs.observe({ entryTypes: ['gc'] });
+    if (typeof global.gc === 'function') global.gc();
+
+    // Heap/timer probes allocate a little themselves; measure that on empty
+    // frames and subtract it from every sample.
+    let probeKb = Infinity;
+    for (let i = 0; i < 200; i++) {
+        const h0 = process.memoryUsage().heapUsed, f0 = process.hrtime.bigint();
+        const h1 = (Number(process.hrtime.bigint() - f0), process.memoryUsage().heapUsed);
+        if (h1 >= h0) probeKb = Math.min(probeKb, (h1 - h0) / 1024);
+    }
+    if (!isFinite(probeKb)) probeKb = 0;
+
+    const frameMs = new Float64Array(frames);
+    const allocKb = [];
+    const counts = ENTITY_KEYS.map(() => ({ sum: 0, max: 0 }));
+    let samples = 0, heapPeak = 0, gcFrames = 0;
+    const t0 = process.hrtime.bigint();
+    for (let i = 0; i < frames; i++) {
+        tick(i);
+        const heap0 = process.memoryUsage().heapUsed;
+        const f0 = process.hrtime.bigint();
+        step();
+        if (draw) draw(1);
+        frameMs[i] = Number(process.hrtime.bigint() - f0) / 1e6;
+        const heap1 = process.memoryUsage().heapUsed;
+        // A GC inside the frame makes the delta negative; those frames are skipped.
+        if (heap1 >= heap0) allocKb.push(Math.max(0, (heap1 - heap0) / 1024 - probeKb));
+        else gcFrames++;
+        if (heap1 > heapPeak) heapPeak = heap1;
+        if (i % 60 === 0) {
+            const c = entities().split(',');
+            for (let k = 0; k < c.length; k++) { const v = +c[k]; counts[k].sum += v; if (v > counts[k].max) counts[k].max = v; }
+            samples++;
+        }
+    }
+    const wallMs = Number(process.hrtime.bigint() - t0) / 1e6;
+    await new Promise((r) => setTimeout(r, 50)); // let the gc observer flush
+    obs.disconnect();
+
+    const final = entities().split(',');
+    const entityStats = {};
+    ENTITY_KEYS.forEach((k, i) => { entityStats[k] = { mean: Math.round(counts[i].sum / samples), max: counts[i].max, final: +final[i] }; });
+    const allocSum = allocKb.reduce((a, b) => a + b, 0);
+    return {
+        name: sc.name, desc: sc.desc, frames,
+        simSeconds: Math.round(frames / 60),
+        wallMs: Math.round(wallMs),
+        frameMs: summarize(frameMs),
+        alloc: {
+            kbPerFrame: summarize(allocKb),
+            totalMb: Math.round(allocSum / 1024 * 10) / 10,
+            heapPeakMb: Math.round(heapPeak / 1048576 * 10) / 10,
+            gcFrames,
+            gcCount: gcs.length,
+            gcMs: Math.round(gcs.reduce((a, b) => a + b, 0) * 10) / 10,
+        },
+        entities: entityStats,
+        end: JSON.parse(run(`JSON.stringify({ gameTime: Math.round(gameTime), kills, level: player.level, enemyCap,
+            weapons: player.weapons.map(w => w.id + ':' + w.level + (w.evolved ? '*' : '')) })`)),
+    };
+}
+
+async function main() {
+    const wanted = OPTS.scenarios ? String(OPTS.scenarios).split(',') : null;
+    const list = wanted ? SCENARIOS.filter((s) => wanted.includes(s.name)) : SCENARIOS;
+    if (!list.length) {
+        console.error('unknown scenario; available: ' + SCENARIOS.map((s) => s.name).join(', '));
+        process.exit(2);
+    }
+    const report = {
+        node: process.version, platform: process.platform + '-' + process.arch,
+        date: new Date().toISOString(),
+        options: { seed: OPTS.seed, soa: OPTS.soa, draw: OPTS.draw, minutes: OPTS.minutes, exposeGc: typeof global.gc === 'function' },
+        scenarios: [],
+    };
+    for (const sc of list) {
+        const r = await runScenario(sc);
+        report.scenarios.push(r);
+        console.error(`${r.name.padEnd(14)} ${String(r.frames).padStart(6)} frames  p50 ${r.frameMs.p50}ms  p99 ${r.frameMs.p99}ms  alloc ${r.alloc.totalMb}MB  gc ${r.alloc.gcCount}`);
+    }
+    const json = JSON.stringify(report, null, 2);
+    if (OPTS.out) fs.writeFileSync(OPTS.out, json + '\n');
+    else process.stdout.write(json + '\n');
+}
+
+main().catch((e) => { console.error(e); process.exit(1); });
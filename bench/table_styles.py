@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Style-template helpers vs per-property font writes on large text.
+
+Builds a 500-row table and a 500-line text box twice: once with the
+original helpers, which set font size, name, bold, colour and alignment on
+each paragraph, and once with make_ppt's cloned templates. It checks that
+the slide XML is identical and prints best-of-N timings as JSON.
+
+    python3 bench/table_styles.py
+    python3 bench/table_styles.py --rows 2000 --repeat 3 --out styles.json
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+
+import make_ppt
+from make_ppt import GOLD, LIGHT_GRAY, CYAN
+
+
+# ── The helpers as they were before the template layer ──
+def legacy_add_multiline(slide, left, top, width, height, lines, default_size=13, default_color=LIGHT_GRAY):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    for i, line_data in enumerate(lines):
+        text = line_data[0]
+        size = line_data[1] if len(line_data) > 1 else default_size
+        color = line_data[2] if len(line_data) > 2 else default_color
+        bold = line_data[3] if len(line_data) > 3 else False
+        align = line_data[4] if len(line_data) > 4 else PP_ALIGN.LEFT
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        p.text = text
+        p.font.size = Pt(size)
+        p.font.color.rgb = color
+        p.font.bold = bold
+        p.font.name = "맑은 고딕"
+        p.alignment = align
+        p.space_after = Pt(2)
+    return txBox
+
+
+def legacy_add_table(slide, left, top, width, height, rows, col_widths=None):
+    table_shape = slide.shapes.add_table(len(rows), len(rows[0]), left, top, width, height)
+    table = table_shape.table
+    for r_idx, row in enumerate(rows):
+        for c_idx, cell_text in enumerate(row):
+            cell = table.cell(r_idx, c_idx)
+            cell.text = str(cell_text)
+            for paragraph in cell.text_frame.paragraphs:
+                paragraph.font.size = Pt(10)
+                paragraph.font.name = "맑은 고딕"
+                if r_idx == 0:
+                    paragraph.font.bold = True
+                    paragraph.font.color.rgb = GOLD
+                else:
+                    paragraph.font.color.rgb = LIGHT_GRAY
+                paragraph.alignment = PP_ALIGN.CENTER
+            cell_fill = cell.fill
+            cell_fill.solid()
+            if r_idx == 0:
+                cell_fill.fore_color.rgb = RGBColor(50, 30, 20)
+            elif r_idx % 2 == 0:
+                cell_fill.fore_color.rgb = RGBColor(35, 25, 18)
+            else:
+                cell_fill.fore_color.rgb = RGBColor(45, 30, 22)
+    return table_shape
+
+
+# ── Workloads ──
+def table_rows(n, cols=8):
+    rows = [[f"열{c}" for c in range(cols)]]
+    rows += [[f"{r}-{c}" if c % 3 else f"이름 {r}\n부제 {r}" for c in range(cols)] for r in range(n)]
+    return rows
+
+
+def text_lines(n):
+    styles = [(14, GOLD, True), (12, LIGHT_GRAY, False), (12, CYAN, False)]
+    return [(f"  줄 {i}: 프롬프트 본문", *styles[i % 3]) for i in range(n)]
+
+
+def run(add, args):
+    """Best-of-repeat seconds for one helper call, plus the slide XML and saved size."""
+    best = float("inf")
+    for _ in range(args.repeat):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        t0 = time.perf_counter()
+        add(slide)
+        best = min(best, time.perf_counter() - t0)
+    buf = io.BytesIO()
+    prs.save(buf)
+    return best, slide.part.blob, buf.tell()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out")
+    args = parser.parse_args()
+
+    box = (Inches(0.3), Inches(1), Inches(12.7), Inches(6))
+    rows, lines = table_rows(args.rows), text_lines(args.rows)
+    cases = {
+        "table": (lambda s: legacy_add_table(s, *box, rows), lambda s: make_ppt.add_table(s, *box, rows)),
+        "multiline": (lambda s: legacy_add_multiline(s, *box, lines), lambda s: make_ppt.add_multiline(s, *box, lines)),
+    }
+    results = {"rows": args.rows, "repeat": args.repeat, "cases": {}}
+    for name, (legacy, templated) in cases.items():
+        t_old, xml_old, size_old = run(legacy, args)
+        t_new, xml_new, size_new = run(templated, args)
+        results["cases"][name] = {
+            "legacy_s": round(t_old, 4),
+            "template_s": round(t_new, 4),
+            "speedup": round(t_old / t_new, 2),
+            "identical_xml": xml_old == xml_new,
+            "slide_xml_bytes": len(xml_new),
+            "pptx_bytes": {"legacy": size_old, "template": size_new},
+        }
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if not all(c["identical_xml"] for c in results["cases"].values()):
+        sys.exit("template helpers changed the slide XML")
+
+
+if __name__ == "__main__":
+    main()
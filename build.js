@@ -0,0 +1,56 @@
+// ============================================
+// 퇴마록 - asset manifest build step
+// ============================================
+// Content-hashes the shipped assets into asset-manifest.json, stamps the
+// hashes into index.html's ?v= queries and stamps the combined version into
+// sw.js. A changed sw.js is what makes browsers install the new cache, so
+// run this before every deploy:
+//
+//   node build.js
+'use strict';
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = __dirname;
+// Fetched into the versioned cache on install; the game can't start without them.
+const PRECACHE = ['index.html', 'game.js', 'sim-worker.js', 'style.css'];
+// Cached on first play instead, as they stream (several MB each).
+const LAZY = ['bgm1.mp3', 'bgm2.mp3'];
+
+function hashOf(buf) { return crypto.createHash('sha256').update(buf).digest('hex').slice(0, 12); }
+function read(name) { return fs.readFileSync(path.join(ROOT, name)); }
+
+function writeIfChanged(name, text) {
+    const file = path.join(ROOT, name);
+    if (fs.existsSync(file) && fs.readFileSync(file, 'utf8') === text) return false;
+    fs.writeFileSync(file, text);
+    return true;
+}
+
+function main() {
+    const files = {};
+    for (const name of PRECACHE.concat(LAZY)) if (name !== 'index.html') files[name] = hashOf(read(name));
+
+    // index.html references the hashed URLs, so it is hashed after stamping
+    let html = read('index.html').toString('utf8');
+    html = html.replace(/(href|src)="([\w.-]+)(\?v=[^"]*)?"/g, (m, attr, name) => (files[name] ? `${attr}="${name}?v=${files[name]}"` : m));
+    const htmlChanged = writeIfChanged('index.html', html);
+    files['index.html'] = hashOf(html);
+
+    const names = Object.keys(files).sort();
+    const version = hashOf(names.map((n) => `${n}:${files[n]}`).join('\n'));
+    const manifest = { version, files: {}, precache: PRECACHE, lazy: LAZY };
+    for (const n of names) manifest.files[n] = files[n];
+    const manifestChanged = writeIfChanged('asset-manifest.json', JSON.stringify(manifest, null, 2) + '\n');
+
+    const sw = read('sw.js').toString('utf8');
+    if (!/const VERSION = '[^']*';/.test(sw)) throw new Error('sw.js: VERSION line not found');
+    const swChanged = writeIfChanged('sw.js', sw.replace(/const VERSION = '[^']*';/, `const VERSION = '${version}';`));
+
+    console.log(`version ${version}`);
+    for (const n of names) console.log(`  ${files[n]}  ${n}`);
+    if (!htmlChanged && !manifestChanged && !swChanged) console.log('(no changes)');
+}
+
+main();
@@ -0,0 +1,357 @@
+"""Deck text per locale for make_ppt.py.
+
+Korean is the source language. Each table maps a Korean string from
+make_ppt.py, or a name from game.js, to its translation. Strings with
+{fields} are format templates. A missing entry falls back to the Korean text.
+"""
+
+EN = {
+    # ── Names and descriptions from game.js ──
+    "퇴마사": "Exorcist",
+    "무녀": "Shrine Maiden",
+    "전우치": "Jeon Woo-chi",
+    "홍길동": "Hong Gil-dong",
+    "장군": "General",
+    "산신령": "Mountain Spirit",
+    "균형형": "Balanced",
+    "원거리": "Ranged",
+    "도술사": "Sorcerer",
+    "의적": "Outlaw",
+    "탱커": "Tank",
+    "소환": "Summoner",
+
+    "부적": "Talisman",
+    "신령 방울": "Spirit Bell",
+    "도깨비 방망이": "Dokkaebi Club",
+    "여우불": "Foxfire",
+    "천둥": "Thunder",
+    "신궁": "Divine Bow",
+    "용의 숨결": "Dragon Breath",
+    "귀살검": "Demon Blade",
+    "전방 투사체": "Forward projectile",
+    "유도 공격": "Homing attack",
+    "회전 공격": "Orbiting attack",
+    "불꽃 장판": "Fire field",
+    "낙뢰": "Lightning strike",
+    "관통 화살": "Piercing arrow",
+    "전방 화염": "Forward flames",
+    "근접 베기": "Melee slash",
+
+    "음양오행": "Five Elements",
+    "공격력 +15%": "Attack +15%",
+    "구미호 가죽": "Fox Pelt",
+    "이동속도 +10%": "Move speed +10%",
+    "풍백 가호": "Wind Lord's Grace",
+    "공격범위 +12%": "Attack range +12%",
+    "황금": "Gold",
+    "경험치 +15%": "EXP +15%",
+    "산삼": "Wild Ginseng",
+    "체력 회복": "HP regen",
+    "여의주": "Dragon Pearl",
+    "쿨타임 -8%": "Cooldown -8%",
+    "도깨비감투": "Dokkaebi Hat",
+    "회피 10%": "Dodge 10%",
+    "삼족오 부적": "Crow Charm",
+    "크리티컬 +8%": "Crit +8%",
+
+    "봉인진": "Sealing Circle",
+    "처치 시 범위 폭발": "Area burst on kill",
+    "삼매화": "Samadhi Fire",
+    "9개 궤도 화염": "9 orbiting flames",
+    "뇌신": "Thunder God",
+    "5체인 번개+마비": "5-chain lightning + stun",
+    "여의봉": "Ruyi Staff",
+    "3배 크기+골드": "3x size + gold",
+    "청룡": "Azure Dragon",
+    "화면 관통 용": "Screen-piercing dragon",
+
+    "잡귀": "Wraith",
+    "도깨불": "Wisp",
+    "물귀신": "Water Ghost",
+    "야차": "Yaksha",
+    "강시": "Jiangshi",
+    "원귀": "Vengeful Ghost",
+    "삼두구": "Three-Headed Dog",
+    "이무기": "Imugi",
+    "귀왕": "Ghost King",
+    "도깨비왕": "Dokkaebi King",
+    "구미호왕": "Nine-Tailed Fox King",
+
+    "기본": "default",
+    "{n}클리어": "{n} clears",
+    "생존{n}초": "survive {n}s",
+    "{label}해금": "{label} unlock",
+    "{t}초": "{t}s",
+
+    # ── Prose dicts ──
+    "하얀 도복, 검은 갓모자, 파란 허리띠, 손에 빨간 부적": "white robe, black gat hat, blue sash, red talisman in hand",
+    "하얀 도복+검은 갓+부적": "white robe+black gat+talisman",
+    "빨간 치마 흰 저고리, 긴 검은 머리+분홍 꽃장식, 손에 금색 방울": "red skirt and white jeogori, long black hair with pink flowers, gold bell in hand",
+    "빨간치마+꽃장식+방울": "red skirt+flowers+bell",
+    "보라 도포, 검은 갓+보라 끈, 손에 도술 부채, 도술 오라": "purple dopo, black gat with purple cord, magic fan in hand, magic aura",
+    "보라도포+갓+도술부채": "purple dopo+gat+magic fan",
+    "녹색 의적 의복, 녹색 두건+리본, 손에 칼, 바람 이펙트": "green outlaw clothes, green hood with ribbon, sword in hand, wind effect",
+    "녹색의복+두건+칼": "green clothes+hood+sword",
+    "갈색 갑옷+금장식, 빨간 투구, 창": "brown armour with gold trim, red helmet, spear",
+    "갈색갑옷+빨간투구+창": "brown armour+red helmet+spear",
+    "흰 도복, 긴 흰 수염, 녹색 오라, 옆에 주황 호랑이": "white robe, long white beard, green aura, orange tiger at side",
+    "흰도복+흰수염+녹색오라+호랑이": "white robe+white beard+green aura+tiger",
+
+    "레벨=개수,evolved:7발+처치시범위폭발": "count=level,evolved:7 shots+area burst on kill",
+    "min(lv,3)발": "min(lv,3) shots",
+    "궤도회전,min(1+lv/2,3)개,evolved:4개+넉백": "orbits,min(1+lv/2,3) clubs,evolved:4+knockback",
+    "evolved:9궤도화염": "evolved:9 orbiting flames",
+    "즉발min(lv,3)대상,evolved:5체인+슬로우1.5초 게임타임기반": "instant,min(lv,3) targets,evolved:5 chain+1.5s slow on game time",
+    "min(lv,3)발,lv5:무한관통": "min(lv,3) shots,lv5:infinite pierce",
+    "부채꼴,lv3+화상,evolved:관통드래곤": "cone,lv3+burn,evolved:piercing dragon",
+    "전방베기,lv5:후방도공격": "forward slash,lv5:also hits behind",
+
+    "3초/lv, 3+lv*2 회복": "3s/lv, heals 3+lv*2",
+    "3초/lv간격, 3+lv*2회복, 초록숫자+파티클": "every 3s/lv, heals 3+lv*2, green number+particles",
+    "\"회피!\"텍스트+파란파티클": "\"DODGE!\" text+blue particles",
+    "\"크리!\"텍스트": "\"CRIT!\" text",
+    "sniper(투사체)": "sniper(projectile)",
+    "formation(3동시)": "formation(3 at once)",
+
+    "보라 유령, 빨간 눈": "purple ghost, red eyes",
+    "파란 도깨비불": "blue will-o'-wisp",
+    "녹색 물괴물, 해초머리": "green water monster, seaweed hair",
+    "빨간 악귀, 금색 뿔": "red demon, gold horns",
+    "청록 관복, 노란 부적": "teal official robe, yellow talisman",
+    "반투명 흰 유령": "translucent white ghost",
+    "3머리 개": "three-headed dog",
+    "녹색 뱀용, 뿔": "green serpent dragon, horns",
+
+    "추적→돌진→범위폭발+잡귀3소환": "chase→charge→area blast+summons 3 Wraiths",
+    "2~3배 크기, 5개 금색 뿔 왕관, 빛나는 주황 눈, 큰 도끼": "2-3x size, crown of 5 gold horns, glowing orange eyes, big axe",
+    "접근→방망이 충격파+돌 4방향→돌진": "approach→club shockwave+rocks in 4 directions→charge",
+    "거대한 파란 도깨비, 금색 뿔 3개, 빛나는 빨간 눈, 거대한 방망이": "giant blue dokkaebi, 3 gold horns, glowing red eyes, huge club",
+    "궤도+유도탄→여우불5장판": "orbit+homing shots→5 foxfire fields",
+    "거대 9미호, 9개 불꽃 꼬리, 금색 한복, 여우귀": "giant nine-tailed fox, 9 flame tails, gold hanbok, fox ears",
+
+    # ── Slide 1 ──
+    "퇴  마  록": "T O E M A R O K",
+    "한국 신화 뱀서라이크 — 재현용 프롬프트 가이드": "A Korean-mythology Vampire Survivors-like — recreation prompt guide",
+
+    # ── Slide 2 ──
+    "📋 기술 스펙 & 핵심 구조": "📋 Tech Spec & Core Structure",
+    "▎ 캔버스 & 렌더링": "▎ Canvas & Rendering",
+    "  • 해상도: 400×700 (세로형 모바일)": "  • Resolution: 400×700 (portrait mobile)",
+    "  • CSS flex 중앙정렬, image-rendering: pixelated": "  • Centred with CSS flex, image-rendering: pixelated",
+    "  • 모든 그래픽 Canvas API 직접 렌더링 (외부 이미지 없음)": "  • Every graphic drawn with the Canvas API (no external images)",
+    "▎ 게임 상태 머신": "▎ Game State Machine",
+    "▎ 오디오": "▎ Audio",
+    "  • Web Audio API 프로시저럴 사운드": "  • Procedural sound with the Web Audio API",
+    "  • 종류: hit, kill, levelup, bomb, pickup, boss": "  • Sounds: hit, kill, levelup, bomb, pickup, boss",
+    "▎ 저장 시스템": "▎ Save System",
+    "▎ 모바일 입력 (중요!)": "▎ Mobile Input (important!)",
+    "  • touch-area div (z-index:10) 위에서 터치 이벤트 처리": "  • Touch events handled on a touch-area div (z-index:10)",
+    "  • screenToCanvas(): canvas.getBoundingClientRect() 사용": "  • screenToCanvas(): uses canvas.getBoundingClientRect()",
+    "  • touchstart에서 e.preventDefault() → click 차단됨": "  • e.preventDefault() in touchstart → click is blocked",
+    "  • handleTap() 함수로 touch/click 양쪽에서 통합 호출": "  • One handleTap() called from both touch and click",
+    "▎ 핵심 버그 방지 패턴": "▎ Key Bug-Prevention Patterns",
+    "  • 적 고유 uid (enemyIdCounter++) — 배열 index 사용 금지": "  • Unique enemy uid (enemyIdCounter++) — never array indices",
+    "  • 존/궤도 무기의 _tick 추적은 uid 기반": "  • Zone/orbit weapons track _tick by uid",
+    "  • 천둥 슬로우: setTimeout ❌ → 게임타임 타이머 ✅": "  • Thunder slow: setTimeout ❌ → game-time timer ✅",
+    "  • 호밍 투사체: 타겟 사망시 자동 리타겟": "  • Homing projectiles retarget when the target dies",
+    "  • 적 존 대미지: dmg*dt ❌ → 0.5초 틱 ✅": "  • Enemy zone damage: dmg*dt ❌ → 0.5s ticks ✅",
+    "▎ 파일 구조": "▎ Files",
+    "  index.html  /  style.css  /  game.js (~{lines}줄)": "  index.html  /  style.css  /  game.js (~{lines} lines)",
+
+    # ── Slide 3 ──
+    "🎭 캐릭터 {n}종": "🎭 {n} Characters",
+    "이름": "Name",
+    "설명": "Description",
+    "시작무기": "Starting weapon",
+    "해금조건": "Unlock",
+    "스프라이트 디자인 (16-20px 픽셀아트)": "Sprite Design (16-20px pixel art)",
+
+    # ── Slide 4 ──
+    "⚔️ 무기 {n}종": "⚔️ {n} Weapons",
+    "타입": "Type",
+    "쿨타임": "Cooldown",
+    "진화": "Evolution",
+    "투사체 렌더링 스타일": "Projectile Rendering",
+    "부적       회전하는 빨간 카드 + 금색 부적문양 + 잔상 트레일": "Talisman      spinning red card + gold talisman glyph + afterimage trail",
+    "방울       금색 구슬 + 음파 링 이펙트 (확장되는 원)": "Bell          gold orb + sound-wave ring (expanding circle)",
+    "방망이    궤도 회전 곤봉 (나무 손잡이 + 쇠머리 + 스파이크) + 궤도링 표시": "Club          orbiting club (wooden grip + iron head + spikes) + orbit ring",
+    "여우불    다층 불꽃 (#FF4400→#FF8844→#FFCC44→#FFF) + 불씨 파티클": "Foxfire       layered flame (#FF4400→#FF8844→#FFCC44→#FFF) + ember particles",
+    "천둥       지그재그 번개 볼트 (fillPath) + 글로우 (반투명 원)": "Thunder       zigzag lightning bolt (fillPath) + glow (translucent circle)",
+    "화살       화살촉 삼각형 + 속도선 잔상 (반투명 가로줄)": "Arrow         triangle head + speed-line trail (translucent strokes)",
+    "용숨결    evolved: 큰 파란 드래곤 투사체 (3원 몸통 + 노란 눈)": "Dragon        evolved: large blue dragon projectile (3-circle body + yellow eyes)",
+    "귀살검    반달형 슬래시 아크 (ctx.arc stroke) + 흰색 하이라이트": "Blade         crescent slash arc (ctx.arc stroke) + white highlight",
+
+    # ── Slide 5 ──
+    "💎 패시브 {n}종 & 진화 {evos}종": "💎 {n} Passives & {evos} Evolutions",
+    "스탯": "Stat",
+    "레벨당": "Per level",
+    "진화 조합": "Evolves",
+    "▎ 패시브 시각 효과 (중요!)": "▎ Passive Visual Effects (important!)",
+    "  산삼 회복     초록색 \"+N\" 숫자 (#44FF44) + 초록 파티클": "  Ginseng heal    green \"+N\" number (#44FF44) + green particles",
+    "  회피 발동     \"회피!\" 하늘색 텍스트 (#88FFFF) + 파란 파티클": "  Dodge           \"DODGE!\" sky-blue text (#88FFFF) + blue particles",
+    "  크리티컬      \"크리!\" 노란 라벨 (#FFDD00) + 큰 대미지 숫자": "  Critical        \"CRIT!\" yellow label (#FFDD00) + large damage number",
+    "▎ 크리티컬 시스템": "▎ Critical Hits",
+    "  • rollCrit() 함수로 투사체별 개별 판정": "  • rollCrit() rolls separately for each projectile",
+    "  • 크리시 대미지 ×2": "  • Crits deal ×2 damage",
+    "▎ 진화 조건: 무기 Lv5 + 해당 패시브 보유": "▎ Evolution: weapon at Lv5 + its passive owned",
+
+    # ── Slide 6 ──
+    "👹 적 {n}종 + 보스 {bosses}종": "👹 {n} Enemies + {bosses} Bosses",
+    "패턴": "Pattern",
+    "등장": "Appears",
+    "스프라이트": "Sprite",
+    "▎ 보스 스프라이트": "▎ Boss Sprites",
+    "▎ 적 공통 시스템": "▎ Shared Enemy Systems",
+    "  • 피격 시 흰색 플래시 (hitFlash 0.15초)": "  • White flash when hit (hitFlash 0.15s)",
+    "  • 대미지 입은 적만 HP바 표시 (16×2px)": "  • HP bar only on damaged enemies (16×2px)",
+    "  • 사망 시 파티클 폭발 + EXP 오브 드롭": "  • Particle burst + EXP orb drop on death",
+    "  • 구미호왕 처치 → victory 상태 (승리화면)": "  • Killing the Nine-Tailed Fox King → victory state (win screen)",
+
+    # ── Slide 7 ──
+    "⚖️ 밸런스 & 스폰 시스템": "⚖️ Balance & Spawning",
+    "▎ 스폰 레이트": "▎ Spawn Rate",
+    "  → 시작: ~{rate:.1f}마리/초": "  → Start: ~{rate:.1f}/s",
+    "  → 5분: ~{rate:.1f}마리/초": "  → 5 min: ~{rate:.1f}/s",
+    "  → 10분: ~{rate:.1f}마리/초": "  → 10 min: ~{rate:.1f}/s",
+    "▎ 웨이브 버스트 ({t}초마다)": "▎ Wave Burst (every {t}s)",
+    "  → 잡귀를 원형 배치로 한꺼번에 소환": "  → Summons a ring of Wraiths at once",
+    "▎ HP 스케일링": "▎ HP Scaling",
+    "  → 10분에 적 HP +{pct:.0f}%": "  → Enemy HP +{pct:.0f}% at 10 min",
+    "  → 보스: {t}초마다, 웨이브당 HP +{pct:.0f}%": "  → Bosses: every {t}s, HP +{pct:.0f}% per wave",
+    "▎ 맵": "▎ Map",
+    "  • 반경 {r} 원형 맵": "  • Circular map, radius {r}",
+    "  • 40×40 타일, 해시 기반 색상 변화 + 풀/돌 장식": "  • 40×40 tiles, hash-based colour variation + grass/stone decor",
+    "  • 경계 접근시 빨간 원 표시": "  • Red circle shown near the edge",
+    "▎ 적 제한": "▎ Enemy Cap",
+    "  • 기본 {cap}마리, 프레임 비용에 따라 {lo}~{hi} 자동 조절": "  • {cap} by default, tuned between {lo} and {hi} by frame cost",
+    "  • 초과시 가장 먼 적 제거 (quickselect)": "  • Farthest enemies removed when over (quickselect)",
+    "▎ 경험치": "▎ Experience",
+    "  • 적 사망 → EXP 오브 드롭": "  • Enemy death → EXP orb drop",
+    "  • 자석 범위 = range × rangeMul": "  • Magnet radius = range × rangeMul",
+    "▎ 폭탄": "▎ Bomb",
+    "  • 쿨다운 {cd}초, 전체 적 {dmg}대미지 (보스 {boss})": "  • {cd}s cooldown, {dmg} damage to all enemies (bosses {boss})",
+    "  • 금색 화면 플래시 + 파티클 30개": "  • Gold screen flash + 30 particles",
+
+    # ── Slide 8 ──
+    "🎮 UI & 모바일 컨트롤": "🎮 UI & Mobile Controls",
+    "▎ HUD 레이아웃": "▎ HUD Layout",
+    "  좌상단: 타이머 (MM:SS, 금색, 14px)": "  Top left: timer (MM:SS, gold, 14px)",
+    "  우상단: 킬 수 (💀 N, 빨간색)": "  Top right: kills (💀 N, red)",
+    "  중앙 상단: 현재 적 수 (N 요괴, 회색)": "  Top centre: enemies alive (N monsters, grey)",
+    "  하단 좌: HP바 (100px, 초록/빨강) + Lv 표시": "  Bottom left: HP bar (100px, green/red) + Lv",
+    "  하단: EXP바 (전체 너비, 민트색)": "  Bottom: EXP bar (full width, mint)",
+    "  좌하단: 무기 아이콘 (22×22 사각형, 이름+레벨)": "  Bottom left: weapon icons (22×22 squares, name+level)",
+    "  우하단: 폭탄 버튼 (원형, 반경 28px)": "  Bottom right: bomb button (circle, radius 28px)",
+    "▎ 화면 플래시 이펙트": "▎ Screen Flashes",
+    "  피격: 빨간색 (0.15초)": "  Hit: red (0.15s)",
+    "  폭탄: 금색 (0.5초)": "  Bomb: gold (0.5s)",
+    "  보스 처치: 금색 (0.3초)": "  Boss kill: gold (0.3s)",
+    "  승리: 금색 (1.0초)": "  Victory: gold (1.0s)",
+    "▎ 모바일 컨트롤": "▎ Mobile Controls",
+    "  이동: 터치 드래그 (조이스틱식, 5px 데드존)": "  Move: touch drag (joystick style, 5px dead zone)",
+    "  폭탄: 우하단 원형 버튼 터치": "  Bomb: tap the round button, bottom right",
+    "  메뉴: handleTap()으로 터치/클릭 통합": "  Menus: handleTap() for both touch and click",
+    "▎ 키보드 컨트롤": "▎ Keyboard Controls",
+    "  이동: 방향키 / WASD": "  Move: arrow keys / WASD",
+    "  폭탄: 스페이스바": "  Bomb: space bar",
+    "  레벨업: 1, 2, 3 키": "  Level up: keys 1, 2, 3",
+    "  시작: Enter / Space": "  Start: Enter / Space",
+    "▎ 폭탄 버튼 렌더링": "▎ Bomb Button",
+    "  대기: 금색 글로우 + '부' 글자 + '폭탄' 라벨": "  Ready: gold glow + '부' glyph + 'BOMB' label",
+    "  쿨다운: 회색 원 + 쿨다운 아크 + 잔여시간 숫자": "  Cooldown: grey circle + cooldown arc + seconds left",
+    "▎ 레벨업 UI": "▎ Level-Up UI",
+    "  반투명 검정 오버레이 + 3장 카드 (110×160px)": "  Translucent black overlay + 3 cards (110×160px)",
+    "  진화 카드: 보라색 배경, 금색 텍스트": "  Evolution card: purple background, gold text",
+
+    # ── Slides 9 and 10 ──
+    "📝 재현용 프롬프트 (1/2)": "📝 Recreation Prompt (1/2)",
+    "📝 재현용 프롬프트 (2/2)": "📝 Recreation Prompt (2/2)",
+    """한국 신화 뱀서라이크(Vampire Survivors류) 게임 "퇴마록"을 HTML5 Canvas 단일 파일(game.js)로 만들어줘.
+외부 이미지/라이브러리 없이 Canvas API로 모든 픽셀아트를 직접 그려야 해.
+GitHub Pages로 배포할 거야. repo: studiovarem-ui/toemarok
+
+## 기술 스펙
+- 캔버스: 400×700, CSS flex 중앙정렬, image-rendering: pixelated
+- 모바일 최적화: touch-area div(z-index:10), canvas.getBoundingClientRect()로 좌표 변환
+- touchstart에서 e.preventDefault() 사용하므로 click 이벤트 차단됨 → handleTap() 함수를 만들어서 touchstart와 click 양쪽에서 호출
+- 상태: title → charSelect → playing ↔ levelUp → gameOver / victory
+- Web Audio API로 효과음 (hit, kill, levelup, bomb, pickup, boss)
+- localStorage 저장 (unlocks, bestTime, bestKills, totalClears)
+
+## 캐릭터 {n}종 (각각 고유 픽셀아트 스프라이트 함수)
+{char_specs}
+
+각 캐릭터는 16-20px 상세 픽셀아트: {char_looks}""":
+    """Build "Toemarok", a Korean-mythology Vampire Survivors-like, as a single HTML5 Canvas file (game.js).
+Draw all pixel art with the Canvas API: no external images or libraries.
+It will be deployed on GitHub Pages. repo: studiovarem-ui/toemarok
+
+## Tech spec
+- Canvas: 400×700, centred with CSS flex, image-rendering: pixelated
+- Mobile: touch-area div (z-index:10), convert coordinates with canvas.getBoundingClientRect()
+- touchstart calls e.preventDefault(), which blocks click → write one handleTap() and call it from both touchstart and click
+- States: title → charSelect → playing ↔ levelUp → gameOver / victory
+- Sound effects with the Web Audio API (hit, kill, levelup, bomb, pickup, boss)
+- Save to localStorage (unlocks, bestTime, bestKills, totalClears)
+
+## {n} characters (each with its own pixel-art sprite function)
+{char_specs}
+
+Each character is detailed 16-20px pixel art: {char_looks}""",
+    """## 무기 {weapons}종
+{weapon_specs}
+
+투사체별 개별 크리티컬 판정(rollCrit()), 크리시 "크리!" + 대미지×2
+
+## 패시브 {passives}종: {passive_specs}
+
+## 진화: {evo_specs}
+
+## 적 {enemies}종: {enemy_specs}
+
+## 보스 ({boss_interval}초마다 순환, 웨이브당 HP+{boss_hp:.0f}%, 구미호왕 처치시 victory화면):
+{boss_specs}
+
+## 밸런스: 스폰={spawn}
+웨이브{burst_interval}초마다={burst}, HP스케일={hp_scale}
+맵반경{map_radius}, 적max{cap}(먼적제거), 폭탄cd{bomb_cd}초(전체{bomb_dmg}대미지,보스{bomb_boss})
+
+## 버그방지: 적uid사용(_tick추적), 천둥슬로우=게임타임타이머(setTimeout금지),
+호밍리타겟, 적존대미지=0.5초틱(dmg*dt금지)
+
+game.js가 길면 여러 파트로 나눠서 cat >>으로 이어붙여.
+완성 후 GitHub Pages 배포.""":
+    """## {weapons} weapons
+{weapon_specs}
+
+Roll crits per projectile (rollCrit()); a crit shows "CRIT!" and deals damage×2
+
+## {passives} passives: {passive_specs}
+
+## Evolutions: {evo_specs}
+
+## {enemies} enemies: {enemy_specs}
+
+## Bosses (cycle every {boss_interval}s, HP+{boss_hp:.0f}% per wave, killing the Nine-Tailed Fox King shows the victory screen):
+{boss_specs}
+
+## Balance: spawn={spawn}
+every {burst_interval}s burst={burst}, HP scale={hp_scale}
+map radius {map_radius}, enemy max {cap} (drop the farthest), bomb cd {bomb_cd}s ({bomb_dmg} damage to all, bosses {bomb_boss})
+
+## Bug prevention: enemy uids (_tick tracking), thunder slow on a game-time timer (no setTimeout),
+homing retargets, enemy zone damage in 0.5s ticks (no dmg*dt)
+
+If game.js gets long, write it in parts and append them with cat >>.
+Deploy to GitHub Pages when done.""",
+
+    # ── Slide 11 ──
+    "퇴마록 재현 가이드": "Toemarok Recreation Guide",
+    "이 프롬프트로 동일한 게임을 처음부터 재현할 수 있습니다": "These prompts rebuild the same game from scratch",
+    "📁  3 파일: index.html + style.css + game.js (~{lines}줄)": "📁  3 files: index.html + style.css + game.js (~{lines} lines)",
+    "🎭  {chars} 캐릭터  •  ⚔️ {weapons} 무기  •  💎 {passives} 패시브  •  🔄 {evos} 진화":
+        "🎭  {chars} characters  •  ⚔️ {weapons} weapons  •  💎 {passives} passives  •  🔄 {evos} evolutions",
+    "👹  {enemies} 적 타입  •  💀 {bosses} 보스  •  🏆 승리 화면": "👹  {enemies} enemy types  •  💀 {bosses} bosses  •  🏆 victory screen",
+}
+
+STRINGS = {"en": EN}
@@ -2,7 +2,9 @@
 // 퇴마록 - 한국 신화 뱀서라이크
 // ============================================
 const canvas = document.getElementById('gameCanvas');
-const ctx = canvas.getContext('2d');
+let ctx = canvas.getContext('2d'); // swapped while the sprite cache renders cells
+const hudCanvas = document.getElementById('hudCanvas'); // retained HUD layer, see HUD LAYER
+const hudCtx = hudCanvas.getContext('2d');
 const W = 400, H = 700;
 let scale = 1, offX = 0, offY = 0;
 let t = 0;
@@ -18,7 +20,16 @@ function resize() {
     canvas.style.marginLeft = `${offX}px`;
     canvas.style.marginTop = `${offY}px`;
     ctx.imageSmoothingEnabled = false;
+    // The HUD canvas keeps its pixels (width is never reassigned) and just
+    // tracks the game canvas's on-screen box.
+    const r = canvas.getBoundingClientRect();
+    hudCanvas.style.width = canvas.style.width;
+    hudCanvas.style.height = canvas.style.height;
+    hudCanvas.style.left = `${r.left}px`;
+    hudCanvas.style.top = `${r.top}px`;
 }
+hudCanvas.width = W; hudCanvas.height = H;
+hudCtx.imageSmoothingEnabled = false;
 window.addEventListener('resize', resize);
 resize();
 
@@ -30,79 +41,200 @@ function txt(text,x,y,c,s,a) { ctx.fillStyle=c||'#fff'; ctx.font=`bold ${s||10}p
 // ============================================
 // AUDIO SYSTEM
 // ============================================
+// Each SFX is rendered once into an AudioBuffer when audio starts. Playing
+// one costs a single AudioBufferSourceNode on the sound's bus. Per-type voice
+// caps and a coalescing window keep the cost flat when a bomb or magnet
+// sweep triggers dozens of kills/pickups in one frame.
 const AudioCtx = window.AudioContext || window.webkitAudioContext;
 let audioCtx = null;
-function ensureAudio() { if (!audioCtx) audioCtx = new AudioCtx(); startBGM(); }
+// wave, start/end frequency, frequency ramp time, peak gain, decay time,
+// max simultaneous voices, min seconds between starts of the same sound
+const SFX_DEFS = {
+    hit:     { wave:'square',   f0:200, f1:200,  fDur:0.1,  gain:0.10, dur:0.1,  voices:2, gap:0.05 },
+    kill:    { wave:'sine',     f0:600, f1:100,  fDur:0.15, gain:0.08, dur:0.15, voices:4, gap:0.03 },
+    levelup: { wave:'sine',     f0:400, f1:800,  fDur:0.2,  gain:0.12, dur:0.3,  voices:1, gap:0.1 },
+    bomb:    { wave:'sawtooth', f0:100, f1:30,   fDur:0.5,  gain:0.15, dur:0.5,  voices:1, gap:0.2 },
+    pickup:  { wave:'sine',     f0:800, f1:1200, fDur:0.05, gain:0.05, dur:0.08, voices:3, gap:0.04 },
+    boss:    { wave:'sawtooth', f0:60,  f1:60,   fDur:0.8,  gain:0.15, dur:0.8,  voices:1, gap:0.5 },
+};
+const sfxBuffers = {}, sfxBus = {}, sfxVoices = {}, sfxLast = {};
+let masterBus = null;
+
+function ensureAudio() {
+    if (!audioCtx) {
+        audioCtx = new AudioCtx();
+        const comp = audioCtx.createDynamicsCompressor();
+        comp.connect(audioCtx.destination);
+        masterBus = audioCtx.createGain();
+        masterBus.gain.value = 1;
+        masterBus.connect(comp);
+        for (const type in SFX_DEFS) {
+            sfxBuffers[type] = renderSfx(SFX_DEFS[type]);
+            sfxBus[type] = audioCtx.createGain();
+            sfxBus[type].connect(masterBus);
+            sfxVoices[type] = [];
+            sfxLast[type] = -1;
+        }
+    }
+    startBGM();
+}
+
+// Same envelope the old per-call oscillators produced: exponential pitch
+// sweep f0 -> f1 over fDur, gain decaying exponentially to 0.001 over dur.
+function renderSfx(def) {
+    const rate = audioCtx.sampleRate, n = Math.ceil(def.dur * rate);
+    const buf = audioCtx.createBuffer(1, n, rate);
+    const data = buf.getChannelData(0);
+    const fRatio = def.f1 / def.f0, gRatio = 0.001 / def.gain;
+    let phase = 0;
+    for (let i = 0; i < n; i++) {
+        const s = i / rate;
+        const f = def.f0 * Math.pow(fRatio, Math.min(1, s / def.fDur));
+        phase += f / rate; phase -= Math.floor(phase);
+        let v;
+        if (def.wave === 'square') v = phase < 0.5 ? 1 : -1;
+        else if (def.wave === 'sawtooth') v = 2 * phase - 1;
+        else v = Math.sin(phase * Math.PI * 2);
+        data[i] = v * def.gain * Math.pow(gRatio, s / def.dur);
+    }
+    return buf;
+}
+
 function playSound(type) {
     ensureAudio(); if (!audioCtx) return;
+    const def = SFX_DEFS[type];
+    if (!def) return;
     const now = audioCtx.currentTime;
-    const g = audioCtx.createGain();
-    g.connect(audioCtx.destination);
-    const o = audioCtx.createOscillator();
-    o.connect(g);
-    switch(type) {
-        case 'hit':
-            o.type='square'; o.frequency.value=200;
-            g.gain.setValueAtTime(0.1,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.1);
-            o.start(now); o.stop(now+0.1); break;
-        case 'kill':
-            o.type='sine'; o.frequency.value=600;
-            o.frequency.exponentialRampToValueAtTime(100,now+0.15);
-            g.gain.setValueAtTime(0.08,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.15);
-            o.start(now); o.stop(now+0.15); break;
-        case 'levelup':
-            o.type='sine'; o.frequency.value=400;
-            o.frequency.exponentialRampToValueAtTime(800,now+0.2);
-            g.gain.setValueAtTime(0.12,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.3);
-            o.start(now); o.stop(now+0.3); break;
-        case 'bomb':
-            o.type='sawtooth'; o.frequency.value=100;
-            o.frequency.exponentialRampToValueAtTime(30,now+0.5);
-            g.gain.setValueAtTime(0.15,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.5);
-            o.start(now); o.stop(now+0.5); break;
-        case 'pickup':
-            o.type='sine'; o.frequency.value=800;
-            o.frequency.exponentialRampToValueAtTime(1200,now+0.05);
-            g.gain.setValueAtTime(0.05,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.08);
-            o.start(now); o.stop(now+0.08); break;
-        case 'boss':
-            o.type='sawtooth'; o.frequency.value=60;
-            g.gain.setValueAtTime(0.15,now); g.gain.exponentialRampToValueAtTime(0.001,now+0.8);
-            o.start(now); o.stop(now+0.8); break;
-    }
+    if (now - sfxLast[type] < def.gap) return;
+    const voices = sfxVoices[type];
+    // voices holds end times; drop finished ones before checking the cap
+    let live = 0;
+    for (let i = 0; i < voices.length; i++) if (voices[i] > now) voices[live++] = voices[i];
+    voices.length = live;
+    if (live >= def.voices) return;
+    const src = audioCtx.createBufferSource();
+    src.buffer = sfxBuffers[type];
+    src.connect(sfxBus[type]);
+    src.start(now);
+    voices.push(now + def.dur);
+    sfxLast[type] = now;
 }
 
-
 // ============================================
 // BGM SYSTEM
 // ============================================
+// Two <audio> decks stream the tracks through MediaElementSource nodes into
+// the SFX graph (deck gain -> bgmBus -> masterBus). While one deck plays, the
+// other preloads the next track and is faded in BGM_XFADE seconds before the
+// end, so track changes are seamless instead of stalling on a fresh fetch and
+// decode. Nothing is fetched until the first input, and then only once the
+// browser is idle.
 const bgmTracks = ['bgm1.mp3', 'bgm2.mp3'];
-let bgmAudio = null;
+const BGM_VOLUME = 0.4;
+const BGM_XFADE = 2.5;    // seconds of overlap between tracks
+const BGM_PRELOAD = 30;   // start loading the next track this long before the end
+// file: pages are opaque origins; a MediaElementSource outputs silence there,
+// so the decks fall back to stepping element.volume
+const BGM_ROUTED = location.protocol !== 'file:';
+let bgmBus = null;
+let bgmDecks = [];        // [playing, next]
 let bgmIndex = 0;
 let bgmStarted = false;
+let bgmFadeTimer = 0;
 
 function startBGM() {
-    if (bgmStarted) return;
+    if (bgmStarted || !audioCtx) return;
     bgmStarted = true;
-    playBGM();
+    const idle = window.requestIdleCallback || (cb => setTimeout(cb, 200));
+    idle(playBGM, { timeout: 1000 });
 }
 
 function playBGM() {
-    if (bgmAudio) { bgmAudio.pause(); bgmAudio = null; }
-    bgmAudio = new Audio(bgmTracks[bgmIndex]);
-    bgmAudio.volume = 0.4;
-    bgmAudio.play().catch(() => {});
-    bgmAudio.addEventListener('ended', () => {
-        bgmIndex = (bgmIndex + 1) % bgmTracks.length;
-        playBGM();
-    });
+    if (!bgmStarted) return;
+    if (!bgmBus) {
+        bgmBus = audioCtx.createGain();
+        bgmBus.gain.value = BGM_VOLUME;
+        bgmBus.connect(masterBus);
+        bgmDecks = [makeBgmDeck(), makeBgmDeck()];
+    }
+    const deck = bgmDecks[0];
+    if (deck.idx !== bgmIndex) bgmLoad(deck, bgmIndex);
+    bgmSetLevel(deck, 1, 0.5);
+    deck.el.play().catch(() => {});
 }
 
 function stopBGM() {
-    if (bgmAudio) { bgmAudio.pause(); bgmAudio = null; }
+    for (const d of bgmDecks) { d.el.pause(); bgmSetLevel(d, 0, 0); }
     bgmStarted = false;
 }
 
+function makeBgmDeck() {
+    const el = new Audio();
+    el.preload = 'none';
+    const deck = { el, idx: -1, gain: null, target: 0, step: 0 };
+    if (BGM_ROUTED) {
+        deck.gain = audioCtx.createGain();
+        deck.gain.gain.value = 0;
+        deck.gain.connect(bgmBus);
+        audioCtx.createMediaElementSource(el).connect(deck.gain);
+    } else el.volume = 0;
+    el.addEventListener('timeupdate', () => bgmTick(deck, false));
+    el.addEventListener('ended', () => bgmTick(deck, true));
+    return deck;
+}
+
+function bgmLoad(deck, idx) {
+    deck.idx = idx;
+    deck.el.src = bgmTracks[idx];
+    deck.el.preload = 'auto';
+    deck.el.load();
+}
+
+function bgmTick(deck, ended) {
+    if (deck !== bgmDecks[0] || !bgmStarted) return;
+    const el = deck.el, left = el.duration - el.currentTime;
+    const next = bgmDecks[1], nextIdx = (deck.idx + 1) % bgmTracks.length;
+    if (left < BGM_PRELOAD && (next.idx !== nextIdx || next.el.ended)) bgmLoad(next, nextIdx);
+    if (ended || left <= BGM_XFADE) bgmSwap(ended ? 0.3 : BGM_XFADE);
+}
+
+// The outgoing deck is left to play out its last seconds under the fade
+function bgmSwap(fade) {
+    const cur = bgmDecks[0], next = bgmDecks[1];
+    const nextIdx = (cur.idx + 1) % bgmTracks.length;
+    if (next.idx !== nextIdx || next.el.ended) bgmLoad(next, nextIdx);
+    bgmDecks = [next, cur];
+    bgmIndex = nextIdx;
+    bgmSetLevel(cur, 0, fade);
+    bgmSetLevel(next, 1, fade);
+    next.el.play().catch(() => {});
+}
+
+function bgmSetLevel(deck, v, secs) {
+    if (deck.gain) {
+        const g = deck.gain.gain, now = audioCtx.currentTime;
+        g.cancelScheduledValues(now);
+        g.setValueAtTime(g.value, now);
+        g.linearRampToValueAtTime(v, now + secs);
+        return;
+    }
+    deck.target = v * BGM_VOLUME;
+    if (secs <= 0) { deck.el.volume = deck.target; return; }
+    deck.step = BGM_VOLUME * 0.05 / secs;
+    if (!bgmFadeTimer) bgmFadeTimer = setInterval(bgmFadeStep, 50);
+}
+
+function bgmFadeStep() {
+    let busy = false;
+    for (const d of bgmDecks) {
+        const dv = d.target - d.el.volume;
+        if (!dv) continue;
+        d.el.volume = Math.abs(dv) <= d.step ? d.target : d.el.volume + Math.sign(dv) * d.step;
+        busy = true;
+    }
+    if (!busy) { clearInterval(bgmFadeTimer); bgmFadeTimer = 0; }
+}
+
 // ============================================
 // SAVE SYSTEM
 // ============================================
@@ -111,12 +243,37 @@ function loadSave() { try { const d = JSON.parse(localStorage.getItem('toemarok'
 function writeSave() { try { localStorage.setItem('toemarok', JSON.stringify(saveData)); } catch(e){} }
 loadSave();
 
+// ============================================
+// RNG (seedable; all gameplay randomness goes through rand())
+// ============================================
+const params = new URLSearchParams(typeof location !== 'undefined' ? location.search : '');
+// ?seed=N pins the run seed, making the run reproducible from its inputs
+const IN_SIM_WORKER = typeof importScripts === 'function'; // loaded by sim-worker.js
+const fixedSeed = params.has('seed') ? parseInt(params.get('seed'), 10) >>> 0 : null;
+let rngState = 0, runSeed = 0;
+
+function seedRng(seed) { rngState = seed >>> 0; }
+
+// Cosmetic-only randomness (particles) draws from its own stream, so effect
+// quality settings never shift the gameplay sequence.
+let fxState = 0x2545F491;
+function fxRand() { fxState = (Math.imul(fxState, 1664525) + 1013904223) >>> 0; return fxState / 4294967296; }
+
+// mulberry32
+function rand() {
+    rngState = (rngState + 0x6D2B79F5) | 0;
+    let r = Math.imul(rngState ^ (rngState >>> 15), 1 | rngState);
+    r = (r + Math.imul(r ^ (r >>> 7), 61 | r)) ^ r;
+    return ((r ^ (r >>> 14)) >>> 0) / 4294967296;
+}
+
 // ============================================
 // GAME STATE
 // ============================================
 let state = 'title'; // title, charSelect, playing, levelUp, gameOver, victory
 let selectedChar = 0;
-let player, enemies, projectiles, orbs, particles, dmgNums;
+let player, enemies;
+const projectiles = [], orbs = [], particles = [], dmgNums = []; // pooled, see ENTITY POOLS
 let gameTime, kills, spawnTimer, bossSpawned1, bossSpawned2;
 let bombCooldown, lastTime, screenFlash = 0, screenFlashColor = '#FFF';
 let enemyIdCounter = 0; // Unique ID for each enemy
@@ -171,6 +328,7 @@ const EVOLUTIONS = [
 // ============================================
 const keys = {};
 let touchActive = false, touchStartX = 0, touchStartY = 0, touchDX = 0, touchDY = 0;
+let bombQueued = false; // bomb button tap, consumed by the next simulation step
 const touchArea = document.getElementById('touch-area');
 
 document.addEventListener('keydown', e => { keys[e.key] = true; ensureAudio(); });
@@ -195,17 +353,9 @@ touchArea.addEventListener('touchstart', e => {
     }
     // Playing state: check bomb button (bottom-right circle)
     const bombBtnX = W - 50, bombBtnY = H - 90, bombBtnR = 30;
-    if (state === 'playing' && Math.sqrt((pos.x-bombBtnX)**2+(pos.y-bombBtnY)**2) < bombBtnR) {
-        if (bombCooldown <= 0) {
-            bombCooldown = 30;
-            playSound('bomb');
-            screenFlash = 0.5; screenFlashColor = '#FFD700';
-            spawnParticles(player.x, player.y, '#FFD700', 30, 120);
-            for (const e3 of enemies) {
-                if (!e3.isBoss) { e3.hp -= 50; spawnDmgNum(e3.x, e3.y-10, 50, '#FFD700'); }
-                else { e3.hp -= 25; spawnDmgNum(e3.x, e3.y-10, 25, '#FFD700'); }
-            }
-        }
+    if (state === 'playing' && (pos.x-bombBtnX)**2+(pos.y-bombBtnY)**2 < bombBtnR*bombBtnR) {
+        // Applied inside the fixed step (see update) so replays stay exact
+        if (bombCooldown <= 0) bombQueued = true;
         return;
     }
     // Joystick drag
@@ -246,7 +396,9 @@ function getInput() {
     }
     const mag = Math.sqrt(dx*dx+dy*dy);
     if (mag > 0) { dx/=mag; dy/=mag; }
-    return { dx, dy, bomb: keys[' '] };
+    const bomb = !!keys[' '] || bombQueued;
+    bombQueued = false;
+    return { dx, dy, bomb };
 }
 
 // ============================================
@@ -736,37 +888,281 @@ function drawThunder(x, y) {
     ctx.restore();
 }
 
-function drawExpOrb(x, y) {
+// Merged orbs step up in size and colour: green, blue, gold
+const ORB_LOOKS = [
+    { r: 4, glow: '#00FF88', rim: '#00CC66', hi: '#AAFFCC' },
+    { r: 5, glow: '#44AAFF', rim: '#2266DD', hi: '#CCE6FF' },
+    { r: 6, glow: '#FFCC33', rim: '#DD8800', hi: '#FFF2AA' },
+];
+function drawExpOrb(x, y, tier) {
+    const look = ORB_LOOKS[tier || 0], r = look.r;
     const glow = Math.sin(t * 4) * 0.3 + 0.7;
-    ctx.globalAlpha = glow * 0.3; circ(x, y, 8, '#00FF88'); ctx.globalAlpha = 1;
-    circ(x, y, 4, '#00CC66'); circ(x, y, 3, '#00FF88'); circ(x, y-1, 1.5, '#AAFFCC');
+    ctx.globalAlpha = glow * 0.3; circ(x, y, r * 2, look.glow); ctx.globalAlpha = 1;
+    circ(x, y, r, look.rim); circ(x, y, r - 1, look.glow); circ(x, y-1, r * 0.375, look.hi);
 }
 
 const charDrawFns = [drawExorcist, drawMunyeo, drawJeonwoochi, drawHonggildong, drawJanggun, drawSanshin];
 const enemyDrawFns = [drawJapgwi, drawDokkaebul, drawMulgwisin, drawYacha, drawGangsi, drawWongwi, drawSamdugu, drawImuga];
+const bossDrawFns = { 98: drawGwiwang, 97: drawDokkaebiKing, 99: drawGumihoKing };
+
+
+// ============================================
+// SPRITE CACHE (pre-rendered atlas pages)
+// ============================================
+// Each enemy sprite is rendered once per (walk frame, animation frame,
+// variant) into a shelf-packed atlas page and then blitted with drawImage.
+// Animation time is quantised over the sprite's loop period: `cycles` 2*PI
+// spans of `t`, the shortest after which every sin(t*k) it uses repeats
+// (sin(t*1.5) needs two). Sprites with no such period - the drip in
+// drawMulgwisin - are drawn live, as are the player and bosses, which are
+// one on screen each and would need hundreds of cells for their walk frames
+// or long periods (sin(t*1.2) against sin(t*1.5) only repeats after 20*PI).
+const SPRITE_NORMAL = 0, SPRITE_FLASH = 1, SPRITE_FADED = 2;
+const SPRITE_FRAMES = 96; // atlas cells per 2*PI of t, ~15 per second
+const SPRITE_VARIANTS = 3, SPRITE_MAX_IDS = 32;
+const ATLAS_SIZE = 1024, ATLAS_MAX_PAGES = 10;
+const SPRITE_BOX = new Map(); // draw fn -> { id, w, h, ox, oy, period, frames }
+const spriteCells = new Map(); // cell key -> { page, ctx, sx, sy }
+const atlasPages = [];
+let atlasPage = 0, shelfX = 0, shelfY = 0, shelfH = 0, atlasEpoch = 0;
+let spriteWarmIdx = 0;
+
+function makeCanvas(w, h) {
+    if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(w, h);
+    const c = document.createElement('canvas'); c.width = w; c.height = h; return c;
+}
+
+function registerSprites(fns, w, h, ox, oy, cycles) {
+    for (const fn of fns) {
+        SPRITE_BOX.set(fn, { id: SPRITE_BOX.size, w, h, ox, oy,
+            period: cycles * Math.PI * 2, frames: cycles * SPRITE_FRAMES });
+    }
+}
+registerSprites([drawJapgwi, drawDokkaebul, drawYacha, drawGangsi, drawSamdugu, drawImuga], 56, 72, 28, 40, 1);
+registerSprites([drawWongwi], 56, 72, 28, 40, 2); // sin(t*1.5)
+const warmDrawFns = enemyDrawFns.filter(fn => SPRITE_BOX.has(fn));
+
+function allocSpriteCell(w, h) {
+    if (shelfX + w > ATLAS_SIZE) { shelfX = 0; shelfY += shelfH + 2; shelfH = 0; }
+    if (shelfY + h > ATLAS_SIZE) { atlasPage++; shelfX = 0; shelfY = 0; shelfH = 0; }
+    if (atlasPage >= ATLAS_MAX_PAGES) {
+        // Out of room: drop every cell and refill lazily from page 0
+        spriteCells.clear();
+        for (const pg of atlasPages) pg.ctx.clearRect(0, 0, ATLAS_SIZE, ATLAS_SIZE);
+        atlasPage = 0; shelfX = 0; shelfY = 0; shelfH = 0; atlasEpoch++;
+    }
+    if (!atlasPages[atlasPage]) {
+        const page = makeCanvas(ATLAS_SIZE, ATLAS_SIZE);
+        atlasPages[atlasPage] = { page, ctx: page.getContext('2d') };
+    }
+    const pg = atlasPages[atlasPage];
+    const cell = { page: pg.page, ctx: pg.ctx, sx: shelfX, sy: shelfY };
+    shelfX += w + 2; shelfH = Math.max(shelfH, h);
+    return cell;
+}
+
+function renderSpriteCell(fn, box, walk, tf, variant, radius, key) {
+    // The faded variant is a translucent copy of the normal cell
+    let base = null;
+    if (variant === SPRITE_FADED) base = getSpriteCell(fn, box, walk, tf, SPRITE_NORMAL, radius);
+    const epoch = atlasEpoch;
+    const cell = allocSpriteCell(box.w, box.h);
+    if (base && epoch !== atlasEpoch) base = getSpriteCell(fn, box, walk, tf, SPRITE_NORMAL, radius); // flush wiped it
+    const prevCtx = ctx, prevT = t;
+    ctx = cell.ctx; t = tf * box.period / box.frames;
+    ctx.save();
+    ctx.beginPath(); ctx.rect(cell.sx, cell.sy, box.w, box.h); ctx.clip();
+    if (base) {
+        ctx.globalAlpha = 0.3;
+        ctx.drawImage(base.page, base.sx, base.sy, box.w, box.h, cell.sx, cell.sy, box.w, box.h);
+    } else {
+        // Drawn at the origin, so terms like drawJapgwi's sin(t*3 + x*0.1)
+        // don't pick up a phase from where the cell sits on the shelf
+        ctx.translate(cell.sx + box.ox, cell.sy + box.oy);
+        if (variant === SPRITE_FLASH) { ctx.globalAlpha = 0.7; circ(0, 0, radius + 3, '#FFF'); ctx.globalAlpha = 1; }
+        fn(0, 0, walk);
+    }
+    ctx.restore();
+    ctx = prevCtx; t = prevT;
+    spriteCells.set(key, cell);
+    return cell;
+}
+
+function getSpriteCell(fn, box, walk, tf, variant, radius) {
+    const key = ((tf * 4 + walk) * SPRITE_VARIANTS + variant) * SPRITE_MAX_IDS + box.id;
+    return spriteCells.get(key) || renderSpriteCell(fn, box, walk, tf, variant, radius, key);
+}
+
+// Draws `fn`'s sprite centred at (x, y), blitted from the atlas when it has
+// a box there. `frame` is the walk-cycle argument the draw functions take,
+// `phase` the animation time (usually t + offset).
+function drawSprite(fn, x, y, frame, phase, variant, radius) {
+    const box = SPRITE_BOX.get(fn);
+    if (!box) { drawSpriteLive(fn, x, y, frame, phase, variant, radius); return; }
+    const walk = Math.floor(frame) % 4;
+    const tf = Math.floor(phase / box.period * box.frames) % box.frames;
+    const cell = getSpriteCell(fn, box, walk, tf, variant || SPRITE_NORMAL, radius || 0);
+    ctx.drawImage(cell.page, cell.sx, cell.sy, box.w, box.h, Math.floor(x) - box.ox, Math.floor(y) - box.oy, box.w, box.h);
+}
+
+// The draw functions reset globalAlpha to 1 after their shadows, so the
+// faded variant is drawn opaque into a scratch canvas and blitted at 0.3.
+const fadeScratch = { w: 112, h: 112, ox: 56, oy: 60, canvas: null, ctx: null };
+
+function drawSpriteLive(fn, x, y, frame, phase, variant, radius) {
+    const prevT = t;
+    t = phase;
+    if (variant === SPRITE_FADED) {
+        const fs = fadeScratch;
+        if (!fs.canvas) { fs.canvas = makeCanvas(fs.w, fs.h); fs.ctx = fs.canvas.getContext('2d'); }
+        const prevCtx = ctx;
+        ctx = fs.ctx;
+        ctx.clearRect(0, 0, fs.w, fs.h);
+        fn(fs.ox, fs.oy, frame);
+        ctx = prevCtx;
+        ctx.globalAlpha = 0.3;
+        ctx.drawImage(fs.canvas, Math.floor(x) - fs.ox, Math.floor(y) - fs.oy);
+        ctx.globalAlpha = 1;
+    } else {
+        if (variant === SPRITE_FLASH) { ctx.globalAlpha = 0.7; circ(x, y, radius + 3, '#FFF'); ctx.globalAlpha = 1; }
+        fn(x, y, frame);
+    }
+    t = prevT;
+}
+
+// Pre-renders enemy frames a few at a time while the menus are up.
+function warmSpriteCache(budgetMs) {
+    const total = warmDrawFns.length * 2 * SPRITE_FRAMES;
+    if (spriteWarmIdx >= total) return;
+    const end = performance.now() + budgetMs;
+    while (spriteWarmIdx < total && performance.now() < end) {
+        const fn = warmDrawFns[spriteWarmIdx % warmDrawFns.length], box = SPRITE_BOX.get(fn);
+        const tf = Math.floor(spriteWarmIdx / warmDrawFns.length);
+        if (tf < box.frames) getSpriteCell(fn, box, 0, tf, SPRITE_NORMAL, 0);
+        spriteWarmIdx++;
+    }
+}
+
+
+// ============================================
+// GLYPH CACHE (bitmap text)
+// ============================================
+// fillText is slow, and damage numbers draw it hundreds of times a frame.
+// Text is blitted from atlas cells instead: one strip of GLYPH_CHARS per
+// (size, colour) in use, and one cell per other run of text such as
+// '크리!', 'HP ' or '요괴'. Cells live on the sprite atlas and are
+// re-rendered after an atlas flush.
+const GLYPH_CHARS = '0123456789:/.+-';
+const glyphIdx = new Int8Array(128).fill(-1);
+for (let i = 0; i < GLYPH_CHARS.length; i++) glyphIdx[GLYPH_CHARS.charCodeAt(i)] = i;
+const glyphCells = new Map(); // "size|color|text" -> { page, sx, sy, w, h, cw, adv, epoch }
+const glyphParts = []; // scratch: strip index (number) or word cell per run
+let glyphMeasure = null;
+
+function isGlyphChar(code) { return code < 128 && glyphIdx[code] >= 0; }
+
+function glyphCell(text, size, color, strip) {
+    const key = size + '|' + color + '|' + text;
+    let g = glyphCells.get(key);
+    if (g && g.epoch === atlasEpoch) return g;
+    const font = `bold ${size}px monospace`;
+    if (!glyphMeasure) glyphMeasure = makeCanvas(1, 1).getContext('2d');
+    glyphMeasure.font = font;
+    const adv = glyphMeasure.measureText(strip ? '0' : text).width;
+    const cw = Math.ceil(adv) + 2, w = strip ? cw * text.length : cw, h = size + 4;
+    const cell = allocSpriteCell(w, h);
+    const c = cell.ctx;
+    c.font = font; c.fillStyle = color; c.textAlign = 'left'; c.textBaseline = 'top';
+    if (strip) { for (let i = 0; i < text.length; i++) c.fillText(text[i], cell.sx + i * cw + 1, cell.sy + 1); }
+    else c.fillText(text, cell.sx + 1, cell.sy + 1);
+    g = { page: cell.page, sx: cell.sx, sy: cell.sy, w, h, cw, adv, epoch: atlasEpoch };
+    glyphCells.set(key, g);
+    return g;
+}
+
+// Drop-in for txt(): same font, colour, size and alignment, baseline top.
+function glyphText(text, x, y, color, size, align) {
+    const s = typeof text === 'string' ? text : String(text);
+    size = size || 10; color = color || '#fff';
+    let strip = null, w = 0;
+    glyphParts.length = 0;
+    for (let i = 0; i < s.length;) {
+        const code = s.charCodeAt(i);
+        if (isGlyphChar(code)) {
+            if (!strip) strip = glyphCell(GLYPH_CHARS, size, color, true);
+            glyphParts.push(glyphIdx[code]); w += strip.adv; i++; continue;
+        }
+        let j = i + 1;
+        while (j < s.length && !isGlyphChar(s.charCodeAt(j))) j++;
+        const word = glyphCell(s.slice(i, j), size, color, false);
+        glyphParts.push(word); w += word.adv; i = j;
+    }
+    let cx = align === 'left' ? x : align === 'right' ? x - w : x - w / 2;
+    const oy = Math.floor(y) - 1;
+    for (const part of glyphParts) {
+        if (typeof part === 'number') {
+            ctx.drawImage(strip.page, strip.sx + part * strip.cw, strip.sy, strip.cw, strip.h, Math.floor(cx) - 1, oy, strip.cw, strip.h);
+            cx += strip.adv;
+        } else {
+            ctx.drawImage(part.page, part.sx, part.sy, part.w, part.h, Math.floor(cx) - 1, oy, part.w, part.h);
+            cx += part.adv;
+        }
+    }
+}
 
 
 // ============================================
 // MAP DRAWING
 // ============================================
+// The ground is a pure function of tile coords, so it is rendered once per
+// chunk into an offscreen canvas and blitted. A chunk is at least one
+// screen wide and one screen tall, so a frame blits at most 2x2 chunks.
+const TILE = 40;
+const CHUNK_TX = 10, CHUNK_TY = 18; // tiles per chunk: 400x720px
+const CHUNK_W = CHUNK_TX * TILE, CHUNK_H = CHUNK_TY * TILE;
+const MAP_CHUNK_CACHE = 8;
+const mapChunks = new Map(); // "cx,cy" -> canvas, in LRU order (oldest first)
+
+function drawTile(sx, sy, tx, ty) {
+    const hash = ((tx * 7 + ty * 13) & 0xFF);
+    const r = 140 + (hash & 15); const g = 115 + (hash & 15); const b = 85 + (hash & 7);
+    px(sx, sy, TILE, TILE, `rgb(${r},${g},${b})`);
+    if (quality.decor > 1 && hash % 17 === 0) { px(sx+10, sy+15, 3, 2, `rgb(${r-15},${g-15},${b-10})`); }
+    if (quality.decor > 0 && hash % 23 === 0) { circ(sx+25, sy+20, 2, '#5a7a3a'); }
+}
+
+function getMapChunk(cx, cy) {
+    const key = `${cx},${cy}`;
+    let chunk = mapChunks.get(key);
+    if (chunk) { mapChunks.delete(key); mapChunks.set(key, chunk); return chunk; }
+    if (mapChunks.size >= MAP_CHUNK_CACHE) {
+        // Recycle the least recently used chunk's canvas
+        const oldest = mapChunks.keys().next().value;
+        chunk = mapChunks.get(oldest);
+        mapChunks.delete(oldest);
+    } else {
+        chunk = makeCanvas(CHUNK_W, CHUNK_H);
+    }
+    const prevCtx = ctx;
+    ctx = chunk.getContext('2d');
+    for (let ty = 0; ty < CHUNK_TY; ty++) {
+        for (let tx = 0; tx < CHUNK_TX; tx++) drawTile(tx * TILE, ty * TILE, cx * CHUNK_TX + tx, cy * CHUNK_TY + ty);
+    }
+    ctx = prevCtx;
+    mapChunks.set(key, chunk);
+    return chunk;
+}
+
 function drawMap(camX, camY) {
-    const tileW = 40, tileH = 40;
-    const startX = Math.floor((camX - W/2) / tileW) - 1;
-    const startY = Math.floor((camY - H/2) / tileH) - 1;
-    const endX = startX + Math.ceil(W / tileW) + 3;
-    const endY = startY + Math.ceil(H / tileH) + 3;
-    for (let ty = startY; ty <= endY; ty++) {
-        for (let tx = startX; tx <= endX; tx++) {
-            const sx = tx * tileW - camX + W/2;
-            const sy = ty * tileH - camY + H/2;
-            const hash = ((tx * 7 + ty * 13) & 0xFF);
-            const r = 140 + (hash & 15); const g = 115 + (hash & 15); const b = 85 + (hash & 7);
-            px(sx, sy, tileW, tileH, `rgb(${r},${g},${b})`);
-            if (hash % 17 === 0) { px(sx+10, sy+15, 3, 2, `rgb(${r-15},${g-15},${b-10})`); }
-            if (hash % 23 === 0) { circ(sx+25, sy+20, 2, '#5a7a3a'); }
+    const left = camX - W/2, top = camY - H/2;
+    const cx0 = Math.floor(left / CHUNK_W), cx1 = Math.floor((left + W) / CHUNK_W);
+    const cy0 = Math.floor(top / CHUNK_H), cy1 = Math.floor((top + H) / CHUNK_H);
+    for (let cy = cy0; cy <= cy1; cy++) {
+        for (let cx = cx0; cx <= cx1; cx++) {
+            ctx.drawImage(getMapChunk(cx, cy), Math.floor(cx * CHUNK_W - left), Math.floor(cy * CHUNK_H - top));
         }
     }
-    // Map boundary markers
+    // Map boundary ring, drawn over the cached ground
     const mapR = 1200;
     const edgeDist = Math.sqrt(camX*camX + camY*camY);
     if (edgeDist > mapR - 250) {
@@ -778,25 +1174,57 @@ function drawMap(camX, camY) {
     }
 }
 
+// ============================================
+// ENTITY POOLS (recycled objects, one compaction pass per frame)
+// ============================================
+// Live-entity caps per kind; the free lists are bounded by the same numbers.
+const POOL_CAP = { particle: 600, dmgNum: 120, projectile: 500, orb: 1500 };
+const freeList = { particle: [], dmgNum: [], projectile: [], orb: [] };
+
+function poolObtain(kind) { const f = freeList[kind]; return f.length ? f.pop() : {}; }
+function poolRelease(kind, obj) { if (freeList[kind].length < POOL_CAP[kind]) freeList[kind].push(obj); }
+
+// Every pooled kind dies by reaching life <= 0: update loops only mark,
+// then this drops the dead in a single order-preserving pass.
+function compactLive(arr, kind) {
+    let w = 0;
+    for (let i = 0; i < arr.length; i++) {
+        const o = arr[i];
+        if (o.life <= 0) { poolRelease(kind, o); continue; }
+        arr[w++] = o;
+    }
+    arr.length = w;
+}
+
+function releaseAll(arr, kind) {
+    for (const o of arr) poolRelease(kind, o);
+    arr.length = 0;
+}
+
 // ============================================
 // PARTICLE SYSTEM
 // ============================================
 function spawnParticles(x, y, color, count, spd) {
+    count = Math.ceil(count * quality.particleMul);
     for (let i = 0; i < count; i++) {
-        const angle = Math.random() * Math.PI * 2;
-        const s = (Math.random() * 0.5 + 0.5) * (spd || 60);
-        particles.push({ x, y, vx: Math.cos(angle)*s, vy: Math.sin(angle)*s, life: 0.5 + Math.random()*0.3, maxLife: 0.8, color, size: 2+Math.random()*2 });
+        if (particles.length >= quality.particles) return;
+        const angle = fxRand() * Math.PI * 2;
+        const s = (fxRand() * 0.5 + 0.5) * (spd || 60);
+        const p = poolObtain('particle');
+        p.x = x; p.y = y; p.vx = Math.cos(angle)*s; p.vy = Math.sin(angle)*s;
+        p.life = 0.5 + fxRand()*0.3; p.maxLife = 0.8; p.color = color; p.size = 2+fxRand()*2;
+        particles.push(p);
     }
 }
 
 function updateParticles(dt) {
-    for (let i = particles.length - 1; i >= 0; i--) {
+    for (let i = 0; i < particles.length; i++) {
         const p = particles[i];
         p.x += p.vx * dt; p.y += p.vy * dt;
         p.vx *= 0.95; p.vy *= 0.95;
         p.life -= dt;
-        if (p.life <= 0) particles.splice(i, 1);
     }
+    compactLive(particles, 'particle');
 }
 
 function drawParticles(camX, camY) {
@@ -812,27 +1240,48 @@ function drawParticles(camX, camY) {
 // ============================================
 // DAMAGE NUMBERS
 // ============================================
-function spawnDmgNum(x, y, val, color, isCrit) {
-    dmgNums.push({ x, y, val: Math.floor(val), vy: -50, life: 0.8, color: color || '#FFF', crit: isCrit });
+// Hits on the same enemy (src = uid) in the same colour within
+// DMG_MERGE_WINDOW fold into the newest number instead of stacking.
+const DMG_LIFE = 0.8, DMG_MERGE_WINDOW = 0.15;
+
+function spawnDmgNum(x, y, val, color, isCrit, src) {
+    pushDmgNum(x, y, Math.floor(val), color || '#FFF', !!isCrit, false, src || 0);
+}
+
+function spawnDmgText(x, y, text, color) {
+    pushDmgNum(x, y, text, color, false, true, 0);
+}
+
+function pushDmgNum(x, y, val, color, crit, text, src) {
+    if (src) {
+        // Newest entries are at the end; stop at the first one past the window
+        for (let i = dmgNums.length - 1; i >= 0 && dmgNums[i].life > DMG_LIFE - DMG_MERGE_WINDOW; i--) {
+            const d = dmgNums[i];
+            if (d.src === src && d.color === color) { d.val += val; d.crit = d.crit || crit; return; }
+        }
+    }
+    if (dmgNums.length >= quality.dmgNums) return;
+    const d = poolObtain('dmgNum');
+    d.x = x; d.y = y; d.val = val; d.vy = -50; d.life = DMG_LIFE; d.color = color; d.crit = crit; d.text = text; d.src = src;
+    dmgNums.push(d);
 }
 
 function updateDmgNums(dt) {
-    for (let i = dmgNums.length - 1; i >= 0; i--) {
+    for (let i = 0; i < dmgNums.length; i++) {
         const d = dmgNums[i];
         d.y += d.vy * dt; d.vy += 30 * dt; d.life -= dt;
-        if (d.life <= 0) dmgNums.splice(i, 1);
     }
+    compactLive(dmgNums, 'dmgNum');
 }
 
 function drawDmgNums(camX, camY) {
     for (const d of dmgNums) {
         const sx = d.x - camX + W/2, sy = d.y - camY + H/2;
-        ctx.globalAlpha = Math.max(0, d.life / 0.8);
+        ctx.globalAlpha = Math.max(0, d.life / DMG_LIFE);
         const isCrit = d.crit || d.color === '#FFDD00';
         const sz = isCrit ? 14 : (d.text ? 12 : 10);
-        const label = d.text ? d.val : String(d.val);
-        txt(label, sx, sy, d.color, sz);
-        if (isCrit && !d.text) txt('크리!', sx, sy - 12, '#FFDD00', 8);
+        glyphText(d.val, sx, sy, d.color, sz);
+        if (isCrit && !d.text) glyphText('크리!', sx, sy - 12, '#FFDD00', 8);
     }
     ctx.globalAlpha = 1;
 }
@@ -843,7 +1292,7 @@ function drawDmgNums(camX, camY) {
 function initGame() {
     const ch = CHARS[selectedChar];
     player = {
-        x: 0, y: 0, hp: ch.hp, maxHp: ch.hp, spd: ch.spd, atk: ch.atk,
+        x: 0, y: 0, ox: 0, oy: 0, hp: ch.hp, maxHp: ch.hp, spd: ch.spd, atk: ch.atk,
         range: ch.range, level: 1, exp: 0, expToNext: 15,
         iframes: 0, charIdx: selectedChar, frame: 0,
         weapons: [{ id: ch.weapon, level: 1, cd: 0, evolved: false }],
@@ -852,11 +1301,16 @@ function initGame() {
         atkMul: 1, spdMul: 1, rangeMul: 1, expMul: 1, cdrMul: 1,
         dodge: 0, crit: 0, regenTimer: 0
     };
-    enemies = []; projectiles = []; orbs = []; particles = []; dmgNums = [];
+    enemies = []; resetEnemyStore();
+    releaseAll(projectiles, 'projectile'); resetOrbs();
+    releaseAll(particles, 'particle'); releaseAll(dmgNums, 'dmgNum');
     gameTime = 0; kills = 0; spawnTimer = 0;
     bossSpawned1 = false; bossSpawned2 = false;
     nextBossTime = 180; bossWave = 0;
     bombCooldown = 0; lastTime = performance.now();
+    simAccum = 0;
+    runSeed = fixedSeed !== null ? fixedSeed : Math.floor(Math.random() * 4294967296);
+    seedRng(runSeed);
     startBGM();
     state = 'playing';
 }
@@ -900,16 +1354,16 @@ function spawnEnemy(typeIdx, px2, py2) {
     let sx, sy;
     if (px2 !== undefined) { sx = px2; sy = py2; }
     else {
-        const angle = Math.random() * Math.PI * 2;
+        const angle = rand() * Math.PI * 2;
         const dist = 380;
         sx = player.x + Math.cos(angle) * dist;
         sy = player.y + Math.sin(angle) * dist;
     }
-    enemies.push({
+    addEnemy({
         uid: ++enemyIdCounter,
-        x: sx, y: sy, type: typeIdx, hp: def.hp * hpScale, maxHp: def.hp * hpScale,
+        x: sx, y: sy, ox: sx, oy: sy, type: typeIdx, hp: def.hp * hpScale, maxHp: def.hp * hpScale,
         spd: def.spd, dmg: def.dmg, radius: def.radius, exp: def.exp,
-        pattern: def.pattern, timer: 0, phase: 0, angle: Math.random()*Math.PI*2,
+        pattern: def.pattern, timer: 0, phase: 0, angle: rand()*Math.PI*2,
         isBoss: false, shootCd: 0, startX: sx, startY: sy
     });
 }
@@ -917,7 +1371,7 @@ function spawnEnemy(typeIdx, px2, py2) {
 function spawnBoss(type, wave) {
     const w = wave || 0;
     const hpMul = 1 + w * 0.3;
-    const angle = Math.random() * Math.PI * 2;
+    const angle = rand() * Math.PI * 2;
     const dist = 350;
     const bx = player.x + Math.cos(angle) * dist;
     const by = player.y + Math.sin(angle) * dist;
@@ -931,13 +1385,13 @@ function spawnBoss(type, wave) {
     }
     const boss = {
         uid: ++enemyIdCounter,
-        x: bx, y: by, type: btype,
+        x: bx, y: by, ox: bx, oy: by, type: btype,
         hp: hp * hpMul, maxHp: hp * hpMul,
         spd, dmg, radius, exp, pattern,
         timer: 0, phase: 0, angle: 0, isBoss: true, shootCd: 0,
         startX: bx, startY: by
     };
-    enemies.push(boss);
+    addEnemy(boss);
     playSound('boss');
 }
 
@@ -954,14 +1408,14 @@ function updateSpawning(dt) {
         if (available.length > 0) {
             const weights = available.map((idx, i) => 1 + i * 0.5);
             const totalW = weights.reduce((a,b)=>a+b,0);
-            let r = Math.random() * totalW;
+            let r = rand() * totalW;
             let chosen = available[0];
             for (let i = 0; i < weights.length; i++) {
                 r -= weights[i];
                 if (r <= 0) { chosen = available[i]; break; }
             }
             if (chosen === 6) {
-                const ang = Math.random() * Math.PI * 2;
+                const ang = rand() * Math.PI * 2;
                 for (let j = 0; j < 3; j++) {
                     const d = 380;
                     const a2 = ang + (j-1)*0.2;
@@ -981,14 +1435,7 @@ function updateSpawning(dt) {
         }
     }
     // Cap max enemies for performance (remove furthest ones)
-    if (enemies.length > 200) {
-        enemies.sort((a, b) => {
-            const da = (a.x-player.x)**2+(a.y-player.y)**2;
-            const db = (b.x-player.x)**2+(b.y-player.y)**2;
-            return da - db;
-        });
-        while (enemies.length > 200) enemies.pop();
-    }
+    if (enemies.length > enemyCap) evictFarthest(enemies.length - enemyCap);
     // Boss spawns every 3 minutes, cycling 3 types, getting stronger
     if (gameTime >= nextBossTime) {
         bossWave++;
@@ -1000,150 +1447,409 @@ function updateSpawning(dt) {
 }
 
 
+// ============================================
+// ENEMY STORE (optional struct-of-arrays backing, ?soa=1)
+// ============================================
+// Hot enemy fields live in typed-array columns indexed by slot; `enemies`
+// then holds EnemySlot handles whose hot properties read through to the
+// columns, so the rest of the game (weapons, drawing, uid-keyed _tick maps)
+// is unchanged. Simple movement patterns run as one loop over the columns.
+const USE_ENEMY_SOA = params.get('soa') === '1';
+const PATTERN_IDS = { straight:0, aimed:1, tank:2, formation:3, zigzag:4, swooper:5, spiral:6, sniper:7, boss1:8, boss2:9, boss3:10 };
+const COLUMN_PATTERNS = 7; // ids below this move in moveEnemiesSoA
+const ENEMY_FLAG_BOSS = 1;
+const enemyStore = {
+    count: 0, cap: 0,
+    x: null, y: null, vx: null, vy: null, hp: null, spd: null, radius: null, timer: null, angle: null,
+    type: null, pattern: null, phase: null, flags: null, uid: null,
+    refs: [], // slot -> EnemySlot
+    slotOf: new Map(), // uid -> slot
+};
+const ENEMY_F32_COLS = ['x', 'y', 'vx', 'vy', 'hp', 'spd', 'radius', 'timer', 'angle'];
+const ENEMY_I32_COLS = ['type', 'pattern', 'phase', 'flags', 'uid'];
+
+function growEnemyStore(cap) {
+    const S = enemyStore;
+    for (const k of ENEMY_F32_COLS) { const a = new Float32Array(cap); if (S[k]) a.set(S[k]); S[k] = a; }
+    for (const k of ENEMY_I32_COLS) { const a = new Int32Array(cap); if (S[k]) a.set(S[k]); S[k] = a; }
+    S.cap = cap;
+}
+
+function resetEnemyStore() {
+    enemyStore.count = 0; enemyStore.refs.length = 0; enemyStore.slotOf.clear();
+}
+
+class EnemySlot {
+    constructor(slot, src) {
+        this.slot = slot;
+        this.uid = src.uid; this.columnar = PATTERN_IDS[src.pattern] < COLUMN_PATTERNS;
+        this.pattern = src.pattern; this.isBoss = src.isBoss;
+        this.maxHp = Math.fround(src.maxHp); // match the float32 hp column for hp < maxHp checks
+        this.dmg = src.dmg; this.exp = src.exp; this.shootCd = src.shootCd;
+        this.startX = src.startX; this.startY = src.startY; this.ox = src.ox; this.oy = src.oy;
+        this.hitFlash = 0; this.burnTimer = 0; this.burnDmg = 0; this.slowed = 0; this.origSpd = 0;
+    }
+    get x() { return enemyStore.x[this.slot]; } set x(v) { enemyStore.x[this.slot] = v; }
+    get y() { return enemyStore.y[this.slot]; } set y(v) { enemyStore.y[this.slot] = v; }
+    get vx() { return enemyStore.vx[this.slot]; } set vx(v) { enemyStore.vx[this.slot] = v; }
+    get vy() { return enemyStore.vy[this.slot]; } set vy(v) { enemyStore.vy[this.slot] = v; }
+    get hp() { return enemyStore.hp[this.slot]; } set hp(v) { enemyStore.hp[this.slot] = v; }
+    get spd() { return enemyStore.spd[this.slot]; } set spd(v) { enemyStore.spd[this.slot] = v; }
+    get radius() { return enemyStore.radius[this.slot]; } set radius(v) { enemyStore.radius[this.slot] = v; }
+    get timer() { return enemyStore.timer[this.slot]; } set timer(v) { enemyStore.timer[this.slot] = v; }
+    get angle() { return enemyStore.angle[this.slot]; } set angle(v) { enemyStore.angle[this.slot] = v; }
+    get type() { return enemyStore.type[this.slot]; } set type(v) { enemyStore.type[this.slot] = v; }
+    get phase() { return enemyStore.phase[this.slot]; } set phase(v) { enemyStore.phase[this.slot] = v; }
+}
+
+// Adds a freshly built enemy object, converting it to a column-backed
+// handle in SoA mode.
+function addEnemy(src) {
+    if (!USE_ENEMY_SOA) { enemies.push(src); return src; }
+    const S = enemyStore;
+    if (S.count >= S.cap) growEnemyStore(Math.max(256, S.cap * 2));
+    const i = S.count++;
+    S.x[i] = src.x; S.y[i] = src.y; S.vx[i] = 0; S.vy[i] = 0;
+    S.hp[i] = src.hp; S.spd[i] = src.spd; S.radius[i] = src.radius;
+    S.timer[i] = src.timer; S.angle[i] = src.angle;
+    S.type[i] = src.type; S.pattern[i] = PATTERN_IDS[src.pattern]; S.phase[i] = src.phase;
+    S.flags[i] = src.isBoss ? ENEMY_FLAG_BOSS : 0; S.uid[i] = src.uid;
+    const ref = new EnemySlot(i, src);
+    S.refs[i] = ref; S.slotOf.set(src.uid, i);
+    enemies.push(ref);
+    return ref;
+}
+
+// Frees an enemy's slot when it leaves `enemies` (no-op in object mode).
+// The last slot is moved into the hole, so columns stay dense. The handle's
+// hot fields read as undefined afterwards; uid and cold fields survive.
+function dropEnemy(e) {
+    if (!USE_ENEMY_SOA) return;
+    const S = enemyStore;
+    const i = e.slot, last = --S.count;
+    S.slotOf.delete(e.uid);
+    if (i !== last) {
+        for (const k of ENEMY_F32_COLS) S[k][i] = S[k][last];
+        for (const k of ENEMY_I32_COLS) S[k][i] = S[k][last];
+        const moved = S.refs[last];
+        moved.slot = i; S.refs[i] = moved; S.slotOf.set(moved.uid, i);
+    }
+    S.refs.length = last;
+    e.slot = -1;
+}
+
+// Column loop for the non-shooting patterns; sniper and bosses still go
+// through moveEnemy per object.
+function moveEnemiesSoA(dt) {
+    const S = enemyStore, n = S.count;
+    const X = S.x, Y = S.y, VX = S.vx, VY = S.vy, SPD = S.spd, TM = S.timer, ANG = S.angle, PH = S.phase, PAT = S.pattern;
+    const plx = player.x, ply = player.y, mapR = 1200;
+    for (let i = 0; i < n; i++) {
+        const pat = PAT[i];
+        if (pat >= COLUMN_PATTERNS) continue;
+        const ox = X[i], oy = Y[i];
+        const dx = plx - ox, dy = ply - oy;
+        const dist = Math.sqrt(dx*dx + dy*dy) || 1;
+        const nx = dx/dist, ny = dy/dist;
+        const spd = SPD[i];
+        TM[i] += dt;
+        let x = ox, y = oy;
+        if (pat < 4) { // straight, aimed, tank, formation
+            x += nx * spd * dt; y += ny * spd * dt;
+        } else if (pat === 4) { // zigzag: cos(a+pi/2) = -sin(a), sin(a+pi/2) = cos(a)
+            const zig = Math.sin(TM[i] * 4) * 40, a = ANG[i];
+            x += (nx * spd - Math.sin(a) * zig) * dt;
+            y += (ny * spd + Math.cos(a) * zig) * dt;
+            ANG[i] = Math.atan2(dy, dx);
+        } else if (pat === 5) { // swooper
+            const ph = PH[i];
+            if (ph === 0) {
+                x += nx * spd * 0.3 * dt; y += ny * spd * 0.3 * dt;
+                if (dist < 150) { PH[i] = 1; TM[i] = 0; }
+            } else if (ph === 1) {
+                x += nx * spd * dt; y += ny * spd * dt;
+                if (TM[i] > 0.8) { PH[i] = 2; TM[i] = 0; }
+            } else {
+                x -= nx * spd * 0.5 * dt; y -= ny * spd * 0.5 * dt;
+                if (TM[i] > 1.5) PH[i] = 0;
+            }
+        } else { // spiral
+            ANG[i] += 1.5 * dt;
+            const spiralR = Math.max(30, dist - 20 * dt);
+            x = plx + Math.cos(ANG[i]) * spiralR;
+            y = ply + Math.sin(ANG[i]) * spiralR;
+        }
+        const d2 = x*x + y*y;
+        if (d2 > mapR*mapR) { const d = Math.sqrt(d2); x *= mapR/d; y *= mapR/d; }
+        X[i] = x; Y[i] = y;
+        VX[i] = (x - ox) / dt; VY[i] = (y - oy) / dt;
+    }
+}
+
+
+// ============================================
+// ENEMY CAP (adaptive, partial-selection eviction)
+// ============================================
+const ENEMY_CAP_MIN = 120, ENEMY_CAP_MAX = 400;
+let enemyCap = 200;
+let frameWorkMs = 0, capAdjustTimer = 0;
+let capD2 = new Float64Array(512), capSel = new Float64Array(512);
+
+// Steps the cap once a second from the smoothed update+draw cost: shrink
+// when a frame eats most of a 60fps budget, grow only while the swarm is
+// actually at the cap and there is clear headroom.
+function adaptEnemyCap(workMs, dt) {
+    if (fixedSeed !== null) return; // frame cost would make seeded runs machine-dependent
+    frameWorkMs += (workMs - frameWorkMs) * 0.05;
+    capAdjustTimer += dt;
+    if (capAdjustTimer < 1) return;
+    capAdjustTimer = 0;
+    if (frameWorkMs > 10) enemyCap = Math.max(ENEMY_CAP_MIN, enemyCap - 20);
+    else if (frameWorkMs < 5 && enemies.length >= enemyCap) enemyCap = Math.min(quality.enemyCap, enemyCap + 20);
+}
+
+// k-th smallest (0-based) of a[0..n), reordering a in place.
+function quickselect(a, n, k) {
+    let lo = 0, hi = n - 1;
+    while (lo < hi) {
+        const pivot = a[(lo + hi) >> 1];
+        let i = lo, j = hi;
+        while (i <= j) {
+            while (a[i] < pivot) i++;
+            while (a[j] > pivot) j--;
+            if (i <= j) { const tmp = a[i]; a[i] = a[j]; a[j] = tmp; i++; j--; }
+        }
+        if (k <= j) hi = j;
+        else if (k >= i) lo = i;
+        else break;
+    }
+    return a[k];
+}
+
+// Removes the `count` non-boss enemies furthest from the player. Finds the
+// distance threshold by quickselect, then drops them in one compaction pass.
+function evictFarthest(count) {
+    const n = enemies.length;
+    if (capD2.length < n) { capD2 = new Float64Array(n * 2); capSel = new Float64Array(n * 2); }
+    for (let i = 0; i < n; i++) {
+        const e = enemies[i];
+        capD2[i] = e.isBoss ? -1 : (e.x-player.x)**2 + (e.y-player.y)**2;
+        capSel[i] = capD2[i];
+    }
+    const thr = quickselect(capSel, n, n - count);
+    if (thr < 0) return;
+    let ties = count;
+    for (let i = 0; i < n; i++) if (capD2[i] > thr) ties--;
+    let w = 0;
+    for (let i = 0; i < n; i++) {
+        const d2 = capD2[i];
+        if (d2 > thr || (d2 === thr && ties-- > 0)) { dropEnemy(enemies[i]); continue; }
+        enemies[w++] = enemies[i];
+    }
+    enemies.length = w;
+}
+
+
+// ============================================
+// QUALITY GOVERNOR (effect tiers from measured frame time)
+// ============================================
+// A rolling average of the real frame interval steps the tier down after 2s
+// of sustained slow frames and back up after a quiet spell. Each downgrade
+// doubles the quiet spell required for the next upgrade, so a device that
+// can't hold a tier settles below it instead of flapping. The tier persists
+// per device in localStorage; ?quality=high|medium|low pins it.
+const QUALITY_TIERS = [
+    { name:'high',   particles:600, particleMul:1,    dmgNums:120, glow:true,  decor:2, enemyCap:ENEMY_CAP_MAX },
+    { name:'medium', particles:300, particleMul:0.6,  dmgNums:60,  glow:true,  decor:1, enemyCap:280 },
+    { name:'low',    particles:120, particleMul:0.35, dmgNums:30,  glow:false, decor:0, enemyCap:ENEMY_CAP_MIN + 60 },
+];
+const QUALITY_DOWN_DT = 1 / 45, QUALITY_UP_DT = 1 / 55; // seconds per frame, EMA
+const QUALITY_DOWN_HOLD = 2, QUALITY_UP_HOLD_MAX = 120;
+const qualityPin = QUALITY_TIERS.findIndex(q => q.name === params.get('quality'));
+let qualityTier = qualityPin >= 0 ? qualityPin : loadQualityTier();
+let quality = QUALITY_TIERS[qualityTier];
+let qualityAvg = 1 / 60, qualityHold = 0, qualityUpHold = 8;
+
+function loadQualityTier() {
+    try { const v = parseInt(localStorage.getItem('toemarok.quality'), 10); if (v >= 0 && v < QUALITY_TIERS.length) return v; } catch (e) {}
+    return 0;
+}
+
+function setQualityTier(tier) {
+    qualityTier = tier; quality = QUALITY_TIERS[tier];
+    qualityHold = 0;
+    mapChunks.clear(); // decoration density is baked into cached chunks
+    if (fixedSeed === null) enemyCap = Math.min(enemyCap, quality.enemyCap);
+    if (IN_SIM_WORKER) return;
+    try { localStorage.setItem('toemarok.quality', String(tier)); } catch (e) {}
+    if (simWorker) simWorker.postMessage({ type: 'quality', tier });
+}
+
+function governQuality(dt) {
+    if (qualityPin >= 0) return;
+    qualityAvg += (dt - qualityAvg) * 0.05;
+    qualityHold += dt;
+    if (qualityAvg > QUALITY_DOWN_DT && qualityHold > QUALITY_DOWN_HOLD && qualityTier < QUALITY_TIERS.length - 1) {
+        qualityUpHold = Math.min(QUALITY_UP_HOLD_MAX, qualityUpHold * 2);
+        setQualityTier(qualityTier + 1);
+    } else if (qualityAvg < QUALITY_UP_DT && qualityHold > qualityUpHold && qualityTier > 0) {
+        setQualityTier(qualityTier - 1);
+    }
+}
+
+
 // ============================================
 // ENEMY AI UPDATE
 // ============================================
 function updateEnemies(dt) {
+    const soa = USE_ENEMY_SOA;
+    if (soa) moveEnemiesSoA(dt);
     for (let i = enemies.length - 1; i >= 0; i--) {
         const e = enemies[i];
         const dx = player.x - e.x, dy = player.y - e.y;
         const dist = Math.sqrt(dx*dx + dy*dy) || 1;
         const nx = dx/dist, ny = dy/dist;
-        e.timer += dt;
+        if (!soa || !e.columnar) {
+            e.timer += dt;
+            moveEnemy(e, dx, dy, dist, nx, ny, dt);
+        }
 
-        switch(e.pattern) {
-            case 'straight':
-                e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                break;
-            case 'zigzag':
-                const zig = Math.sin(e.timer * 4) * 40;
-                e.x += (nx * e.spd + Math.cos(e.angle + Math.PI/2) * zig) * dt;
-                e.y += (ny * e.spd + Math.sin(e.angle + Math.PI/2) * zig) * dt;
-                e.angle = Math.atan2(dy, dx);
-                break;
-            case 'aimed':
-                e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                break;
-            case 'swooper':
-                if (e.phase === 0) { // approach
-                    e.x += nx * e.spd * 0.3 * dt; e.y += ny * e.spd * 0.3 * dt;
-                    if (dist < 150) { e.phase = 1; e.timer = 0; }
-                } else if (e.phase === 1) { // charge!
-                    e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                    if (e.timer > 0.8) { e.phase = 2; e.timer = 0; }
-                } else { // retreat
-                    e.x -= nx * e.spd * 0.5 * dt; e.y -= ny * e.spd * 0.5 * dt;
-                    if (e.timer > 1.5) e.phase = 0;
-                }
-                break;
-            case 'tank':
+        // Collision with player
+        if (dist < e.radius + 10) {
+            damagePlayer(e.dmg);
+        }
+
+        // Remove if too far
+        const pd2 = (e.x-player.x)**2 + (e.y-player.y)**2;
+        if (pd2 > 800*800 && !e.isBoss) { dropEnemy(e); enemies.splice(i, 1); }
+    }
+}
+
+// Pattern movement for one enemy (object path; see moveEnemiesSoA for columns)
+function moveEnemy(e, dx, dy, dist, nx, ny, dt) {
+    switch(e.pattern) {
+        case 'straight':
+            e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+            break;
+        case 'zigzag':
+            const zig = Math.sin(e.timer * 4) * 40;
+            e.x += (nx * e.spd + Math.cos(e.angle + Math.PI/2) * zig) * dt;
+            e.y += (ny * e.spd + Math.sin(e.angle + Math.PI/2) * zig) * dt;
+            e.angle = Math.atan2(dy, dx);
+            break;
+        case 'aimed':
+            e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+            break;
+        case 'swooper':
+            if (e.phase === 0) { // approach
+                e.x += nx * e.spd * 0.3 * dt; e.y += ny * e.spd * 0.3 * dt;
+                if (dist < 150) { e.phase = 1; e.timer = 0; }
+            } else if (e.phase === 1) { // charge!
                 e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                break;
-            case 'sniper':
+                if (e.timer > 0.8) { e.phase = 2; e.timer = 0; }
+            } else { // retreat
+                e.x -= nx * e.spd * 0.5 * dt; e.y -= ny * e.spd * 0.5 * dt;
+                if (e.timer > 1.5) e.phase = 0;
+            }
+            break;
+        case 'tank':
+            e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+            break;
+        case 'sniper':
+            e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+            e.shootCd -= dt;
+            if (e.shootCd <= 0 && dist < 300) {
+                e.shootCd = 2.5;
+                spawnProjectile(e.x, e.y, nx*120, ny*120, e.dmg, 3, 4, '#FF4488', true);
+            }
+            break;
+        case 'formation':
+            e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+            break;
+        case 'spiral':
+            e.angle += 1.5 * dt;
+            const spiralR = Math.max(30, dist - 20 * dt);
+            e.x = player.x + Math.cos(e.angle) * spiralR;
+            e.y = player.y + Math.sin(e.angle) * spiralR;
+            break;
+        case 'boss1': // 귀왕
+            e.shootCd -= dt;
+            if (e.phase === 0) { // chase
                 e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                e.shootCd -= dt;
-                if (e.shootCd <= 0 && dist < 300) {
-                    e.shootCd = 2.5;
-                    projectiles.push({ x: e.x, y: e.y, vx: nx*120, vy: ny*120, dmg: e.dmg, life: 3, radius: 4, enemy: true, color: '#FF4488' });
+                if (e.timer > 4) { e.phase = 1; e.timer = 0; }
+            } else if (e.phase === 1) { // charge
+                e.x += nx * e.spd * 3 * dt; e.y += ny * e.spd * 3 * dt;
+                if (e.timer > 1) { e.phase = 2; e.timer = 0; }
+            } else { // summon + explode
+                if (e.timer < 0.1) {
+                    spawnParticles(e.x, e.y, '#FF4400', 15, 80);
+                    // area dmg
+                    if (dist < 80) { damagePlayer(15); }
+                    // summon
+                    for (let s = 0; s < 3; s++) spawnEnemy(0, e.x + (rand()-0.5)*60, e.y + (rand()-0.5)*60);
                 }
-                break;
-            case 'formation':
-                e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                break;
-            case 'spiral':
-                e.angle += 1.5 * dt;
-                const spiralR = Math.max(30, dist - 20 * dt);
-                e.x = player.x + Math.cos(e.angle) * spiralR;
-                e.y = player.y + Math.sin(e.angle) * spiralR;
-                break;
-            case 'boss1': // 귀왕
-                e.shootCd -= dt;
-                if (e.phase === 0) { // chase
-                    e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                    if (e.timer > 4) { e.phase = 1; e.timer = 0; }
-                } else if (e.phase === 1) { // charge
-                    e.x += nx * e.spd * 3 * dt; e.y += ny * e.spd * 3 * dt;
-                    if (e.timer > 1) { e.phase = 2; e.timer = 0; }
-                } else { // summon + explode
-                    if (e.timer < 0.1) {
-                        spawnParticles(e.x, e.y, '#FF4400', 15, 80);
-                        // area dmg
-                        if (dist < 80) { damagePlayer(15); }
-                        // summon
-                        for (let s = 0; s < 3; s++) spawnEnemy(0, e.x + (Math.random()-0.5)*60, e.y + (Math.random()-0.5)*60);
-                    }
-                    if (e.timer > 2) { e.phase = 0; e.timer = 0; }
+                if (e.timer > 2) { e.phase = 0; e.timer = 0; }
+            }
+            break;
+        case 'boss2': // 구미호왕
+            e.shootCd -= dt;
+            if (e.phase === 0) { // orbit
+                e.angle += 0.8 * dt;
+                const orb = 180;
+                e.x = player.x + Math.cos(e.angle) * orb;
+                e.y = player.y + Math.sin(e.angle) * orb;
+                if (e.shootCd <= 0) {
+                    e.shootCd = 1.5;
+                    spawnProjectile(e.x, e.y, nx*100, ny*100, e.dmg, 4, 6, '#FF6644', true).homing = true;
                 }
-                break;
-            case 'boss2': // 구미호왕
-                e.shootCd -= dt;
-                if (e.phase === 0) { // orbit
-                    e.angle += 0.8 * dt;
-                    const orb = 180;
-                    e.x = player.x + Math.cos(e.angle) * orb;
-                    e.y = player.y + Math.sin(e.angle) * orb;
-                    if (e.shootCd <= 0) {
-                        e.shootCd = 1.5;
-                        projectiles.push({ x: e.x, y: e.y, vx: nx*100, vy: ny*100, dmg: e.dmg, life: 4, radius: 6, enemy: true, color: '#FF6644', homing: true });
+                if (e.timer > 6) { e.phase = 1; e.timer = 0; }
+            } else { // fox fire field
+                e.x += nx * e.spd * 0.5 * dt; e.y += ny * e.spd * 0.5 * dt;
+                if (e.timer < 0.1) {
+                    for (let f = 0; f < 5; f++) {
+                        const fa = rand() * Math.PI * 2;
+                        const fd = 50 + rand() * 100;
+                        spawnProjectile(e.x + Math.cos(fa)*fd, e.y + Math.sin(fa)*fd, 0, 0, 8, 3, 15, '#FF4400', true).zone = true;
                     }
-                    if (e.timer > 6) { e.phase = 1; e.timer = 0; }
-                } else { // fox fire field
-                    e.x += nx * e.spd * 0.5 * dt; e.y += ny * e.spd * 0.5 * dt;
-                    if (e.timer < 0.1) {
-                        for (let f = 0; f < 5; f++) {
-                            const fa = Math.random() * Math.PI * 2;
-                            const fd = 50 + Math.random() * 100;
-                            projectiles.push({ x: e.x + Math.cos(fa)*fd, y: e.y + Math.sin(fa)*fd, vx:0, vy:0, dmg:8, life:3, radius:15, enemy:true, color:'#FF4400', zone:true });
-                        }
-                    }
-                    if (e.timer > 4) { e.phase = 0; e.timer = 0; }
                 }
-                break;
-            case 'boss3': // 도깨비왕
-                e.shootCd -= dt;
-                if (e.phase === 0) { // 땅 찍기 접근
-                    e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
-                    if (dist < 80 || e.timer > 3) { e.phase = 1; e.timer = 0; }
-                } else if (e.phase === 1) { // 방망이 내려찍기 - 충격파
-                    if (e.timer < 0.1) {
-                        spawnParticles(e.x, e.y, '#33AACC', 20, 100);
-                        screenFlash = 0.2; screenFlashColor = '#33AACC';
-                        // 충격파 대미지
-                        if (dist < 120) { damagePlayer(e.dmg); }
-                        // 돌 투사체 4방향
-                        for (let s = 0; s < 4; s++) {
-                            const sa = s * Math.PI / 2;
-                            projectiles.push({ x: e.x, y: e.y, vx: Math.cos(sa)*100, vy: Math.sin(sa)*100, dmg: e.dmg * 0.6, life: 2, radius: 8, enemy: true, color: '#8B4513' });
-                        }
+                if (e.timer > 4) { e.phase = 0; e.timer = 0; }
+            }
+            break;
+        case 'boss3': // 도깨비왕
+            e.shootCd -= dt;
+            if (e.phase === 0) { // 땅 찍기 접근
+                e.x += nx * e.spd * dt; e.y += ny * e.spd * dt;
+                if (dist < 80 || e.timer > 3) { e.phase = 1; e.timer = 0; }
+            } else if (e.phase === 1) { // 방망이 내려찍기 - 충격파
+                if (e.timer < 0.1) {
+                    spawnParticles(e.x, e.y, '#33AACC', 20, 100);
+                    screenFlash = 0.2; screenFlashColor = '#33AACC';
+                    // 충격파 대미지
+                    if (dist < 120) { damagePlayer(e.dmg); }
+                    // 돌 투사체 4방향
+                    for (let s = 0; s < 4; s++) {
+                        const sa = s * Math.PI / 2;
+                        spawnProjectile(e.x, e.y, Math.cos(sa)*100, Math.sin(sa)*100, e.dmg * 0.6, 2, 8, '#8B4513', true);
                     }
-                    if (e.timer > 1.5) { e.phase = 2; e.timer = 0; }
-                } else { // 돌진
-                    e.x += nx * e.spd * 2.5 * dt; e.y += ny * e.spd * 2.5 * dt;
-                    if (e.timer > 2) { e.phase = 0; e.timer = 0; }
                 }
-                break;
-        }
-
-        // Clamp to map
-        const mapR = 1200;
-        const eDist = Math.sqrt(e.x*e.x + e.y*e.y);
-        if (eDist > mapR) { e.x *= mapR/eDist; e.y *= mapR/eDist; }
-
-        // Collision with player
-        if (dist < e.radius + 10) {
-            damagePlayer(e.dmg);
-        }
-
-        // Remove if too far
-        const pd = Math.sqrt((e.x-player.x)**2 + (e.y-player.y)**2);
-        if (pd > 800 && !e.isBoss) { enemies.splice(i, 1); }
+                if (e.timer > 1.5) { e.phase = 2; e.timer = 0; }
+            } else { // 돌진
+                e.x += nx * e.spd * 2.5 * dt; e.y += ny * e.spd * 2.5 * dt;
+                if (e.timer > 2) { e.phase = 0; e.timer = 0; }
+            }
+            break;
     }
+
+    // Clamp to map
+    const mapR = 1200;
+    const eDist2 = e.x*e.x + e.y*e.y;
+    if (eDist2 > mapR*mapR) { const eDist = Math.sqrt(eDist2); e.x *= mapR/eDist; e.y *= mapR/eDist; }
 }
 
 function damagePlayer(dmg) {
     if (player.iframes > 0) return;
-    if (Math.random() < player.dodge) {
-        dmgNums.push({ x: player.x, y: player.y-20, val: '회피!', vy: -50, life: 0.8, color: '#88FFFF', text: true });
+    if (rand() < player.dodge) {
+        spawnDmgText(player.x, player.y-20, '회피!', '#88FFFF');
         spawnParticles(player.x, player.y, '#88FFFF', 5, 30);
         return;
     }
@@ -1177,10 +1883,12 @@ function killEnemy(idx) {
     const expVal = e.exp * player.expMul;
     const orbCount = e.isBoss ? 8 : (e.exp >= 8 ? 3 : 1);
     for (let oi = 0; oi < orbCount; oi++) {
-        orbs.push({ x: e.x + (Math.random()-0.5)*20, y: e.y + (Math.random()-0.5)*20, val: expVal/orbCount, life: 15 });
+        spawnOrb(e.x + (rand()-0.5)*20, e.y + (rand()-0.5)*20, expVal/orbCount);
     }
+    const type = e.type; // read before dropEnemy detaches the handle
+    dropEnemy(e);
     enemies.splice(idx, 1);
-    if (e.type === 99) {
+    if (type === 99) {
         saveData.totalClears++;
         if (gameTime > saveData.bestTime) saveData.bestTime = gameTime;
         if (kills > saveData.bestKills) saveData.bestKills = kills;
@@ -1213,17 +1921,13 @@ function fireWeapons(dt) {
         const baseDmg = (5 + w.level * 3) * player.atkMul;
         // Roll crit per-hit for projectiles, per-fire for instant-hit weapons
         function rollCrit() {
-            const isCrit = Math.random() < player.crit;
+            const isCrit = rand() < player.crit;
             return { dmg: isCrit ? baseDmg * 2 : baseDmg, critColor: isCrit ? '#FFDD00' : null, isCrit };
         }
         const { dmg, critColor } = rollCrit();
 
         // Find nearest enemy for targeting
-        let nearDist = Infinity, nearEnemy = null;
-        for (const e of enemies) {
-            const d = Math.sqrt((e.x-player.x)**2 + (e.y-player.y)**2);
-            if (d < nearDist) { nearDist = d; nearEnemy = e; }
-        }
+        const nearEnemy = nearest(1, player.x, player.y, Infinity, aimScratch)[0] || null;
         let aimX = 0, aimY = -1;
         if (nearEnemy) {
             const adx = nearEnemy.x - player.x, ady = nearEnemy.y - player.y;
@@ -1238,26 +1942,24 @@ function fireWeapons(dt) {
                 for (let i = 0; i < count; i++) {
                     const c = rollCrit();
                     const ang = Math.atan2(aimY, aimX) + (i - (count-1)/2) * spread;
-                    projectiles.push({ x: player.x, y: player.y, vx: Math.cos(ang)*220, vy: Math.sin(ang)*220, dmg: c.dmg, life: 1.5, radius: 8, enemy: false, color: w.evolved ? '#AA44FF' : '#FF4444', critColor: c.critColor, evolved: w.evolved });
+                    const pr = spawnProjectile(player.x, player.y, Math.cos(ang)*220, Math.sin(ang)*220, c.dmg, 1.5, 8, w.evolved ? '#AA44FF' : '#FF4444', false);
+                    pr.critColor = c.critColor; pr.evolved = w.evolved;
                 }
                 break;
             }
             case 'homing': { // 신령 방울
                 const count = Math.min(w.level, 3);
-                let targets = [...enemies].sort((a,b) => {
-                    const da = (a.x-player.x)**2+(a.y-player.y)**2;
-                    const db = (b.x-player.x)**2+(b.y-player.y)**2;
-                    return da - db;
-                }).slice(0, count);
+                const targets = nearest(count, player.x, player.y, Infinity, targetScratch);
                 for (const tgt of targets) {
                     const c = rollCrit();
                     const adx = tgt.x - player.x, ady = tgt.y - player.y;
                     const ad2 = Math.sqrt(adx*adx+ady*ady)||1;
-                    projectiles.push({ x: player.x, y: player.y, vx: adx/ad2*160, vy: ady/ad2*160, dmg: c.dmg, life: 2, radius: 7, enemy: false, color: '#FFD700', homing: true, target: tgt, critColor: c.critColor });
+                    const pr = spawnProjectile(player.x, player.y, adx/ad2*160, ady/ad2*160, c.dmg, 2, 7, '#FFD700', false);
+                    pr.homing = true; pr.target = tgt; pr.critColor = c.critColor;
                 }
                 if (targets.length === 0 && nearEnemy) {
                     const c = rollCrit();
-                    projectiles.push({ x: player.x, y: player.y, vx: aimX*160, vy: aimY*160, dmg: c.dmg, life: 2, radius: 7, enemy: false, color: '#FFD700', critColor: c.critColor });
+                    spawnProjectile(player.x, player.y, aimX*160, aimY*160, c.dmg, 2, 7, '#FFD700', false).critColor = c.critColor;
                 }
                 break;
             }
@@ -1269,15 +1971,13 @@ function fireWeapons(dt) {
                 const orbSpd = 3 + w.level * 0.5; // rotation speed
                 for (let oi = 0; oi < orbCount; oi++) {
                     const baseAngle = oi * (Math.PI * 2 / orbCount);
-                    projectiles.push({
-                        x: player.x + Math.cos(baseAngle) * orbRadius,
-                        y: player.y + Math.sin(baseAngle) * orbRadius,
-                        vx: 0, vy: 0, dmg: orbDmg, life: cd * 0.95,
-                        radius: w.evolved ? 14 : 10, enemy: false,
-                        color: '#8B4513', critColor,
-                        orbital: true, orbAngle: baseAngle, orbRadius, orbSpd,
-                        orbOwner: player, knockback: w.evolved || w.level >= 4
-                    });
+                    const pr = spawnProjectile(
+                        player.x + Math.cos(baseAngle) * orbRadius,
+                        player.y + Math.sin(baseAngle) * orbRadius,
+                        0, 0, orbDmg, cd * 0.95, w.evolved ? 14 : 10, '#8B4513', false);
+                    pr.critColor = critColor;
+                    pr.orbital = true; pr.orbAngle = baseAngle; pr.orbRadius = orbRadius; pr.orbSpd = orbSpd;
+                    pr.orbOwner = player; pr.knockback = w.evolved || w.level >= 4;
                 }
                 break;
             }
@@ -1286,28 +1986,30 @@ function fireWeapons(dt) {
                 const zoneR = (15 + w.level * 5) * player.rangeMul;
                 if (w.evolved) {
                     for (let i = 0; i < 9; i++) {
-                        const a = t * 1.5 + i * (Math.PI*2/9);
+                        const a = gameTime * 1.5 + i * (Math.PI*2/9);
                         const zx = player.x + Math.cos(a) * 60;
                         const zy = player.y + Math.sin(a) * 60;
-                        projectiles.push({ x: zx, y: zy, vx:0, vy:0, dmg: dmg*0.6, life: cd * 0.9, radius: zoneR, enemy: false, color: '#FF4400', zone: true, critColor });
+                        const pr = spawnProjectile(zx, zy, 0, 0, dmg*0.6, cd * 0.9, zoneR, '#FF4400', false);
+                        pr.zone = true; pr.critColor = critColor;
                     }
                 } else {
                     for (let i = 0; i < count; i++) {
-                        const zx = player.x + (Math.random()-0.5)*100;
-                        const zy = player.y + (Math.random()-0.5)*100;
-                        projectiles.push({ x: zx, y: zy, vx:0, vy:0, dmg: dmg*0.5, life: cd * 0.9, radius: zoneR, enemy: false, color: '#FF6600', zone: true, critColor });
+                        const zx = player.x + (rand()-0.5)*100;
+                        const zy = player.y + (rand()-0.5)*100;
+                        const pr = spawnProjectile(zx, zy, 0, 0, dmg*0.5, cd * 0.9, zoneR, '#FF6600', false);
+                        pr.zone = true; pr.critColor = critColor;
                     }
                 }
                 break;
             }
             case 'thunder': { // 천둥
                 const count = w.evolved ? 5 : Math.min(w.level, 3);
-                let targets2 = [...enemies].sort(() => Math.random()-0.5).slice(0, count);
+                const targets2 = sampleRandom(count, targetScratch);
                 let lastX = player.x, lastY = player.y;
                 for (const tgt of targets2) {
                     const c = rollCrit();
                     tgt.hp -= c.dmg;
-                    spawnDmgNum(tgt.x, tgt.y - 10, c.dmg, c.critColor || '#FFDD00', c.isCrit);
+                    spawnDmgNum(tgt.x, tgt.y - 10, c.dmg, c.critColor || '#FFDD00', c.isCrit, tgt.uid);
                     spawnParticles(tgt.x, tgt.y, '#FFDD00', 5, 50);
                     if (w.evolved && !tgt.slowed) { tgt.slowed = 1.5; tgt.origSpd = tgt.spd; tgt.spd *= 0.5; }
                     lastX = tgt.x; lastY = tgt.y;
@@ -1320,7 +2022,8 @@ function fireWeapons(dt) {
                 for (let i = 0; i < count; i++) {
                     const c = rollCrit();
                     const ang2 = Math.atan2(aimY, aimX) + (i - (count-1)/2) * spread2;
-                    projectiles.push({ x: player.x, y: player.y, vx: Math.cos(ang2)*300, vy: Math.sin(ang2)*300, dmg: c.dmg, life: 2, radius: 6, enemy: false, color: '#88CCFF', pierce: w.level >= 5 ? 999 : w.level, critColor: c.critColor });
+                    const pr = spawnProjectile(player.x, player.y, Math.cos(ang2)*300, Math.sin(ang2)*300, c.dmg, 2, 6, '#88CCFF', false);
+                    pr.pierce = w.level >= 5 ? 999 : w.level; pr.critColor = c.critColor;
                 }
                 break;
             }
@@ -1330,20 +2033,20 @@ function fireWeapons(dt) {
                 const baseAng = Math.atan2(aimY, aimX);
                 if (w.evolved) {
                     // 청룡 - dragon projectile across screen
-                    projectiles.push({ x: player.x, y: player.y, vx: aimX*250, vy: aimY*250, dmg: dmg*3, life: 3, radius: 20, enemy: false, color: '#00AAFF', pierce: 999, critColor });
+                    const pr = spawnProjectile(player.x, player.y, aimX*250, aimY*250, dmg*3, 3, 20, '#00AAFF', false);
+                    pr.pierce = 999; pr.critColor = critColor;
                     spawnParticles(player.x, player.y, '#00AAFF', 10, 80);
                 } else {
-                    for (const e of enemies) {
+                    for (const e of queryEnemies(player.x, player.y, range2, hitScratch)) {
                         const edx2 = e.x - player.x, edy2 = e.y - player.y;
-                        const ed2 = Math.sqrt(edx2*edx2 + edy2*edy2);
-                        if (ed2 > range2) continue;
+                        if (edx2*edx2 + edy2*edy2 > range2*range2) continue;
                         const ea2 = Math.atan2(edy2, edx2);
                         let diff2 = ea2 - baseAng;
                         while(diff2<-Math.PI) diff2+=Math.PI*2;
                         while(diff2>Math.PI) diff2-=Math.PI*2;
                         if (Math.abs(diff2) <= arcAngle2) {
                             e.hp -= dmg * 0.7;
-                            spawnDmgNum(e.x, e.y-10, dmg*0.7, critColor || '#FF4400');
+                            spawnDmgNum(e.x, e.y-10, dmg*0.7, critColor || '#FF4400', false, e.uid);
                             if (w.level >= 3) { e.burnTimer = 2; e.burnDmg = dmg * 0.2; }
                         }
                     }
@@ -1354,10 +2057,9 @@ function fireWeapons(dt) {
             case 'slash': { // 귀살검
                 const range3 = (35 + w.level * 8) * player.rangeMul;
                 // Front slash
-                for (const e of enemies) {
+                for (const e of queryEnemies(player.x, player.y, range3, hitScratch)) {
                     const edx3 = e.x - player.x, edy3 = e.y - player.y;
-                    const ed3 = Math.sqrt(edx3*edx3 + edy3*edy3);
-                    if (ed3 > range3) continue;
+                    if (edx3*edx3 + edy3*edy3 > range3*range3) continue;
                     const ea3 = Math.atan2(edy3, edx3);
                     const baseA = Math.atan2(aimY, aimX);
                     let diff3 = ea3 - baseA;
@@ -1365,12 +2067,12 @@ function fireWeapons(dt) {
                     while(diff3>Math.PI) diff3-=Math.PI*2;
                     if (Math.abs(diff3) <= Math.PI/2) {
                         e.hp -= dmg;
-                        spawnDmgNum(e.x, e.y-10, dmg, critColor || '#AAAAFF');
+                        spawnDmgNum(e.x, e.y-10, dmg, critColor || '#AAAAFF', false, e.uid);
                     }
                     // Back slash at lv5
                     if (w.level >= 5 && Math.abs(diff3) > Math.PI/2) {
                         e.hp -= dmg * 0.6;
-                        spawnDmgNum(e.x, e.y-10, dmg*0.6, critColor || '#8888CC');
+                        spawnDmgNum(e.x, e.y-10, dmg*0.6, critColor || '#8888CC', false, e.uid);
                     }
                 }
                 spawnParticles(player.x + aimX*15, player.y + aimY*15, '#AAAAFF', 4, 35);
@@ -1381,37 +2083,145 @@ function fireWeapons(dt) {
 }
 
 
+// ============================================
+// SPATIAL HASH (enemy broad-phase, rebuilt once per frame)
+// ============================================
+const GRID_CELL = 24; // ~ typical enemy radius (8-12) + projectile radius (6-8)
+const enemyGrid = new Map(); // cell key -> enemies whose centre lies in that cell
+const gridUsed = []; // cells filled this frame, so clearing skips empty ones
+let gridMaxR = 0; // largest enemy radius in the grid (bosses are 30-35)
+const hitScratch = [], blastScratch = [];
+
+function gridKey(cx, cy) { return (cx + 0x8000) * 0x10000 + (cy + 0x8000); }
+
+function rebuildEnemyGrid() {
+    for (const cell of gridUsed) cell.length = 0;
+    gridUsed.length = 0;
+    gridMaxR = 0;
+    for (const e of enemies) {
+        const k = gridKey(Math.floor(e.x / GRID_CELL), Math.floor(e.y / GRID_CELL));
+        let cell = enemyGrid.get(k);
+        if (!cell) { cell = []; enemyGrid.set(k, cell); }
+        if (cell.length === 0) gridUsed.push(cell);
+        cell.push(e);
+        if (e.radius > gridMaxR) gridMaxR = e.radius;
+    }
+}
+
+// Collects every enemy that could overlap a circle of radius r at (x, y)
+// into `out` (reused between calls). Callers still do the exact test.
+function queryEnemies(x, y, r, out) {
+    out.length = 0;
+    const reach = r + gridMaxR;
+    const x0 = Math.floor((x - reach) / GRID_CELL), x1 = Math.floor((x + reach) / GRID_CELL);
+    const y0 = Math.floor((y - reach) / GRID_CELL), y1 = Math.floor((y + reach) / GRID_CELL);
+    for (let cy = y0; cy <= y1; cy++) {
+        for (let cx = x0; cx <= x1; cx++) {
+            const cell = enemyGrid.get(gridKey(cx, cy));
+            if (!cell) continue;
+            for (let k = 0; k < cell.length; k++) out.push(cell[k]);
+        }
+    }
+    return out;
+}
+
+
+// ============================================
+// TARGETING (no copies or full sorts of enemies)
+// ============================================
+const aimScratch = [], targetScratch = [], rangeScratch = [];
+const nearD2 = [], swapScratch = [];
+
+// Up to k enemies closest to (x, y) within maxRange, nearest first, written
+// into `out`. Keeps a sorted top-k while scanning instead of sorting everyone;
+// a finite maxRange narrows the scan to the spatial hash cells it covers.
+function nearest(k, x, y, maxRange, out) {
+    out.length = 0;
+    if (k <= 0) return out;
+    const maxR2 = maxRange * maxRange;
+    const pool = maxR2 < Infinity ? queryEnemies(x, y, maxRange, rangeScratch) : enemies;
+    for (let i = 0; i < pool.length; i++) {
+        const e = pool[i];
+        const d2 = (e.x-x)**2 + (e.y-y)**2;
+        if (d2 > maxR2) continue;
+        if (out.length === k && d2 >= nearD2[k-1]) continue;
+        let j = out.length < k ? out.length : k - 1;
+        while (j > 0 && nearD2[j-1] > d2) { out[j] = out[j-1]; nearD2[j] = nearD2[j-1]; j--; }
+        out[j] = e; nearD2[j] = d2;
+    }
+    return out;
+}
+
+// k distinct enemies picked uniformly at random, written into `out`.
+// Partial Fisher-Yates over the live array, then the swaps are undone so
+// enemy order (and therefore draw order) is left untouched.
+function sampleRandom(k, out) {
+    out.length = 0;
+    const n = enemies.length;
+    const m = Math.min(k, n);
+    for (let i = 0; i < m; i++) {
+        const j = i + Math.floor(rand() * (n - i));
+        const tmp = enemies[i]; enemies[i] = enemies[j]; enemies[j] = tmp;
+        swapScratch[i] = j;
+        out.push(enemies[i]);
+    }
+    for (let i = m - 1; i >= 0; i--) {
+        const j = swapScratch[i];
+        const tmp = enemies[i]; enemies[i] = enemies[j]; enemies[j] = tmp;
+    }
+    return out;
+}
+
+
 // ============================================
 // PROJECTILE UPDATE
 // ============================================
+// Returned when the projectile cap is hit, so callers can still set fields;
+// it is never added to the live list.
+const overflowProjectile = {};
+
+// Pooled projectile with every field reset, so recycled objects carry no
+// state from their previous use. Callers set optional fields afterwards.
+function spawnProjectile(x, y, vx, vy, dmg, life, radius, color, enemy) {
+    const full = projectiles.length >= POOL_CAP.projectile;
+    const p = full ? overflowProjectile : poolObtain('projectile');
+    p.x = x; p.y = y; p.ox = x; p.oy = y; p.vx = vx; p.vy = vy; p.dmg = dmg; p.life = life; p.radius = radius;
+    p.color = color; p.enemy = enemy; p.critColor = null; p.evolved = false;
+    p.homing = false; p.target = null; p.zone = false; p.pierce = 0;
+    p.orbital = false; p.orbAngle = 0; p.orbRadius = 0; p.orbSpd = 0; p.orbOwner = null;
+    p.knockback = false; p._tick = null; p._ptick = 0;
+    if (!full) projectiles.push(p);
+    return p;
+}
 function updateProjectiles(dt) {
     for (let i = projectiles.length - 1; i >= 0; i--) {
         const p = projectiles[i];
         p.life -= dt;
-        if (p.life <= 0) { projectiles.splice(i, 1); continue; }
+        if (p.life <= 0) continue;
 
         if (p.zone) {
             // Zone damage tick
             if (!p.enemy) {
-                for (let j = enemies.length - 1; j >= 0; j--) {
-                    const e = enemies[j];
-                    const d = Math.sqrt((e.x-p.x)**2+(e.y-p.y)**2);
-                    if (d < p.radius + e.radius) {
+                const near = queryEnemies(p.x, p.y, p.radius, hitScratch);
+                for (let j = 0; j < near.length; j++) {
+                    const e = near[j];
+                    const rr = p.radius + e.radius;
+                    if ((e.x-p.x)**2+(e.y-p.y)**2 < rr*rr) {
                         if (!p._tick) p._tick = {};
                         const eid = e.uid;
-                        if (!p._tick[eid] || p._tick[eid] < t - 0.3) {
-                            p._tick[eid] = t;
+                        if (!p._tick[eid] || p._tick[eid] < gameTime - 0.3) {
+                            p._tick[eid] = gameTime;
                             e.hp -= p.dmg;
-                            spawnDmgNum(e.x, e.y-10, p.dmg, p.critColor || p.color);
+                            spawnDmgNum(e.x, e.y-10, p.dmg, p.critColor || p.color, false, e.uid);
                         }
                     }
                 }
             } else {
                 // Enemy zone: deal tick damage every 0.5s instead of per-frame
-                const d = Math.sqrt((player.x-p.x)**2+(player.y-p.y)**2);
-                if (d < p.radius + 10) {
-                    if (!p._ptick || p._ptick < t - 0.5) {
-                        p._ptick = t;
+                const pr = p.radius + 10;
+                if ((player.x-p.x)**2+(player.y-p.y)**2 < pr*pr) {
+                    if (!p._ptick || p._ptick < gameTime - 0.5) {
+                        p._ptick = gameTime;
                         damagePlayer(p.dmg);
                     }
                 }
@@ -1425,17 +2235,18 @@ function updateProjectiles(dt) {
             p.x = player.x + Math.cos(p.orbAngle) * p.orbRadius;
             p.y = player.y + Math.sin(p.orbAngle) * p.orbRadius;
             // Hit enemies
-            for (let j = enemies.length - 1; j >= 0; j--) {
-                const e = enemies[j];
-                const d = Math.sqrt((e.x-p.x)**2+(e.y-p.y)**2);
-                if (d < p.radius + e.radius) {
+            const near = queryEnemies(p.x, p.y, p.radius, hitScratch);
+            for (let j = 0; j < near.length; j++) {
+                const e = near[j];
+                const rr = p.radius + e.radius;
+                if ((e.x-p.x)**2+(e.y-p.y)**2 < rr*rr) {
                     if (!p._tick) p._tick = {};
                     const eid = e.uid;
-                    if (!p._tick[eid] || p._tick[eid] < t - 0.25) {
-                        p._tick[eid] = t;
+                    if (!p._tick[eid] || p._tick[eid] < gameTime - 0.25) {
+                        p._tick[eid] = gameTime;
                         e.hp -= p.dmg;
                         e.hitFlash = 0.15;
-                        spawnDmgNum(e.x, e.y-10, p.dmg, p.critColor || '#8B4513');
+                        spawnDmgNum(e.x, e.y-10, p.dmg, p.critColor || '#8B4513', false, e.uid);
                         spawnParticles(e.x, e.y, '#CD853F', 2, 25);
                         if (p.knockback) {
                             const kx = e.x - player.x, ky = e.y - player.y;
@@ -1453,11 +2264,7 @@ function updateProjectiles(dt) {
             // Check if target is still alive
             if (p.target.hp <= 0 || !enemies.includes(p.target)) {
                 // Retarget to nearest enemy
-                let nd = Infinity; p.target = null;
-                for (const e of enemies) {
-                    const d2 = (e.x-p.x)**2+(e.y-p.y)**2;
-                    if (d2 < nd) { nd = d2; p.target = e; }
-                }
+                p.target = nearest(1, p.x, p.y, Infinity, aimScratch)[0] || null;
             }
             if (p.target) {
                 const tdx = p.target.x - p.x, tdy = p.target.y - p.y;
@@ -1476,38 +2283,40 @@ function updateProjectiles(dt) {
         p.x += p.vx * dt; p.y += p.vy * dt;
 
         if (p.enemy) {
-            const d = Math.sqrt((player.x-p.x)**2+(player.y-p.y)**2);
-            if (d < p.radius + 10) {
+            const pr = p.radius + 10;
+            if ((player.x-p.x)**2+(player.y-p.y)**2 < pr*pr) {
                 damagePlayer(p.dmg);
-                projectiles.splice(i, 1);
+                p.life = 0;
             }
         } else {
-            for (let j = enemies.length - 1; j >= 0; j--) {
-                const e = enemies[j];
-                const d = Math.sqrt((e.x-p.x)**2+(e.y-p.y)**2);
-                if (d < p.radius + e.radius) {
+            const near = queryEnemies(p.x, p.y, p.radius, hitScratch);
+            for (let j = 0; j < near.length; j++) {
+                const e = near[j];
+                const rr = p.radius + e.radius;
+                if ((e.x-p.x)**2+(e.y-p.y)**2 < rr*rr) {
                     e.hp -= p.dmg;
                     e.hitFlash = 0.15;
-                    spawnDmgNum(e.x, e.y - 10, p.dmg, p.critColor || p.color);
+                    spawnDmgNum(e.x, e.y - 10, p.dmg, p.critColor || p.color, false, e.uid);
                     spawnParticles(e.x, e.y, p.color, 3, 30);
                     if (p.evolved) { // 봉인진 - kill explosion
                         if (e.hp <= 0) {
-                            for (const e2 of enemies) {
-                                const dd = Math.sqrt((e2.x-e.x)**2+(e2.y-e.y)**2);
-                                if (dd < 50 && e2 !== e) {
+                            const blast = queryEnemies(e.x, e.y, 50, blastScratch);
+                            for (const e2 of blast) {
+                                if ((e2.x-e.x)**2+(e2.y-e.y)**2 < 2500 && e2 !== e) {
                                     e2.hp -= p.dmg * 0.5;
-                                    spawnDmgNum(e2.x, e2.y-10, p.dmg*0.5, '#AA44FF');
+                                    spawnDmgNum(e2.x, e2.y-10, p.dmg*0.5, '#AA44FF', false, e2.uid);
                                 }
                             }
                             spawnParticles(e.x, e.y, '#AA44FF', 8, 50);
                         }
                     }
-                    if (p.pierce) { p.pierce--; if (p.pierce <= 0) { projectiles.splice(i, 1); break; } }
-                    else { projectiles.splice(i, 1); break; }
+                    if (p.pierce) { p.pierce--; if (p.pierce <= 0) { p.life = 0; break; } }
+                    else { p.life = 0; break; }
                 }
             }
         }
     }
+    compactLive(projectiles, 'projectile');
     // Check dead enemies
     for (let j = enemies.length - 1; j >= 0; j--) {
         if (enemies[j].hp <= 0) killEnemy(j);
@@ -1517,32 +2326,118 @@ function updateProjectiles(dt) {
 // ============================================
 // EXP/ORB SYSTEM
 // ============================================
+// Orbs live in a persistent bucket grid, so the magnet pass only visits
+// buckets within pickup range of the player. Expiry is checked once a
+// second. Beyond ORB_MERGE_AT live orbs, the sweep also folds each bucket
+// into one orb with the summed exp; an orb's tier (and look) follows its
+// value. All pickups in a tick add up to one exp gain, one sound and at
+// most one level-up.
+const ORB_CELL = 64, ORB_LIFE = 15, ORB_MERGE_AT = 300;
+const ORB_TIER_VAL = [20, 80]; // values at which an orb becomes tier 1 / tier 2
+const orbGrid = new Map(); // gridKey(cell) -> orbs whose centre is in it
+let orbSweepTimer = 0, orbTick = 0;
+
+function orbTier(val) { return val >= ORB_TIER_VAL[1] ? 2 : val >= ORB_TIER_VAL[0] ? 1 : 0; }
+
+function orbCellAdd(o) {
+    const k = gridKey(Math.floor(o.x / ORB_CELL), Math.floor(o.y / ORB_CELL));
+    let b = orbGrid.get(k);
+    if (!b) { b = []; orbGrid.set(k, b); }
+    o.cell = k; o.bi = b.length;
+    b.push(o);
+}
+
+function orbCellRemove(o) {
+    const b = orbGrid.get(o.cell);
+    const last = b.pop();
+    if (last !== o) { b[o.bi] = last; last.bi = o.bi; }
+}
+
+function resetOrbs() {
+    releaseAll(orbs, 'orb');
+    orbGrid.clear();
+    orbSweepTimer = 0;
+}
+
 function updateOrbs(dt) {
-    for (let i = orbs.length - 1; i >= 0; i--) {
-        const o = orbs[i];
-        o.life -= dt;
-        if (o.life <= 0) { orbs.splice(i, 1); continue; }
-        const dx = player.x - o.x, dy = player.y - o.y;
-        const d = Math.sqrt(dx*dx+dy*dy);
-        const pickupR = player.range * player.rangeMul;
-        if (d < pickupR) {
-            const spd = 300;
-            o.x += (dx/d) * spd * dt; o.y += (dy/d) * spd * dt;
-        }
-        if (d < 12) {
-            player.exp += o.val;
-            playSound('pickup');
-            orbs.splice(i, 1);
-            if (player.exp >= player.expToNext) {
-                player.exp -= player.expToNext;
-                player.level++;
-                player.expToNext = player.level * 10 + Math.pow(player.level, 1.5) * 5;
-                playSound('levelup');
-                spawnParticles(player.x, player.y, '#FFD700', 15, 60);
-                showLevelUp();
+    const pickupR = player.range * player.rangeMul, pr2 = pickupR * pickupR;
+    let gained = 0, died = false;
+    orbTick++;
+    const x0 = Math.floor((player.x - pickupR) / ORB_CELL), x1 = Math.floor((player.x + pickupR) / ORB_CELL);
+    const y0 = Math.floor((player.y - pickupR) / ORB_CELL), y1 = Math.floor((player.y + pickupR) / ORB_CELL);
+    for (let cy = y0; cy <= y1; cy++) {
+        for (let cx = x0; cx <= x1; cx++) {
+            const b = orbGrid.get(gridKey(cx, cy));
+            if (!b) continue;
+            // Backwards: removals swap the bucket's last orb into slot i
+            for (let i = b.length - 1; i >= 0; i--) {
+                const o = b[i];
+                if (o.moved === orbTick || o.expire <= gameTime) continue;
+                const dx = player.x - o.x, dy = player.y - o.y;
+                const d2 = dx*dx + dy*dy;
+                if (d2 >= pr2) continue;
+                if (d2 < 144) { gained += o.val; o.life = 0; orbCellRemove(o); died = true; continue; }
+                const d = Math.sqrt(d2), spd = 300;
+                o.x += (dx/d) * spd * dt; o.y += (dy/d) * spd * dt;
+                o.moved = orbTick; // may land in a bucket not yet visited this tick
+                const k = gridKey(Math.floor(o.x / ORB_CELL), Math.floor(o.y / ORB_CELL));
+                if (k !== o.cell) { orbCellRemove(o); orbCellAdd(o); }
             }
         }
     }
+    orbSweepTimer += dt;
+    if (orbSweepTimer >= 1) {
+        orbSweepTimer = 0;
+        for (const o of orbs) {
+            if (o.life > 0 && o.expire <= gameTime) { o.life = 0; orbCellRemove(o); died = true; }
+        }
+        if (orbs.length > ORB_MERGE_AT && mergeOrbs()) died = true;
+    }
+    if (died) compactLive(orbs, 'orb');
+    if (gained > 0) {
+        player.exp += gained;
+        playSound('pickup');
+    }
+    // Checked every tick: a big merged orb can leave enough exp for several
+    // levels, taken one per tick once the previous level-up is resolved.
+    if (player.exp >= player.expToNext) {
+        player.exp -= player.expToNext;
+        player.level++;
+        player.expToNext = player.level * 10 + Math.pow(player.level, 1.5) * 5;
+        playSound('levelup');
+        spawnParticles(player.x, player.y, '#FFD700', 15, 60);
+        showLevelUp();
+    }
+}
+
+// Folds every multi-orb bucket into its first orb, placed at the
+// value-weighted centre (which stays inside the bucket's cell).
+function mergeOrbs() {
+    let merged = false;
+    for (const b of orbGrid.values()) {
+        if (b.length < 2) continue;
+        const keep = b[0];
+        let val = keep.val, sx = keep.x * keep.val, sy = keep.y * keep.val, expire = keep.expire;
+        for (let j = 1; j < b.length; j++) {
+            const o = b[j];
+            val += o.val; sx += o.x * o.val; sy += o.y * o.val;
+            if (o.expire > expire) expire = o.expire;
+            o.life = 0;
+        }
+        keep.x = sx / val; keep.y = sy / val; keep.val = val; keep.tier = orbTier(val); keep.expire = expire;
+        b.length = 1;
+        merged = true;
+    }
+    return merged;
+}
+
+function spawnOrb(x, y, val) {
+    // At the cap, fold the exp into the newest orb rather than lose it
+    if (orbs.length >= POOL_CAP.orb) { const last = orbs[orbs.length - 1]; last.val += val; last.tier = orbTier(last.val); return; }
+    const o = poolObtain('orb');
+    o.x = x; o.y = y; o.val = val; o.tier = orbTier(val); o.life = 1; o.expire = gameTime + ORB_LIFE; o.moved = 0;
+    orbCellAdd(o);
+    orbs.push(o);
 }
 
 // ============================================
@@ -1583,7 +2478,7 @@ function showLevelUp() {
     }
 
     // Shuffle and pick 3
-    for (let i = pool.length - 1; i > 0; i--) { const j = Math.floor(Math.random()*(i+1)); [pool[i],pool[j]]=[pool[j],pool[i]]; }
+    for (let i = pool.length - 1; i > 0; i--) { const j = Math.floor(rand()*(i+1)); [pool[i],pool[j]]=[pool[j],pool[i]]; }
     // Prioritize evolutions
     pool.sort((a,b) => (b.evo?1:0) - (a.evo?1:0));
     levelUpChoices = pool.slice(0, 3);
@@ -1673,13 +2568,131 @@ document.addEventListener('keydown', e2 => {
     }
     if (state === 'title' && (e2.key === 'Enter' || e2.key === ' ')) { state = 'charSelect'; }
     if (state === 'gameOver' && e2.key === 'Enter') { initGame(); }
+    if (e2.key === 'F3' || e2.key === '`') { e2.preventDefault(); profToggle(!profOn); }
+    if (profOn && (e2.key === 'p' || e2.key === 'P')) profExport();
 });
 
 
+// ============================================
+// PROFILER (?prof=1 or F3 to toggle, P to export)
+// ============================================
+// Stage timings go into per-frame accumulators and then into ring buffers.
+// Every hook is guarded by `if (profOn)`. Draw-call counters are wrappers
+// installed on the main context only while the profiler is on.
+const PROF_STAGES = ['player', 'spawn', 'enemies', 'grid', 'weapons', 'projectiles', 'orbs', 'particles', 'dmgNums',
+    'drawMap', 'drawOrbs', 'drawProj', 'drawEnemies', 'drawFx', 'drawHud', 'frame'];
+const PS = {}; PROF_STAGES.forEach((s, i) => { PS[s] = i; });
+const PROF_ENTITIES = ['enemies', 'projectiles', 'orbs', 'particles', 'dmgNums'];
+const PROF_ENTITY_TAGS = ['en', 'pj', 'orb', 'fx', 'num'];
+const PROF_DRAW_OPS = ['fillRect', 'strokeRect', 'clearRect', 'fill', 'stroke', 'drawImage', 'fillText', 'strokeText'];
+const PROF_FRAMES = 1800; // ring length: 30s at 60fps
+const PROF_WINDOW = 120; // frames summarised by the overlay
+const mainCtx = ctx;
+let profOn = false;
+let profIdx = 0, profCount = 0, profDrawCalls = 0, profFrameT0 = 0, profTextAge = 0;
+let profRing = null, profAcc = null, profScratch = null;
+let profLines = [];
+
+function profToggle(on) {
+    profOn = on;
+    if (on && !profRing) {
+        profRing = {
+            stage: PROF_STAGES.map(() => new Float32Array(PROF_FRAMES)),
+            entity: PROF_ENTITIES.map(() => new Uint16Array(PROF_FRAMES)),
+            dt: new Float32Array(PROF_FRAMES), calls: new Uint32Array(PROF_FRAMES),
+        };
+        profAcc = new Float64Array(PROF_STAGES.length);
+        profScratch = new Float64Array(PROF_WINDOW);
+    }
+    const proto = Object.getPrototypeOf(mainCtx);
+    for (const op of PROF_DRAW_OPS) {
+        if (!on) { delete mainCtx[op]; continue; }
+        const fn = proto[op];
+        if (typeof fn === 'function') mainCtx[op] = function () { profDrawCalls++; return fn.apply(this, arguments); };
+    }
+    profTextAge = 0;
+}
+
+function profLap(stage, t0) { const now = performance.now(); profAcc[stage] += now - t0; return now; }
+
+function profEndFrame(dt) {
+    const i = profIdx;
+    profAcc[PS.frame] = performance.now() - profFrameT0;
+    for (let s = 0; s < PROF_STAGES.length; s++) { profRing.stage[s][i] = profAcc[s]; profAcc[s] = 0; }
+    const live = [enemies ? enemies.length : 0, projectiles.length, orbs.length, particles.length, dmgNums.length];
+    for (let k = 0; k < live.length; k++) profRing.entity[k][i] = live[k];
+    profRing.dt[i] = dt; profRing.calls[i] = profDrawCalls;
+    profDrawCalls = 0;
+    profIdx = (i + 1) % PROF_FRAMES;
+    if (profCount < PROF_FRAMES) profCount++;
+}
+
+// avg and p95 of the last `n` samples of a ring
+function profStat(ring, n) {
+    let sum = 0;
+    for (let j = 0; j < n; j++) { const v = ring[(profIdx - 1 - j + PROF_FRAMES) % PROF_FRAMES]; profScratch[j] = v; sum += v; }
+    const s = profScratch.subarray(0, n).sort();
+    return { avg: n ? sum / n : 0, p95: n ? s[Math.min(n - 1, Math.floor(n * 0.95))] : 0 };
+}
+
+function drawProfiler() {
+    const n = Math.min(profCount, PROF_WINDOW);
+    if (n === 0) return;
+    // Text is rebuilt a few times a second; the FPS graph every frame.
+    if (--profTextAge <= 0) {
+        profTextAge = 15;
+        const dt = profStat(profRing.dt, n), calls = profStat(profRing.calls, n);
+        profLines = [`FPS ${(1 / Math.max(dt.avg, 1e-6)).toFixed(1)}  calls ${calls.avg | 0}/${calls.p95 | 0}  q:${quality.name}`, 'stage        avg   p95 ms'];
+        for (let s = 0; s < PROF_STAGES.length; s++) {
+            const st = profStat(profRing.stage[s], n);
+            if (st.p95 < 0.005 && s !== PS.frame) continue;
+            profLines.push(`${PROF_STAGES[s].padEnd(11)}${st.avg.toFixed(2).padStart(6)}${st.p95.toFixed(2).padStart(6)}`);
+        }
+        const last = (profIdx - 1 + PROF_FRAMES) % PROF_FRAMES;
+        profLines.push(PROF_ENTITY_TAGS.map((k, i) => k + profRing.entity[i][last]).join(' '));
+    }
+    const bx = 4, by = 24, bw = 150, lh = 9, gh = 30;
+    ctx.globalAlpha = 0.75;
+    px(bx, by, bw, profLines.length * lh + gh + 8, '#000');
+    ctx.globalAlpha = 1;
+    for (let i = 0; i < profLines.length; i++) txt(profLines[i], bx + 3, by + 3 + i * lh, i < 2 ? '#FFD700' : '#CCC', 7, 'left');
+    // Frame-time graph, one bar per frame; the line marks 16.7ms.
+    const gy = by + 5 + profLines.length * lh + gh;
+    for (let j = 0; j < n && j < bw - 6; j++) {
+        const v = profRing.stage[PS.frame][(profIdx - 1 - j + PROF_FRAMES) % PROF_FRAMES];
+        const h = Math.min(gh, v / 33.3 * gh);
+        px(bx + bw - 4 - j, gy - h, 1, h, v > 16.7 ? '#FF4444' : '#44DD44');
+    }
+    px(bx + 3, gy - gh / 2, bw - 6, 1, '#888');
+}
+
+// Samples in chronological order; downloaded as JSON in the browser.
+function profExport() {
+    const n = profCount, start = (profIdx - n + PROF_FRAMES) % PROF_FRAMES;
+    const seq = (ring) => { const a = new Array(n); for (let j = 0; j < n; j++) a[j] = +ring[(start + j) % PROF_FRAMES].toFixed(3); return a; };
+    const out = {
+        frames: n, gameTime, state, enemyCap, quality: quality.name, seed: runSeed, userAgent: navigator.userAgent,
+        dt: seq(profRing.dt), drawCalls: seq(profRing.calls), stages: {}, entities: {},
+    };
+    PROF_STAGES.forEach((s, i) => { out.stages[s] = seq(profRing.stage[i]); });
+    PROF_ENTITIES.forEach((k, i) => { out.entities[k] = seq(profRing.entity[i]); });
+    if (typeof URL !== 'undefined' && URL.createObjectURL) {
+        const a = document.createElement('a');
+        a.href = URL.createObjectURL(new Blob([JSON.stringify(out)], { type: 'application/json' }));
+        a.download = `toemarok-profile-${Date.now()}.json`;
+        a.click();
+        setTimeout(() => URL.revokeObjectURL(a.href), 1000);
+    }
+    return out;
+}
+
+if (params.get('prof') === '1' && !IN_SIM_WORKER) profToggle(true);
+
 // ============================================
 // MAIN UPDATE
 // ============================================
-function update(dt) {
+function update(dt, input) {
+    let pt = profOn ? performance.now() : 0;
     gameTime += dt;
     player.iframes = Math.max(0, player.iframes - dt);
     bombCooldown = Math.max(0, bombCooldown - dt);
@@ -1705,7 +2718,7 @@ function update(dt) {
         if (e.burnTimer && e.burnTimer > 0) {
             e.burnTimer -= dt;
             e.hp -= (e.burnDmg || 1) * dt;
-            if (Math.random() < 0.1) spawnParticles(e.x, e.y, '#FF4400', 1, 15);
+            if (rand() < 0.1) spawnParticles(e.x, e.y, '#FF4400', 1, 15);
         }
         if (e.slowed && e.slowed > 0) {
             e.slowed -= dt;
@@ -1714,7 +2727,6 @@ function update(dt) {
     }
 
     // Input
-    const input = getInput();
     const spd = player.spd * player.spdMul;
     player.x += input.dx * spd * dt;
     player.y += input.dy * spd * dt;
@@ -1727,8 +2739,8 @@ function update(dt) {
         screenFlash = 0.5; screenFlashColor = '#FFD700';
         spawnParticles(player.x, player.y, '#FFD700', 30, 120);
         for (const e of enemies) {
-            if (!e.isBoss) { e.hp -= 50; spawnDmgNum(e.x, e.y-10, 50, '#FFD700'); }
-            else { e.hp -= 25; spawnDmgNum(e.x, e.y-10, 25, '#FFD700'); }
+            if (!e.isBoss) { e.hp -= 50; spawnDmgNum(e.x, e.y-10, 50, '#FFD700', false, e.uid); }
+            else { e.hp -= 25; spawnDmgNum(e.x, e.y-10, 25, '#FFD700', false, e.uid); }
         }
     }
 
@@ -1737,34 +2749,283 @@ function update(dt) {
     const pDist = Math.sqrt(player.x*player.x+player.y*player.y);
     if (pDist > mapR) { player.x *= mapR/pDist; player.y *= mapR/pDist; }
 
+    if (profOn) pt = profLap(PS.player, pt);
     updateSpawning(dt);
+    if (profOn) pt = profLap(PS.spawn, pt);
     updateEnemies(dt);
+    if (profOn) pt = profLap(PS.enemies, pt);
+    rebuildEnemyGrid();
+    if (profOn) pt = profLap(PS.grid, pt);
     fireWeapons(dt);
+    if (profOn) pt = profLap(PS.weapons, pt);
     updateProjectiles(dt);
+    if (profOn) pt = profLap(PS.projectiles, pt);
     updateOrbs(dt);
+    if (profOn) pt = profLap(PS.orbs, pt);
     updateParticles(dt);
+    if (profOn) pt = profLap(PS.particles, pt);
     updateDmgNums(dt);
+    if (profOn) profLap(PS.dmgNums, pt);
+}
+
+// ============================================
+// FIXED-STEP SIMULATION
+// ============================================
+// The game advances in SIM_STEP ticks fed by an accumulator, so gameplay is
+// frame-rate independent; drawGame interpolates between the last two ticks.
+// ?speed=N scales simulated time per real second without touching rendering.
+const SIM_STEP = 1 / 60, MAX_STEPS_PER_FRAME = 8;
+const simSpeed = parseFloat(params.get('speed')) || 1;
+let simAccum = 0;
+
+function step() {
+    player.ox = player.x; player.oy = player.y;
+    for (const e of enemies) { e.ox = e.x; e.oy = e.y; }
+    for (const p of projectiles) { p.ox = p.x; p.oy = p.y; }
+    update(SIM_STEP, getInput());
+}
+
+// Runs as many ticks as `dt` seconds of real time allow; returns the count.
+function advanceSim(dt) {
+    simAccum += dt * simSpeed;
+    let steps = 0;
+    while (simAccum >= SIM_STEP && state === 'playing') {
+        step();
+        simAccum -= SIM_STEP;
+        if (++steps >= MAX_STEPS_PER_FRAME) { simAccum = 0; break; }
+    }
+    return steps;
+}
+
+// ============================================
+// SIMULATION WORKER (opt-in, ?worker=1)
+// ============================================
+// With ?worker=1, sim-worker.js loads this file inside a Worker and runs
+// advanceSim() there. After each batch of ticks it posts one Float32Array
+// snapshot; the buffer is transferred and the main thread sends it back for
+// reuse. The main thread copies the snapshot into its own player/enemies/
+// projectiles/orbs/particles/dmgNums and draws as usual. Input, run starts
+// and level-up picks go to the worker as messages.
+// Strings (colours, damage text) are interned, so the snapshot carries only
+// indices; new strings ride along with the snapshot that first uses them.
+// Low-frequency state (state, weapons, passives, level-up choices,
+// saveData) is sent as a 'meta' message whenever `state` changes.
+const USE_SIM_WORKER = !IN_SIM_WORKER && params.get('worker') === '1' && typeof Worker !== 'undefined';
+// Record sizes in floats. Header: gameTime, kills, bombCooldown, screenFlash,
+// flash colour, player x/y/ox/oy/hp/maxHp/level/exp/expToNext/iframes/frame/
+// charIdx, enemyCap, then the five entity counts.
+const SNAP_HEAD = 23, SNAP_ENEMY = 11, SNAP_PROJ = 11, SNAP_ORB = 4, SNAP_PART = 6, SNAP_DMG = 6;
+const snapStrings = [], snapStringIdx = new Map(), snapFree = [];
+const simSounds = []; // sounds played by the worker since the last snapshot
+let snapStringsSent = 0;
+let simWorker = null, simSnapAt = 0, simDx = 0, simDy = 0;
+let localInitGame = null, localSelectChoice = null;
+
+function internString(s) {
+    let i = snapStringIdx.get(s);
+    if (i === undefined) { i = snapStrings.length; snapStrings.push(s); snapStringIdx.set(s, i); }
+    return i;
+}
+
+// --- worker side ---
+function encodeSnapshot() {
+    const n = SNAP_HEAD + enemies.length * SNAP_ENEMY + projectiles.length * SNAP_PROJ + orbs.length * SNAP_ORB
+        + particles.length * SNAP_PART + dmgNums.length * SNAP_DMG;
+    let f = null;
+    for (let i = 0; i < snapFree.length; i++) {
+        if (snapFree[i].length >= n) { f = snapFree[i]; snapFree[i] = snapFree[snapFree.length - 1]; snapFree.pop(); break; }
+    }
+    if (!f) f = new Float32Array(Math.max(n, 4096));
+    const p = player;
+    f[0] = gameTime; f[1] = kills; f[2] = bombCooldown; f[3] = screenFlash; f[4] = internString(screenFlashColor);
+    f[5] = p.x; f[6] = p.y; f[7] = p.ox; f[8] = p.oy; f[9] = p.hp; f[10] = p.maxHp; f[11] = p.level;
+    f[12] = p.exp; f[13] = p.expToNext; f[14] = p.iframes; f[15] = p.frame; f[16] = p.charIdx; f[17] = enemyCap;
+    f[18] = enemies.length; f[19] = projectiles.length; f[20] = orbs.length; f[21] = particles.length; f[22] = dmgNums.length;
+    let o = SNAP_HEAD;
+    for (const e of enemies) {
+        f[o] = e.x; f[o+1] = e.y; f[o+2] = e.ox; f[o+3] = e.oy; f[o+4] = e.type; f[o+5] = e.isBoss ? 1 : 0;
+        f[o+6] = e.hp; f[o+7] = e.maxHp; f[o+8] = e.radius; f[o+9] = e.hitFlash || 0; f[o+10] = e.uid;
+        o += SNAP_ENEMY;
+    }
+    for (const q of projectiles) {
+        f[o] = q.x; f[o+1] = q.y; f[o+2] = q.ox; f[o+3] = q.oy; f[o+4] = q.vx; f[o+5] = q.vy; f[o+6] = q.radius;
+        f[o+7] = internString(q.color);
+        f[o+8] = (q.orbital ? 1 : 0) | (q.zone ? 2 : 0) | (q.homing ? 4 : 0) | (q.enemy ? 8 : 0);
+        f[o+9] = q.orbAngle; f[o+10] = q.orbRadius;
+        o += SNAP_PROJ;
+    }
+    for (const b of orbs) { f[o] = b.x; f[o+1] = b.y; f[o+2] = b.tier; f[o+3] = b.expire; o += SNAP_ORB; }
+    for (const q of particles) {
+        f[o] = q.x; f[o+1] = q.y; f[o+2] = q.life; f[o+3] = q.maxLife; f[o+4] = q.size; f[o+5] = internString(q.color);
+        o += SNAP_PART;
+    }
+    for (const d of dmgNums) {
+        f[o] = d.x; f[o+1] = d.y; f[o+2] = d.life; f[o+3] = internString(d.color);
+        f[o+4] = (d.crit ? 1 : 0) | (d.text ? 2 : 0); f[o+5] = d.text ? internString(d.val) : d.val;
+        o += SNAP_DMG;
+    }
+    return f;
+}
+
+function postMeta() {
+    self.postMessage({ type: 'meta', state, weapons: player.weapons, passives: player.passives,
+        choices: levelUpChoices, save: saveData });
+}
+
+function postSnapshot() {
+    const f = encodeSnapshot();
+    const strings = snapStrings.length > snapStringsSent ? snapStrings.slice(snapStringsSent) : null;
+    snapStringsSent = snapStrings.length;
+    const sounds = simSounds.length ? simSounds.splice(0) : null;
+    self.postMessage({ type: 'snap', buf: f.buffer, strings, sounds }, [f.buffer]);
+}
+
+// Called by sim-worker.js once game.js has loaded inside the worker.
+function runSimWorker() {
+    let last = performance.now(), prevState = state, bombLatch = false;
+    getInput = () => { const bomb = bombLatch; bombLatch = false; return { dx: simDx, dy: simDy, bomb }; };
+    playSound = (type) => { if (simSounds.length < 32) simSounds.push(type); };
+    startBGM = () => {};
+    writeSave = () => {}; // the main thread persists saveData from 'meta'
+    self.onmessage = (ev) => {
+        const m = ev.data;
+        if (m.type === 'input') { simDx = m.dx; simDy = m.dy; if (m.bomb) bombLatch = true; }
+        else if (m.type === 'recycle') snapFree.push(new Float32Array(m.buf));
+        else if (m.type === 'start') { saveData = m.save; selectedChar = m.char; setQualityTier(m.tier); initGame(); last = performance.now(); }
+        else if (m.type === 'choose') { if (state === 'levelUp') selectChoice(m.idx); }
+        else if (m.type === 'quality') setQualityTier(m.tier);
+    };
+    function tick() {
+        const now = performance.now();
+        const dt = Math.min((now - last) / 1000, 0.05);
+        last = now;
+        let steps = 0;
+        if (state === 'playing') {
+            steps = advanceSim(dt);
+            adaptEnemyCap(performance.now() - now, dt);
+        }
+        if (state !== prevState) { prevState = state; postMeta(); }
+        if (steps) postSnapshot();
+        setTimeout(tick, 4);
+    }
+    tick();
+}
+
+// --- main-thread side ---
+function fillList(arr, n) {
+    while (arr.length < n) arr.push({});
+    arr.length = n;
+}
+
+function applySnapshot(m) {
+    if (m.strings) for (const s of m.strings) snapStrings.push(s);
+    if (m.sounds) for (const s of m.sounds) playSound(s);
+    const f = new Float32Array(m.buf), S = snapStrings;
+    const p = player;
+    gameTime = f[0]; kills = f[1]; bombCooldown = f[2]; screenFlash = f[3]; screenFlashColor = S[f[4]];
+    p.x = f[5]; p.y = f[6]; p.ox = f[7]; p.oy = f[8]; p.hp = f[9]; p.maxHp = f[10]; p.level = f[11];
+    p.exp = f[12]; p.expToNext = f[13]; p.iframes = f[14]; p.frame = f[15]; p.charIdx = f[16]; enemyCap = f[17];
+    let o = SNAP_HEAD;
+    fillList(enemies, f[18]);
+    for (const e of enemies) {
+        e.x = f[o]; e.y = f[o+1]; e.ox = f[o+2]; e.oy = f[o+3]; e.type = f[o+4]; e.isBoss = f[o+5] === 1;
+        e.hp = f[o+6]; e.maxHp = f[o+7]; e.radius = f[o+8]; e.hitFlash = f[o+9]; e.uid = f[o+10];
+        o += SNAP_ENEMY;
+    }
+    fillList(projectiles, f[19]);
+    for (const q of projectiles) {
+        const fl = f[o+8];
+        q.x = f[o]; q.y = f[o+1]; q.ox = f[o+2]; q.oy = f[o+3]; q.vx = f[o+4]; q.vy = f[o+5]; q.radius = f[o+6];
+        q.color = S[f[o+7]]; q.orbital = (fl & 1) !== 0; q.zone = (fl & 2) !== 0; q.homing = (fl & 4) !== 0; q.enemy = (fl & 8) !== 0;
+        q.orbAngle = f[o+9]; q.orbRadius = f[o+10];
+        o += SNAP_PROJ;
+    }
+    fillList(orbs, f[20]);
+    for (const b of orbs) { b.x = f[o]; b.y = f[o+1]; b.tier = f[o+2]; b.expire = f[o+3]; o += SNAP_ORB; }
+    fillList(particles, f[21]);
+    for (const q of particles) {
+        q.x = f[o]; q.y = f[o+1]; q.life = f[o+2]; q.maxLife = f[o+3]; q.size = f[o+4]; q.color = S[f[o+5]];
+        o += SNAP_PART;
+    }
+    fillList(dmgNums, f[22]);
+    for (const d of dmgNums) {
+        const fl = f[o+4];
+        d.x = f[o]; d.y = f[o+1]; d.life = f[o+2]; d.color = S[f[o+3]];
+        d.crit = (fl & 1) !== 0; d.text = (fl & 2) !== 0; d.val = d.text ? S[f[o+5]] : f[o+5];
+        o += SNAP_DMG;
+    }
+    simSnapAt = performance.now();
+    simWorker.postMessage({ type: 'recycle', buf: m.buf }, [m.buf]);
+}
+
+function applyMeta(m) {
+    state = m.state;
+    player.weapons = m.weapons; player.passives = m.passives;
+    levelUpChoices = m.choices;
+    saveData = m.save; writeSave();
+}
+
+// Sends movement when it changes; bomb presses always go through.
+function sendSimInput() {
+    const input = getInput();
+    if (input.dx === simDx && input.dy === simDy && !input.bomb) return;
+    simDx = input.dx; simDy = input.dy;
+    simWorker.postMessage({ type: 'input', dx: input.dx, dy: input.dy, bomb: input.bomb });
+}
+
+function startSimWorker() {
+    simWorker = new Worker('sim-worker.js' + location.search);
+    simWorker.onmessage = (ev) => { if (ev.data.type === 'snap') applySnapshot(ev.data); else applyMeta(ev.data); };
+    simWorker.onerror = (err) => { console.warn('sim worker failed, running on the main thread', err.message); stopSimWorker(); };
+    // Run starts and level-up picks are simulation inputs; the local
+    // initGame still runs so the main thread has a player to draw.
+    localInitGame = initGame; localSelectChoice = selectChoice;
+    initGame = function () {
+        localInitGame();
+        simDx = simDy = 0; simSnapAt = 0;
+        simWorker.postMessage({ type: 'start', char: selectedChar, save: saveData, tier: qualityTier });
+    };
+    selectChoice = function (idx) {
+        if (idx >= levelUpChoices.length) return;
+        state = 'playing';
+        simWorker.postMessage({ type: 'choose', idx });
+    };
+}
+
+function stopSimWorker() {
+    if (!simWorker) return;
+    simWorker.terminate(); simWorker = null;
+    initGame = localInitGame; selectChoice = localSelectChoice;
+    if (state === 'playing' || state === 'levelUp') state = 'title';
 }
 
+if (USE_SIM_WORKER) startSimWorker();
+
 // ============================================
 // DRAW FUNCTIONS
 // ============================================
-function drawGame() {
-    const camX = player.x, camY = player.y;
+// alpha: how far between the previous and current tick to draw (0..1)
+function drawGame(alpha = 1) {
+    const camX = player.ox + (player.x - player.ox) * alpha, camY = player.oy + (player.y - player.oy) * alpha;
+    let pt = profOn ? performance.now() : 0;
 
     // Map
     drawMap(camX, camY);
+    if (profOn) pt = profLap(PS.drawMap, pt);
 
     // Orbs
     for (const o of orbs) {
+        if (o.expire <= gameTime) continue; // expired, awaiting the sweep
         const sx = o.x - camX + W/2, sy = o.y - camY + H/2;
-        if (sx < -10 || sx > W+10 || sy < -10 || sy > H+10) continue;
-        drawExpOrb(sx, sy);
+        if (sx < -12 || sx > W+12 || sy < -12 || sy > H+12) continue;
+        drawExpOrb(sx, sy, o.tier);
     }
+    if (profOn) pt = profLap(PS.drawOrbs, pt);
 
-    // Projectiles - fancy rendering
+    // Projectiles - fancy rendering (trail/glow passes only when quality.glow)
+    const glow = quality.glow;
     for (const p of projectiles) {
-        const sx = p.x - camX + W/2, sy = p.y - camY + H/2;
+        const sx = p.ox + (p.x - p.ox) * alpha - camX + W/2, sy = p.oy + (p.y - p.oy) * alpha - camY + H/2;
         if (sx < -30 || sx > W+30 || sy < -30 || sy > H+30) continue;
         if (p.orbital) {
             // Spinning club/mace
@@ -1781,20 +3042,24 @@ function drawGame() {
             circ(3, -8, 2, '#888');
             circ(0, -10, 2, '#888');
             // Swing trail
-            ctx.globalAlpha = 0.3;
-            ctx.strokeStyle = '#CD853F'; ctx.lineWidth = 3;
-            ctx.beginPath(); ctx.arc(0, 0, p.radius * 0.8, -2, -0.5); ctx.stroke();
-            ctx.globalAlpha = 0.15;
-            ctx.strokeStyle = '#FFD700'; ctx.lineWidth = 2;
-            ctx.beginPath(); ctx.arc(0, 0, p.radius, -2.5, -0.8); ctx.stroke();
-            ctx.globalAlpha = 1;
+            if (glow) {
+                ctx.globalAlpha = 0.3;
+                ctx.strokeStyle = '#CD853F'; ctx.lineWidth = 3;
+                ctx.beginPath(); ctx.arc(0, 0, p.radius * 0.8, -2, -0.5); ctx.stroke();
+                ctx.globalAlpha = 0.15;
+                ctx.strokeStyle = '#FFD700'; ctx.lineWidth = 2;
+                ctx.beginPath(); ctx.arc(0, 0, p.radius, -2.5, -0.8); ctx.stroke();
+                ctx.globalAlpha = 1;
+            }
             ctx.restore();
             // Orbit ring indicator
-            const orbRing = p.orbRadius;
-            ctx.globalAlpha = 0.08;
-            ctx.strokeStyle = '#CD853F'; ctx.lineWidth = 1;
-            ctx.beginPath(); ctx.arc(W/2, H/2, orbRing, 0, Math.PI*2); ctx.stroke();
-            ctx.globalAlpha = 1;
+            if (glow) {
+                const orbRing = p.orbRadius;
+                ctx.globalAlpha = 0.08;
+                ctx.strokeStyle = '#CD853F'; ctx.lineWidth = 1;
+                ctx.beginPath(); ctx.arc(W/2, H/2, orbRing, 0, Math.PI*2); ctx.stroke();
+                ctx.globalAlpha = 1;
+            }
             continue;
         }
         if (p.zone) {
@@ -1819,11 +3084,13 @@ function drawGame() {
             // Symbols
             px(-1, -3, 2, 1, '#000'); px(-2, -1, 4, 1, '#000'); px(-1, 1, 2, 1, '#000');
             // Trail glow
-            ctx.globalAlpha = 0.4;
-            circ(-8, 0, 5, p.color);
-            ctx.globalAlpha = 0.2;
-            circ(-14, 0, 4, p.color);
-            ctx.globalAlpha = 1;
+            if (glow) {
+                ctx.globalAlpha = 0.4;
+                circ(-8, 0, 5, p.color);
+                ctx.globalAlpha = 0.2;
+                circ(-14, 0, 4, p.color);
+                ctx.globalAlpha = 1;
+            }
             ctx.restore();
         } else if (p.color === '#FFD700' && p.homing) {
             // 방울 - golden bell with sound waves
@@ -1832,33 +3099,37 @@ function drawGame() {
             circ(0, -1, 3, '#FFEC8B');
             circ(0, -2, 1.5, '#FFF');
             // Sound wave rings
-            const wave = (t * 8) % 1;
-            ctx.globalAlpha = 1 - wave;
-            ctx.strokeStyle = '#FFD700'; ctx.lineWidth = 1.5;
-            ctx.beginPath(); ctx.arc(0, 0, 6 + wave * 12, 0, Math.PI*2); ctx.stroke();
-            ctx.globalAlpha = 0.5 * (1 - wave);
-            ctx.beginPath(); ctx.arc(0, 0, 10 + wave * 12, 0, Math.PI*2); ctx.stroke();
-            ctx.globalAlpha = 1;
+            if (glow) {
+                const wave = (t * 8) % 1;
+                ctx.globalAlpha = 1 - wave;
+                ctx.strokeStyle = '#FFD700'; ctx.lineWidth = 1.5;
+                ctx.beginPath(); ctx.arc(0, 0, 6 + wave * 12, 0, Math.PI*2); ctx.stroke();
+                ctx.globalAlpha = 0.5 * (1 - wave);
+                ctx.beginPath(); ctx.arc(0, 0, 10 + wave * 12, 0, Math.PI*2); ctx.stroke();
+                ctx.globalAlpha = 1;
+            }
             ctx.restore();
         } else if (p.color === '#FF6600' || p.color === '#FF4400') {
             // 여우불 / 용 숨결 - flickering fire
             const fl = Math.sin(t * 12 + sx) * 2;
-            ctx.globalAlpha = 0.25; circ(sx, sy, p.radius * 2.5 + fl, '#FF4400'); ctx.globalAlpha = 1;
+            if (glow) { ctx.globalAlpha = 0.25; circ(sx, sy, p.radius * 2.5 + fl, '#FF4400'); ctx.globalAlpha = 1; }
             circ(sx, sy, p.radius + 2, '#FF4400');
             circ(sx, sy, p.radius, '#FF8844');
             circ(sx, sy, p.radius * 0.6, '#FFCC44');
             circ(sx, sy, p.radius * 0.3, '#FFFFFF');
             // Ember particles
-            for (let j = 0; j < 2; j++) {
-                const ea = t * 5 + j * 3 + sx * 0.1;
-                ctx.globalAlpha = 0.5;
-                circ(sx + Math.sin(ea)*5, sy + Math.cos(ea)*5 - 3, 1.5, '#FFAA00');
+            if (glow) {
+                for (let j = 0; j < 2; j++) {
+                    const ea = t * 5 + j * 3 + sx * 0.1;
+                    ctx.globalAlpha = 0.5;
+                    circ(sx + Math.sin(ea)*5, sy + Math.cos(ea)*5 - 3, 1.5, '#FFAA00');
+                }
+                ctx.globalAlpha = 1;
             }
-            ctx.globalAlpha = 1;
         } else if (p.color === '#FFDD00') {
             // 천둥 - lightning bolt flash
             ctx.save(); ctx.translate(sx, sy);
-            ctx.globalAlpha = 0.3; circ(0, 0, 15, '#FFDD00'); ctx.globalAlpha = 1;
+            if (glow) { ctx.globalAlpha = 0.3; circ(0, 0, 15, '#FFDD00'); ctx.globalAlpha = 1; }
             ctx.fillStyle = '#FFDD00';
             ctx.beginPath();
             ctx.moveTo(-3, -8); ctx.lineTo(1, -2); ctx.lineTo(-1, -2);
@@ -1880,18 +3151,20 @@ function drawGame() {
             ctx.moveTo(8, 0); ctx.lineTo(-4, -3); ctx.lineTo(-2, 0); ctx.lineTo(-4, 3);
             ctx.closePath(); ctx.fill();
             // Speed lines
-            ctx.globalAlpha = 0.4;
-            px(-12, -1, 8, 1, '#88CCFF');
-            ctx.globalAlpha = 0.2;
-            px(-18, 1, 6, 1, '#88CCFF');
-            ctx.globalAlpha = 1;
+            if (glow) {
+                ctx.globalAlpha = 0.4;
+                px(-12, -1, 8, 1, '#88CCFF');
+                ctx.globalAlpha = 0.2;
+                px(-18, 1, 6, 1, '#88CCFF');
+                ctx.globalAlpha = 1;
+            }
             ctx.restore();
         } else if (p.color === '#00AAFF') {
             // 청룡 (evolved dragon breath) - big blue dragon
             ctx.save(); ctx.translate(sx, sy);
             const rot3 = Math.atan2(p.vy, p.vx);
             ctx.rotate(rot3);
-            ctx.globalAlpha = 0.2; circ(0, 0, p.radius*2, '#00AAFF'); ctx.globalAlpha = 1;
+            if (glow) { ctx.globalAlpha = 0.2; circ(0, 0, p.radius*2, '#00AAFF'); ctx.globalAlpha = 1; }
             circ(8, 0, p.radius*0.8, '#00AAFF');
             circ(3, 0, p.radius, '#0088DD');
             circ(-3, 0, p.radius*0.8, '#0066BB');
@@ -1917,26 +3190,23 @@ function drawGame() {
             ctx.restore();
         } else {
             // Default - glowing orb with trail
-            ctx.globalAlpha = 0.3; circ(sx, sy, p.radius * 2, p.color); ctx.globalAlpha = 1;
+            if (glow) { ctx.globalAlpha = 0.3; circ(sx, sy, p.radius * 2, p.color); ctx.globalAlpha = 1; }
             circ(sx, sy, p.radius, p.color);
             circ(sx, sy, p.radius * 0.5, '#FFF');
         }
     }
+    if (profOn) pt = profLap(PS.drawProj, pt);
 
     // Enemies
     for (const e of enemies) {
-        const sx = e.x - camX + W/2, sy = e.y - camY + H/2;
+        const sx = e.ox + (e.x - e.ox) * alpha - camX + W/2, sy = e.oy + (e.y - e.oy) * alpha - camY + H/2;
         if (sx < -40 || sx > W+40 || sy < -50 || sy > H+50) continue;
-        // Hit flash
-        if (e.hitFlash && e.hitFlash > 0) {
-            ctx.globalAlpha = 0.7;
-            circ(sx, sy, e.radius + 3, '#FFF');
-            ctx.globalAlpha = 1;
-        }
+        // Hit flash is a cached sprite variant (white disc behind the sprite)
+        const variant = e.hitFlash && e.hitFlash > 0 ? SPRITE_FLASH : SPRITE_NORMAL;
+        // uid offsets the animation so a swarm doesn't bob in lockstep
+        const phase = t + (e.uid % 16) * 0.4;
         if (e.isBoss) {
-            if (e.type === 98) drawGwiwang(sx, sy, t*3);
-            else if (e.type === 97) drawDokkaebiKing(sx, sy, t*3);
-            else drawGumihoKing(sx, sy, t*3);
+            drawSprite(bossDrawFns[e.type] || drawGumihoKing, sx, sy, 0, phase, variant, e.radius);
             // Boss HP bar - big
             const bhw = 80, bhh = 6;
             px(sx-bhw/2, sy-50, bhw, bhh, '#111');
@@ -1944,7 +3214,7 @@ function drawGame() {
             px(sx-bhw/2+1, sy-49, (bhw-2)*(e.hp/e.maxHp), 1, '#FF6666');
         } else {
             const drawFn2 = enemyDrawFns[e.type];
-            if (drawFn2) drawFn2(sx, sy, t*3);
+            if (drawFn2) drawSprite(drawFn2, sx, sy, 0, phase, variant, e.radius);
             // Small HP bar for damaged enemies
             if (e.hp < e.maxHp) {
                 const hw = 16, hh = 2;
@@ -1956,55 +3226,117 @@ function drawGame() {
 
     // Player
     const psx = W/2, psy = H/2;
-    if (player.iframes > 0 && Math.floor(t*15)%2===0) ctx.globalAlpha = 0.3;
+    const blink = player.iframes > 0 && Math.floor(t*15)%2===0;
     const drawFn = charDrawFns[player.charIdx];
-    if (drawFn) drawFn(psx, psy, player.frame);
-    ctx.globalAlpha = 1;
+    if (drawFn) drawSprite(drawFn, psx, psy, player.frame, t, blink ? SPRITE_FADED : SPRITE_NORMAL);
+
+    if (profOn) pt = profLap(PS.drawEnemies, pt);
 
     // Particles
     drawParticles(camX, camY);
     drawDmgNums(camX, camY);
+    if (profOn) pt = profLap(PS.drawFx, pt);
 
-    // === HUD ===
+    // === HUD === (retained on the HUD layer; only the bomb glow animates)
+    if (state === 'playing') {
+        if (bombCooldown <= 0) {
+            const glow = Math.sin(t * 4) * 0.15 + 0.85;
+            ctx.globalAlpha = 0.2 * glow;
+            circ(W - 50, H - 90, 28 + 6, '#FFD700');
+            ctx.globalAlpha = 1;
+        }
+        updateHudLayer();
+    }
+    // Screen flash effect
+    if (screenFlash > 0) {
+        ctx.globalAlpha = screenFlash;
+        ctx.fillStyle = screenFlashColor;
+        ctx.fillRect(0, 0, W, H);
+        ctx.globalAlpha = 1;
+    }
+    if (profOn) profLap(PS.drawHud, pt);
+}
+
+// ============================================
+// HUD LAYER (retained canvas over the world)
+// ============================================
+// The HUD and the level-up / game-over / victory panels live on a second
+// canvas stacked over the game canvas. It is redrawn only when what it shows
+// changes: the HUD when one of its inputs does, and a panel once per state.
+const HUD_NONE = 0, HUD_PLAY = 1, HUD_LEVELUP = 2, HUD_GAMEOVER = 3, HUD_VICTORY = 4;
+const HUD_CD_STEPS = 4; // bomb cooldown arc resolution per second
+const hudInputs = new Float64Array(16), hudShown = new Float64Array(16);
+let hudMode = -1, hudChoices = null;
+
+// Redraws the layer with `draw` if `mode` (or, for HUD_PLAY, an input) changed.
+function retainHud(mode, draw) {
+    const changed = mode === HUD_PLAY && hudInputsChanged();
+    if (mode === hudMode && !changed) return;
+    hudMode = mode;
+    const prev = ctx;
+    ctx = hudCtx;
+    ctx.clearRect(0, 0, W, H);
+    if (draw) draw();
+    ctx = prev;
+}
+
+function hudInputsChanged() {
+    let changed = false;
+    for (let i = 0; i < hudInputs.length; i++) {
+        if (hudInputs[i] !== hudShown[i]) { hudShown[i] = hudInputs[i]; changed = true; }
+    }
+    return changed;
+}
+
+function updateHudLayer() {
+    const h = hudInputs, expW = W - 20;
+    h[0] = Math.floor(gameTime); h[1] = kills; h[2] = Math.ceil(player.hp); h[3] = player.maxHp;
+    h[4] = player.level; h[5] = Math.floor(expW * Math.min(1, player.exp / player.expToNext));
+    h[6] = Math.ceil(bombCooldown * HUD_CD_STEPS); h[7] = enemies.length;
+    for (let i = 0; i < 6; i++) {
+        const w = player.weapons[i];
+        h[8 + i] = w ? w.id * 16 + w.level + (w.evolved ? 8 : 0) : -1;
+    }
+    retainHud(HUD_PLAY, drawHud);
+}
+
+function drawHud() {
     // Timer
     const mins = Math.floor(gameTime/60), secs = Math.floor(gameTime%60);
-    txt(`${String(mins).padStart(2,'0')}:${String(secs).padStart(2,'0')}`, 50, 8, '#FFD700', 14, 'left');
+    glyphText(`${String(mins).padStart(2,'0')}:${String(secs).padStart(2,'0')}`, 50, 8, '#FFD700', 14, 'left');
     // Kills
-    txt(`💀 ${kills}`, W-10, 8, '#FF8888', 11, 'right');
+    glyphText(`💀 ${kills}`, W-10, 8, '#FF8888', 11, 'right');
     // HP bar
     const hpW = 100, hpH = 8;
     px(10, H-45, hpW+2, hpH+2, '#333');
     px(11, H-44, hpW * (player.hp/player.maxHp), hpH, player.hp/player.maxHp > 0.3 ? '#44DD44' : '#DD4444');
-    txt(`Lv.${player.level}`, 10, H-60, '#FFD700', 9, 'left');
-    txt(`HP ${Math.ceil(player.hp)}/${player.maxHp}`, 115, H-46, '#FFF', 7, 'left');
+    glyphText(`Lv.${player.level}`, 10, H-60, '#FFD700', 9, 'left');
+    glyphText(`HP ${Math.ceil(player.hp)}/${player.maxHp}`, 115, H-46, '#FFF', 7, 'left');
     // EXP bar
     const expW = W - 20;
     px(10, H-25, expW, 6, '#222');
-    px(10, H-25, expW * (player.exp/player.expToNext), 6, '#00CC88');
+    px(10, H-25, expW * Math.min(1, player.exp/player.expToNext), 6, '#00CC88');
     // Bomb button (big visible circle)
     const bbX = W - 50, bbY = H - 90, bbR = 28;
     if (bombCooldown > 0) {
         ctx.globalAlpha = 0.3;
         circ(bbX, bbY, bbR, '#555');
         ctx.globalAlpha = 1;
-        // Cooldown arc
+        // Cooldown arc, in quarter-second steps (see HUD_CD_STEPS)
         ctx.strokeStyle = '#888'; ctx.lineWidth = 3;
-        const cdPct = bombCooldown / 30;
+        const cdPct = Math.ceil(bombCooldown * HUD_CD_STEPS) / HUD_CD_STEPS / 30;
         ctx.beginPath(); ctx.arc(bbX, bbY, bbR, -Math.PI/2, -Math.PI/2 + (1-cdPct)*Math.PI*2); ctx.stroke();
-        txt(`${Math.ceil(bombCooldown)}`, bbX, bbY-6, '#888', 12);
+        glyphText(`${Math.ceil(bombCooldown)}`, bbX, bbY-6, '#888', 12);
     } else {
-        // Ready - glowing
-        const glow = Math.sin(t * 4) * 0.15 + 0.85;
-        ctx.globalAlpha = 0.2 * glow;
-        circ(bbX, bbY, bbR + 6, '#FFD700');
+        // Ready - the pulsing glow is drawn on the world layer
         ctx.globalAlpha = 0.6;
         circ(bbX, bbY, bbR, '#442200');
         ctx.globalAlpha = 1;
         ctx.strokeStyle = '#FFD700'; ctx.lineWidth = 2;
         ctx.beginPath(); ctx.arc(bbX, bbY, bbR, 0, Math.PI*2); ctx.stroke();
         // 부 character
-        txt('부', bbX, bbY-10, '#FFD700', 16);
-        txt('폭탄', bbX, bbY+6, '#FFD700', 8);
+        glyphText('부', bbX, bbY-10, '#FFD700', 16);
+        glyphText('폭탄', bbX, bbY+6, '#FFD700', 8);
     }
     // Weapon icons
     const iconY = H - 85;
@@ -2013,18 +3345,11 @@ function drawGame() {
         const ix = 15 + i * 28;
         px(ix-10, iconY-10, 22, 22, '#222');
         px(ix-9, iconY-9, 20, 20, w.evolved ? '#442266' : '#333');
-        txt(WEAPONS[w.id].name[0], ix, iconY-8, WEAPONS[w.id].color, 10);
-        txt(`${w.level}`, ix, iconY+5, '#888', 7);
+        glyphText(WEAPONS[w.id].name[0], ix, iconY-8, WEAPONS[w.id].color, 10);
+        glyphText(`${w.level}`, ix, iconY+5, '#888', 7);
     }
     // Kill counter combo flash
-    txt(`${enemies.length} 요괴`, W/2, 8, '#666', 8);
-    // Screen flash effect
-    if (screenFlash > 0) {
-        ctx.globalAlpha = screenFlash;
-        ctx.fillStyle = screenFlashColor;
-        ctx.fillRect(0, 0, W, H);
-        ctx.globalAlpha = 1;
-    }
+    glyphText(`${enemies.length} 요괴`, W/2, 8, '#666', 8);
 }
 
 function drawTitleScreen() {
@@ -2056,6 +3381,7 @@ function drawTitleScreen() {
     ctx.globalAlpha = 1;
 
     txt('v1.0', W/2, H-30, '#444', 8);
+    warmSpriteCache(3);
 }
 
 function drawCharSelect() {
@@ -2077,7 +3403,7 @@ function drawCharSelect() {
         if (unlocked) {
             // Draw character
             const drawFn = charDrawFns[i];
-            if (drawFn) drawFn(bx+50, by+70, t*3);
+            if (drawFn) drawSprite(drawFn, bx+50, by+70, t*3, t);
             txt(ch.name, bx+50, by+110, '#FFF', 10);
             txt(ch.desc, bx+50, by+125, '#AAA', 8);
             txt(`HP:${ch.hp}`, bx+50, by+142, '#88FF88', 7);
@@ -2100,6 +3426,12 @@ function drawCharSelect() {
 
 function drawLevelUp() {
     drawGame();
+    if (hudChoices !== levelUpChoices) { hudChoices = levelUpChoices; hudMode = -1; }
+    retainHud(HUD_LEVELUP, drawLevelUpPanel);
+}
+
+function drawLevelUpPanel() {
+    drawHud();
     // Overlay
     ctx.fillStyle = 'rgba(0,0,0,0.7)'; ctx.fillRect(0, 0, W, H);
     txt('⬆ 레벨 업! ⬆', W/2, 180, '#FFD700', 16);
@@ -2159,6 +3491,10 @@ function drawLevelUp() {
 }
 
 function drawGameOver() {
+    retainHud(HUD_GAMEOVER, drawGameOverPanel);
+}
+
+function drawGameOverPanel() {
     ctx.fillStyle = '#1a0a0a'; ctx.fillRect(0, 0, W, H);
     txt('게임 오버', W/2, 120, '#FF4444', 24);
 
@@ -2207,6 +3543,18 @@ function drawVictory() {
     txt('🎉 승리! 🎉', 0, -10, '#FFD700', 28);
     ctx.restore();
 
+    // Screen flash
+    if (screenFlash > 0) {
+        ctx.globalAlpha = screenFlash;
+        ctx.fillStyle = screenFlashColor;
+        ctx.fillRect(0, 0, W, H);
+        ctx.globalAlpha = 1;
+        screenFlash = Math.max(0, screenFlash - 0.02);
+    }
+    retainHud(HUD_VICTORY, drawVictoryPanel);
+}
+
+function drawVictoryPanel() {
     txt('구미호왕을 물리쳤다!', W/2, 175, '#FFAA44', 13);
 
     // Stats
@@ -2232,15 +3580,35 @@ function drawVictory() {
     txt('다시하기', 140, 538, '#FFF', 12);
     px(220, 530, 120, 40, '#444');
     txt('메뉴', 280, 538, '#FFF', 12);
+}
 
-    // Screen flash
-    if (screenFlash > 0) {
-        ctx.globalAlpha = screenFlash;
-        ctx.fillStyle = screenFlashColor;
-        ctx.fillRect(0, 0, W, H);
-        ctx.globalAlpha = 1;
-        screenFlash = Math.max(0, screenFlash - 0.02);
-    }
+// ============================================
+// OFFLINE CACHE
+// ============================================
+// sw.js precaches the content-hashed build listed in asset-manifest.json
+// (written by build.js). A new build installs in the background, and the
+// swap to it is done on the title screen only, never mid-run.
+let swWaiting = null;
+function registerOffline() {
+    if (IN_SIM_WORKER || typeof navigator === 'undefined' || !('serviceWorker' in navigator) || location.protocol === 'file:') return;
+    const hadController = !!navigator.serviceWorker.controller;
+    navigator.serviceWorker.register('sw.js').then(reg => {
+        if (reg.waiting && hadController) swWaiting = reg.waiting;
+        reg.addEventListener('updatefound', () => {
+            const sw = reg.installing;
+            sw.addEventListener('statechange', () => {
+                if (sw.state === 'installed' && navigator.serviceWorker.controller) swWaiting = sw;
+            });
+        });
+    }).catch(() => {});
+    // First install claims nothing; only reload when an old build is being replaced
+    navigator.serviceWorker.addEventListener('controllerchange', () => { if (hadController) location.reload(); });
+}
+
+function applyOfflineUpdate() {
+    if (!swWaiting) return;
+    swWaiting.postMessage({ type: 'skipWaiting' });
+    swWaiting = null;
 }
 
 // ============================================
@@ -2251,20 +3619,34 @@ function gameLoop(now) {
     const dt = Math.min((now - (lastTime || now)) / 1000, 0.05);
     lastTime = now;
     t += dt;
+    if (profOn) profFrameT0 = performance.now();
 
     ctx.clearRect(0, 0, W, H);
 
     switch(state) {
         case 'title':
             drawTitleScreen();
+            retainHud(HUD_NONE);
+            if (swWaiting) applyOfflineUpdate();
             break;
         case 'charSelect':
             drawCharSelect();
+            retainHud(HUD_NONE);
             break;
-        case 'playing':
-            update(dt);
-            drawGame();
+        case 'playing': {
+            const t0 = performance.now();
+            if (simWorker) {
+                sendSimInput();
+                drawGame(simSnapAt ? Math.min(1, (t0 - simSnapAt) / 1000 / SIM_STEP) : 1);
+                governQuality(dt);
+                break;
+            }
+            advanceSim(dt);
+            drawGame(state === 'playing' ? simAccum / SIM_STEP : 1);
+            adaptEnemyCap(performance.now() - t0, dt);
+            governQuality(dt);
             break;
+        }
         case 'levelUp':
             drawLevelUp();
             break;
@@ -2275,7 +3657,9 @@ function gameLoop(now) {
             drawVictory();
             break;
     }
+    if (profOn) { profEndFrame(dt); drawProfiler(); }
 }
 
+registerOffline();
 lastTime = performance.now();
 requestAnimationFrame(gameLoop);
@@ -0,0 +1,354 @@
+"""game.js data tables as typed Python objects.
+
+    data = gamedata.load()          # GameData, from game.js next to this file
+    data.chars[0].name, data.enemies[3].min_time, data.balance.spawn_rate
+
+One pass over game.js picks out the CHARS / WEAPONS / PASSIVES /
+EVOLUTIONS / ENEMY_DEFS literals, the boss stats in spawnBoss() and the
+balance formulas. The parsed model is cached as JSON under .cache/, keyed by
+the sha256 of game.js and of this module's own source, so a run on an
+unchanged file skips parsing and an edit to the parser or model reparses.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from dataclasses import asdict, dataclass
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+GAME_JS = os.path.join(ROOT, "game.js")
+CACHE_DIR = os.path.join(ROOT, ".cache", "gamedata")
+
+
+# ── Model ──
+
+@dataclass(frozen=True, slots=True)
+class Character:
+    name: str
+    desc: str
+    weapon: int
+    color: str
+    hp: float
+    spd: float
+    atk: float
+    range: float
+    unlock: str         # body of the unlocked() arrow function
+
+    @property
+    def unlock_label(self):
+        m = re.fullmatch(r"saveData\.totalClears>=(\d+)", self.unlock)
+        if m:
+            return f"{m.group(1)}클리어"
+        m = re.fullmatch(r"saveData\.bestTime>=(\d+)", self.unlock)
+        if m:
+            return f"생존{m.group(1)}초"
+        return "기본" if self.unlock == "true" else self.unlock
+
+
+@dataclass(frozen=True, slots=True)
+class Weapon:
+    name: str
+    desc: str
+    type: str
+    base_cd: float
+    color: str
+
+
+@dataclass(frozen=True, slots=True)
+class Passive:
+    name: str
+    desc: str
+    stat: str
+    val: float
+    evo_weapon: int
+
+
+@dataclass(frozen=True, slots=True)
+class Evolution:
+    weapon: int
+    passive: int
+    name: str
+    desc: str
+
+
+@dataclass(frozen=True, slots=True)
+class Enemy:
+    name: str
+    hp: float
+    spd: float
+    dmg: float
+    radius: float
+    exp: float
+    pattern: str
+    min_time: float
+
+
+@dataclass(frozen=True, slots=True)
+class Boss:
+    type: int
+    name: str
+    hp: float
+    spd: float
+    dmg: float
+    radius: float
+    exp: float
+    pattern: str
+
+
+@dataclass(frozen=True, slots=True)
+class Balance:
+    spawn_rate: str     # JS expressions of gameTime / level, as written in game.js
+    burst_count: str
+    hp_scale: str
+    exp_to_next: str
+    burst_interval: int
+    enemy_cap: int
+    enemy_cap_min: int
+    enemy_cap_max: int
+    boss_interval: int
+    boss_order: tuple
+    boss_hp_per_wave: float
+    map_radius: int
+    bomb_cd: int
+    bomb_dmg: int
+    bomb_boss_dmg: int
+
+    def eval(self, expr, **names):
+        """Evaluate one of the formula fields, e.g. eval(b.spawn_rate, gameTime=300)."""
+        py = expr.replace("Math.floor", "floor").replace("Math.pow", "pow").replace("Math.min", "min").replace("Math.max", "max")
+        py = re.sub(r"\bplayer\.", "", py)
+        return eval(py, {"__builtins__": {}}, {"floor": math.floor, "pow": pow, "min": min, "max": max, **names})
+
+
+@dataclass(frozen=True, slots=True)
+class GameData:
+    source_hash: str
+    lines: int
+    chars: tuple
+    weapons: tuple
+    passives: tuple
+    evolutions: tuple
+    enemies: tuple
+    bosses: tuple
+    balance: Balance
+
+    def boss_times(self, until=900):
+        """(seconds, Boss) for every boss wave up to `until`."""
+        by_type = {b.type: b for b in self.bosses}
+        order, step = self.balance.boss_order, self.balance.boss_interval
+        return [(t, by_type[order[i % len(order)]]) for i, t in enumerate(range(step, until + 1, step))]
+
+
+# ── JS literal reader ──
+
+class _Raw(str):
+    """A value that isn't a plain literal (arrow function, expression), kept as source."""
+
+
+_WS = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_NUM = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_IDENT = re.compile(r"[A-Za-z_$][\w$]*")
+_CLOSE = {"(": ")", "[": "]", "{": "}"}
+
+
+class _Reader:
+    def __init__(self, src, pos):
+        self.src, self.pos = src, pos
+
+    def _ws(self):
+        self.pos = _WS.match(self.src, self.pos).end()
+        return self.src[self.pos]
+
+    def value(self):
+        c = self._ws()
+        if c == "[":
+            return self._seq("]", self.value)
+        if c == "{":
+            return dict(self._seq("}", self._pair))
+        if c in "'\"":
+            return self._string()
+        m = _NUM.match(self.src, self.pos)
+        if m and not self.src.startswith("=>", self._after(m.end())):
+            self.pos = m.end()
+            return float(m.group()) if re.search(r"[.eE]", m.group()) else int(m.group())
+        m = _IDENT.match(self.src, self.pos)
+        if m and m.group() in ("true", "false", "null") and self.src[self._after(m.end())] in ",}]":
+            self.pos = m.end()
+            return {"true": True, "false": False, "null": None}[m.group()]
+        return self._raw()
+
+    def _after(self, pos):
+        return _WS.match(self.src, pos).end()
+
+    def _seq(self, close, item):
+        self.pos += 1
+        out = []
+        while self._ws() != close:
+            out.append(item())
+            if self._ws() == ",":
+                self.pos += 1
+        self.pos += 1
+        return out
+
+    def _pair(self):
+        c = self._ws()
+        if c in "'\"":
+            key = self._string()
+        else:
+            m = _IDENT.match(self.src, self.pos)
+            key, self.pos = m.group(), m.end()
+        if self._ws() != ":":
+            raise ValueError(f"expected ':' after {key!r} at {self.pos}")
+        self.pos += 1
+        return key, self.value()
+
+    def _string(self):
+        q, i = self.src[self.pos], self.pos + 1
+        out = []
+        while self.src[i] != q:
+            if self.src[i] == "\\":
+                i += 1
+            out.append(self.src[i])
+            i += 1
+        self.pos = i + 1
+        return "".join(out)
+
+    def _raw(self):
+        """Source text up to the next ',', '}' or ']' at this nesting level."""
+        start, depth, i, s = self.pos, [], self.pos, self.src
+        while depth or s[i] not in ",}]":
+            c = s[i]
+            if c in "'\"`":
+                i = s.index(c, i + 1)
+            elif c in _CLOSE:
+                depth.append(_CLOSE[c])
+            elif depth and c == depth[-1]:
+                depth.pop()
+            i += 1
+        self.pos = i
+        return _Raw(s[start:i].strip())
+
+
+# ── Extraction ──
+
+TABLES = ("CHARS", "WEAPONS", "PASSIVES", "EVOLUTIONS", "ENEMY_DEFS")
+_TABLE_RE = re.compile(r"^const (%s) = " % "|".join(TABLES), re.M)
+_BOSS_RE = re.compile(r"(?:if \(type === (\d+)\)|else) \{ // (\S+)\s*\n\s*(.*?)\n")
+_ASSIGN_RE = re.compile(r"(\w+) = ([^;]+);")
+
+
+def _one(pattern, src, what):
+    m = re.search(pattern, src)
+    if not m:
+        raise ValueError(f"game.js: {what} not found")
+    return m.group(1)
+
+
+def _boss_type(name, src):
+    """The else-branch boss has no `type ===` test; take it from bossTypes' comment order."""
+    order = [int(x) for x in _one(r"const bossTypes = \[([^\]]+)\]", src, "bossTypes").split(",")]
+    names = _one(r"const bossTypes = \[[^\]]+\];\s*//\s*(.+)", src, "bossTypes comment").split("→")
+    return order[[n.strip() for n in names].index(name)]
+
+
+def parse(src):
+    """Build a GameData from game.js source text."""
+    raw = {}
+    for m in _TABLE_RE.finditer(src):
+        raw[m.group(1)] = _Reader(src, m.end()).value()
+    missing = [t for t in TABLES if t not in raw]
+    if missing:
+        raise ValueError(f"game.js: tables not found: {', '.join(missing)}")
+
+    chars = tuple(Character(c["name"], c["desc"], c["weapon"], c["color"], c["hp"], c["spd"], c["atk"], c["range"],
+                            c["unlocked"].split("=>", 1)[1].strip()) for c in raw["CHARS"])
+    weapons = tuple(Weapon(w["name"], w["desc"], w["type"], w["baseCd"], w["color"]) for w in raw["WEAPONS"])
+    passives = tuple(Passive(p["name"], p["desc"], p["stat"], p["val"], p["evoWeapon"]) for p in raw["PASSIVES"])
+    evolutions = tuple(Evolution(e["weapon"], e["passive"], e["name"], e["desc"]) for e in raw["EVOLUTIONS"])
+    enemies = tuple(Enemy(e["name"], e["hp"], e["spd"], e["dmg"], e["radius"], e["exp"], e["pattern"], e["minTime"])
+                    for e in raw["ENEMY_DEFS"])
+
+    body = src[src.index("function spawnBoss("):src.index("function updateSpawning(")]
+    bosses = []
+    for m in _BOSS_RE.finditer(body):
+        stats = {k: _Reader(v, 0).value() for k, v in _ASSIGN_RE.findall(m.group(3))}
+        btype = int(m.group(1)) if m.group(1) else _boss_type(m.group(2), src)
+        bosses.append(Boss(btype, m.group(2), stats["hp"], stats["spd"], stats["dmg"], stats["radius"], stats["exp"], stats["pattern"]))
+
+    balance = Balance(
+        spawn_rate=_one(r"const baseRate = ([^;]+);", src, "baseRate"),
+        burst_count=_one(r"const burstCount = ([^;]+);", src, "burstCount"),
+        hp_scale=_one(r"const hpScale = ([^;]+);", src, "hpScale"),
+        exp_to_next=_one(r"player\.expToNext = ([^;]+);", src, "expToNext"),
+        burst_interval=int(_one(r"Math\.floor\(gameTime\) % (\d+) === 0", src, "burst interval")),
+        enemy_cap=int(_one(r"let enemyCap = (\d+);", src, "enemyCap")),
+        enemy_cap_min=int(_one(r"const ENEMY_CAP_MIN = (\d+)", src, "ENEMY_CAP_MIN")),
+        enemy_cap_max=int(_one(r"ENEMY_CAP_MAX = (\d+);", src, "ENEMY_CAP_MAX")),
+        boss_interval=int(_one(r"nextBossTime \+= (\d+);", src, "boss interval")),
+        boss_order=tuple(int(x) for x in _one(r"const bossTypes = \[([^\]]+)\]", src, "bossTypes").split(",")),
+        boss_hp_per_wave=float(_one(r"const hpMul = 1 \+ w \* ([\d.]+);", src, "boss hpMul")),
+        map_radius=int(_one(r"const mapR = (\d+);", src, "mapR")),
+        bomb_cd=int(_one(r"bombCooldown = ([1-9]\d*);", src, "bomb cooldown")),
+        bomb_dmg=int(_one(r"if \(!e\.isBoss\) \{ e\.hp -= (\d+);", src, "bomb damage")),
+        bomb_boss_dmg=int(_one(r"else \{ e\.hp -= (\d+);", src, "bomb boss damage")),
+    )
+    return GameData(hashlib.sha256(src.encode()).hexdigest(), src.count("\n") + 1,
+                    chars, weapons, passives, evolutions, enemies, tuple(bosses), balance)
+
+
+# ── Cache ──
+
+_TYPES = {"chars": Character, "weapons": Weapon, "passives": Passive, "evolutions": Evolution,
+          "enemies": Enemy, "bosses": Boss}
+
+
+def _to_json(data):
+    d = {"source_hash": data.source_hash, "lines": data.lines, "balance": asdict(data.balance)}
+    for name in _TYPES:
+        d[name] = [asdict(x) for x in getattr(data, name)]
+    return d
+
+
+def _from_json(d):
+    b = d["balance"]
+    b["boss_order"] = tuple(b["boss_order"])
+    return GameData(
+        d["source_hash"], d["lines"],
+        *(tuple(cls(**x) for x in d[name]) for name, cls in _TYPES.items()),
+        Balance(**b),
+    )
+
+
+def _parser_hash():
+    """sha256 of this module's source: the parser and the model it fills."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load(path=GAME_JS, cache=True):
+    """GameData for `path`, from the content-hash cache when possible."""
+    with open(path, "rb") as f:
+        blob = f.read()
+    key = hashlib.sha256(blob).hexdigest()
+    cached = os.path.join(CACHE_DIR, f"{key[:32]}-{_parser_hash()[:16]}.json")
+    if cache and os.path.exists(cached):
+        with open(cached, encoding="utf-8") as f:
+            return _from_json(json.load(f))
+    data = parse(blob.decode("utf-8"))
+    if cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = cached + f".{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_to_json(data), f, ensure_ascii=False)
+        os.replace(tmp, cached)
+    return data
+
+
+if __name__ == "__main__":
+    d = load()
+    print(f"game.js {d.source_hash[:12]} ({d.lines} lines)")
+    for name in _TYPES:
+        print(f"  {name:<10} {len(getattr(d, name))}")
+    print(f"  balance    spawn {d.balance.spawn_rate}")
@@ -1,12 +1,52 @@
 #!/usr/bin/env python3
-"""퇴마록 재현용 프롬프트 PPT 생성"""
-
+"""퇴마록 재현용 프롬프트 PPT 생성
+
+Each slide is a builder registered with @deck_slide. A slide's fingerprint
+covers its builder source, the helpers it renders with, palette and style,
+and the inputs it declares. Slides with a known fingerprint reuse their cached
+XML, and the deck is not saved again when nothing changed. After a save,
+cached slides that no deck lists any more are pruned.
+
+    python3 make_ppt.py                  # incremental rebuild
+    python3 make_ppt.py --slides 3,5-7   # only these slides
+    python3 make_ppt.py --force -o out.pptx
+    python3 make_ppt.py --locale ko,en --palette dark,light   # batch, one deck per variant
+
+Locales are the string tables in deck_strings.py; palettes are PALETTES below.
+A batch builds each variant in a process pool worker.
+"""
+
+import argparse
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pptx
 from pptx import Presentation
+from pptx.dml.fill import FillFormat
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Paragraph
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+import deck_strings
+import gamedata
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(ROOT, "퇴마록_재현_프롬프트.pptx")
+CACHE_DIR = os.path.join(ROOT, ".cache", "deck")
+CACHE_VERSION = 4       # bump when the cache layout changes
+
 # ── Colors ──
 BG_DARK = RGBColor(26, 10, 10)       # #1a0a0a
 BG_CARD = RGBColor(42, 28, 20)       # #2a1c14
@@ -21,20 +61,291 @@ BLUE = RGBColor(100, 180, 255)
 ORANGE = RGBColor(255, 140, 40)
 PURPLE = RGBColor(170, 100, 255)
 CYAN = RGBColor(130, 220, 255)
+PINK = RGBColor(255, 100, 100)
+BRONZE = RGBColor(136, 102, 68)
+LINK = RGBColor(100, 140, 180)
+TABLE_HEAD = RGBColor(50, 30, 20)
+TABLE_ROW = RGBColor(45, 30, 22)
+TABLE_ROW_ALT = RGBColor(35, 25, 18)
+
+PALETTE = ("BG_DARK", "BG_CARD", "GOLD", "RED", "WHITE", "LIGHT_GRAY", "MED_GRAY", "DIM_GRAY",
+           "GREEN", "BLUE", "ORANGE", "PURPLE", "CYAN", "PINK", "BRONZE", "LINK",
+           "TABLE_HEAD", "TABLE_ROW", "TABLE_ROW_ALT")
+
+# The names keep their dark-theme meaning: in "light", WHITE and the grays are
+# the dark text colours and BG_DARK is the paper.
+PALETTES = {
+    "dark": {name: globals()[name] for name in PALETTE},
+    "light": {
+        "BG_DARK": RGBColor(250, 246, 238),
+        "BG_CARD": RGBColor(236, 226, 210),
+        "GOLD": RGBColor(176, 120, 0),
+        "RED": RGBColor(190, 40, 40),
+        "WHITE": RGBColor(30, 20, 15),
+        "LIGHT_GRAY": RGBColor(60, 60, 60),
+        "MED_GRAY": RGBColor(100, 100, 100),
+        "DIM_GRAY": RGBColor(140, 140, 140),
+        "GREEN": RGBColor(30, 140, 30),
+        "BLUE": RGBColor(30, 100, 190),
+        "ORANGE": RGBColor(200, 95, 0),
+        "PURPLE": RGBColor(110, 50, 190),
+        "CYAN": RGBColor(0, 120, 160),
+        "PINK": RGBColor(200, 60, 60),
+        "BRONZE": RGBColor(136, 102, 68),
+        "LINK": RGBColor(40, 90, 150),
+        "TABLE_HEAD": RGBColor(235, 220, 190),
+        "TABLE_ROW": RGBColor(248, 242, 230),
+        "TABLE_ROW_ALT": RGBColor(240, 232, 218),
+    },
+}
+
+
+def use_palette(name):
+    """Rebind the colour globals to PALETTES[name]."""
+    globals().update(PALETTES[name])
+
+SW = Inches(13.333)
+SH = Inches(7.5)
+
+# Prose that isn't in game.js, keyed by name
+CHAR_LOOKS = {
+    "퇴마사": ("하얀 도복, 검은 갓모자, 파란 허리띠, 손에 빨간 부적", "하얀 도복+검은 갓+부적"),
+    "무녀": ("빨간 치마 흰 저고리, 긴 검은 머리+분홍 꽃장식, 손에 금색 방울", "빨간치마+꽃장식+방울"),
+    "전우치": ("보라 도포, 검은 갓+보라 끈, 손에 도술 부채, 도술 오라", "보라도포+갓+도술부채"),
+    "홍길동": ("녹색 의적 의복, 녹색 두건+리본, 손에 칼, 바람 이펙트", "녹색의복+두건+칼"),
+    "장군": ("갈색 갑옷+금장식, 빨간 투구, 창", "갈색갑옷+빨간투구+창"),
+    "산신령": ("흰 도복, 긴 흰 수염, 녹색 오라, 옆에 주황 호랑이", "흰도복+흰수염+녹색오라+호랑이"),
+}
+WEAPON_NOTES = {
+    "부적": "레벨=개수,evolved:7발+처치시범위폭발",
+    "신령 방울": "min(lv,3)발",
+    "도깨비 방망이": "궤도회전,min(1+lv/2,3)개,evolved:4개+넉백",
+    "여우불": "evolved:9궤도화염",
+    "천둥": "즉발min(lv,3)대상,evolved:5체인+슬로우1.5초 게임타임기반",
+    "신궁": "min(lv,3)발,lv5:무한관통",
+    "용의 숨결": "부채꼴,lv3+화상,evolved:관통드래곤",
+    "귀살검": "전방베기,lv5:후방도공격",
+}
+PASSIVE_NOTES = {
+    "regen": ("3초/lv, 3+lv*2 회복", "3초/lv간격, 3+lv*2회복, 초록숫자+파티클"),
+    "dodge": (None, "\"회피!\"텍스트+파란파티클"),
+    "crit": (None, "\"크리!\"텍스트"),
+}
+PATTERN_LABELS = {"sniper": "sniper(투사체)", "formation": "formation(3동시)"}
+ENEMY_LOOKS = {
+    "잡귀": "보라 유령, 빨간 눈",
+    "도깨불": "파란 도깨비불",
+    "물귀신": "녹색 물괴물, 해초머리",
+    "야차": "빨간 악귀, 금색 뿔",
+    "강시": "청록 관복, 노란 부적",
+    "원귀": "반투명 흰 유령",
+    "삼두구": "3머리 개",
+    "이무기": "녹색 뱀용, 뿔",
+}
+BOSS_NOTES = {
+    "귀왕": ("추적→돌진→범위폭발+잡귀3소환", "2~3배 크기, 5개 금색 뿔 왕관, 빛나는 주황 눈, 큰 도끼"),
+    "도깨비왕": ("접근→방망이 충격파+돌 4방향→돌진", "거대한 파란 도깨비, 금색 뿔 3개, 빛나는 빨간 눈, 거대한 방망이"),
+    "구미호왕": ("궤도+유도탄→여우불5장판", "거대 9미호, 9개 불꽃 꼬리, 금색 한복, 여우귀"),
+}
+PROSE = ("CHAR_LOOKS", "WEAPON_NOTES", "PASSIVE_NOTES", "PATTERN_LABELS", "ENEMY_LOOKS", "BOSS_NOTES")
+
+# ── Locale ──
+# Korean is the source language. tr() looks the Korean text up in the active
+# deck_strings table and falls back to it when there is no entry.
+LOCALES = ("ko",) + tuple(deck_strings.STRINGS)
+LOCALE = "ko"
+_PROSE_KO = {name: globals()[name] for name in PROSE}
+
+
+def tr(text, **fields):
+    text = deck_strings.STRINGS.get(LOCALE, {}).get(text, text)
+    return text.format(**fields) if fields else text
+
+
+def _tr_value(v):
+    if isinstance(v, tuple):
+        return tuple(_tr_value(x) for x in v)
+    return tr(v) if isinstance(v, str) else v
+
+
+def use_locale(name):
+    """Switch tr() to `name` and rebind the prose dicts, keys included, to it."""
+    global LOCALE
+    LOCALE = name
+    for prose, table in _PROSE_KO.items():
+        globals()[prose] = {tr(k): _tr_value(v) for k, v in table.items()}
+
+
+def localise(d):
+    """GameData with names and descriptions from game.js in the active locale."""
+    if LOCALE == "ko":
+        return d
+
+    def each(items, *fields):
+        return tuple(replace(x, **{f: tr(getattr(x, f)) for f in fields}) for x in items)
+    return replace(d, chars=each(d.chars, "name", "desc"), weapons=each(d.weapons, "name", "desc"),
+                   passives=each(d.passives, "name", "desc"), evolutions=each(d.evolutions, "name", "desc"),
+                   enemies=each(d.enemies, "name"), bosses=each(d.bosses, "name"))
+
+
+
+# Recreation prompts (slides 9 and 10), filled in from the game data
+PROMPT_1 = """한국 신화 뱀서라이크(Vampire Survivors류) 게임 "퇴마록"을 HTML5 Canvas 단일 파일(game.js)로 만들어줘.
+외부 이미지/라이브러리 없이 Canvas API로 모든 픽셀아트를 직접 그려야 해.
+GitHub Pages로 배포할 거야. repo: studiovarem-ui/toemarok
+
+## 기술 스펙
+- 캔버스: 400×700, CSS flex 중앙정렬, image-rendering: pixelated
+- 모바일 최적화: touch-area div(z-index:10), canvas.getBoundingClientRect()로 좌표 변환
+- touchstart에서 e.preventDefault() 사용하므로 click 이벤트 차단됨 → handleTap() 함수를 만들어서 touchstart와 click 양쪽에서 호출
+- 상태: title → charSelect → playing ↔ levelUp → gameOver / victory
+- Web Audio API로 효과음 (hit, kill, levelup, bomb, pickup, boss)
+- localStorage 저장 (unlocks, bestTime, bestKills, totalClears)
+
+## 캐릭터 {n}종 (각각 고유 픽셀아트 스프라이트 함수)
+{char_specs}
+
+각 캐릭터는 16-20px 상세 픽셀아트: {char_looks}"""
+
+PROMPT_2 = """## 무기 {weapons}종
+{weapon_specs}
+
+투사체별 개별 크리티컬 판정(rollCrit()), 크리시 "크리!" + 대미지×2
+
+## 패시브 {passives}종: {passive_specs}
+
+## 진화: {evo_specs}
+
+## 적 {enemies}종: {enemy_specs}
+
+## 보스 ({boss_interval}초마다 순환, 웨이브당 HP+{boss_hp:.0f}%, 구미호왕 처치시 victory화면):
+{boss_specs}
+
+## 밸런스: 스폰={spawn}
+웨이브{burst_interval}초마다={burst}, HP스케일={hp_scale}
+맵반경{map_radius}, 적max{cap}(먼적제거), 폭탄cd{bomb_cd}초(전체{bomb_dmg}대미지,보스{bomb_boss})
+
+## 버그방지: 적uid사용(_tick추적), 천둥슬로우=게임타임타이머(setTimeout금지),
+호밍리타겟, 적존대미지=0.5초틱(dmg*dt금지)
+
+game.js가 길면 여러 파트로 나눠서 cat >>으로 이어붙여.
+완성 후 GitHub Pages 배포."""
+
+
+def n(v):
+    """Table number: 150, 1.2, 0.5"""
+    return f"{v:g}"
+
+
+def pad(name, width=3):
+    """Align Korean names in monospace-ish prose columns."""
+    return name + " " * max(1, 3 + 3 * (width - len(name)))
+
+
+def formula(expr):
+    return expr.replace("Math.", "").replace("player.", "")
+
+
+def per_level(p):
+    note = PASSIVE_NOTES.get(p.stat, (None,))[0]
+    return note or f"{'-' if p.stat == 'cdr' else '+'}{n(p.val * 100)}%"
+
+
+def evo_for_passive(d, i):
+    return next((e for e in d.evolutions if e.passive == i), None)
+
+
+def evo_for_weapon(d, i):
+    return next((e for e in d.evolutions if e.weapon == i), None)
+
+
+def boss_first_times(d, until=900):
+    times = {}
+    for t, b in d.boss_times(until):
+        times.setdefault(b.name, []).append(t)
+    return times
+
+
+def secs(t):
+    return tr("{t}초", t=n(t))
+
+
+def unlock_label(c):
+    """c.unlock_label in the active locale. Its number is a {n} field in the string table."""
+    label = c.unlock_label
+    num = re.search(r"\d+", label)
+    return tr(label.replace(num.group(), "{n}", 1), n=num.group()) if num else tr(label)
+
+
+def unlock_text(c):
+    label = unlock_label(c)
+    return tr("{label}해금", label=label) if c.unlock == "true" else label
+
+
+def weapon_spec(w):
+    note = WEAPON_NOTES.get(w.name)
+    return f"{w.name.replace(' ', '')}({w.type},cd:{w.base_cd:.1f}{',' + note if note else ''})"
+
+
+def passive_spec(p):
+    note = PASSIVE_NOTES.get(p.stat, (None, None))[1]
+    if p.stat == "regen":
+        return f"{p.name}(regen: {note})"
+    val = f"{p.stat}{'-' if p.stat == 'cdr' else '+'}{n(p.val * 100)}%"
+    return f"{p.name.replace(' ', '')}({val}{', ' + note if note else ''})"
+
+
+def enemy_spec(i, e):
+    pattern = PATTERN_LABELS.get(e.pattern, e.pattern).replace("(", "").replace(")", "")
+    if i == 0:
+        return f"{e.name}(hp:{n(e.hp)},spd:{n(e.spd)},dmg:{n(e.dmg)},{pattern},{secs(e.min_time)})"
+    return f"{e.name}({n(e.hp)},{n(e.spd)},{n(e.dmg)},{pattern},{secs(e.min_time)})"
+
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
-SW = prs.slide_width
-SH = prs.slide_height
+# ── Style templates ──
+# Each distinct paragraph or cell style is built once through python-pptx and
+# cloned per use, instead of re-applying every font property to each paragraph.
+FONT = "맑은 고딕"
+STYLE = ("FONT",)       # style constants the templates read, hashed like PALETTE
 
 
-def add_bg(slide, color=BG_DARK):
+@functools.lru_cache(maxsize=None)
+def text_style(size, color, bold, align, space_after=None):
+    """<a:pPr> template. bold=None leaves the attribute unset."""
+    p = _Paragraph(parse_xml(f"<a:p {nsdecls('a')}/>"), None)
+    p.font.size = Pt(size)
+    p.font.color.rgb = color
+    if bold is not None:
+        p.font.bold = bold
+    p.font.name = FONT
+    p.alignment = align
+    if space_after is not None:
+        p.space_after = Pt(space_after)
+    return p._p.pPr
+
+
+@functools.lru_cache(maxsize=None)
+def cell_style(color):
+    """<a:tcPr> template with a solid fill."""
+    tcPr = parse_xml(f"<a:tcPr {nsdecls('a')}/>")
+    fill = FillFormat.from_fill_parent(tcPr)
+    fill.solid()
+    fill.fore_color.rgb = color
+    return tcPr
+
+
+def styled_p(p, style, text=""):
+    """Fill the empty <a:p> `p` with a clone of `style` and `text`, as paragraph.text would."""
+    p.append(copy.deepcopy(style))
+    p.append_text(text)
+
+
+def add_bg(slide, color=None):
     """Fill slide background with solid color."""
     bg = slide.background
     fill = bg.fill
     fill.solid()
-    fill.fore_color.rgb = color
+    fill.fore_color.rgb = color or BG_DARK
 
 
 def add_shape(slide, left, top, width, height, fill_color=None, border_color=None, border_width=Pt(0)):
@@ -51,42 +362,28 @@ def add_shape(slide, left, top, width, height, fill_color=None, border_color=Non
     return shape
 
 
-def add_text(slide, left, top, width, height, text, font_size=14, color=WHITE, bold=False, align=PP_ALIGN.LEFT):
+def add_text(slide, left, top, width, height, text, font_size=14, color=None, bold=False, align=PP_ALIGN.LEFT):
     txBox = slide.shapes.add_textbox(left, top, width, height)
     tf = txBox.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.color.rgb = color
-    p.font.bold = bold
-    p.alignment = align
-    p.font.name = "맑은 고딕"
+    styled_p(tf._txBody.p_lst[0], text_style(font_size, color or WHITE, bold, align), text)
     return txBox
 
 
-def add_multiline(slide, left, top, width, height, lines, default_size=13, default_color=LIGHT_GRAY):
+def add_multiline(slide, left, top, width, height, lines, default_size=13, default_color=None):
     """lines: list of (text, size, color, bold, align)"""
     txBox = slide.shapes.add_textbox(left, top, width, height)
     tf = txBox.text_frame
     tf.word_wrap = True
+    txBody = tf._txBody
     for i, line_data in enumerate(lines):
         text = line_data[0]
         size = line_data[1] if len(line_data) > 1 else default_size
-        color = line_data[2] if len(line_data) > 2 else default_color
+        color = line_data[2] if len(line_data) > 2 else default_color or LIGHT_GRAY
         bold = line_data[3] if len(line_data) > 3 else False
         align = line_data[4] if len(line_data) > 4 else PP_ALIGN.LEFT
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = text
-        p.font.size = Pt(size)
-        p.font.color.rgb = color
-        p.font.bold = bold
-        p.font.name = "맑은 고딕"
-        p.alignment = align
-        p.space_after = Pt(2)
+        p = txBody.p_lst[0] if i == 0 else txBody.add_p()
+        styled_p(p, text_style(size, color, bold, align, space_after=2), text)
     return txBox
 
 
@@ -101,507 +398,702 @@ def add_table(slide, left, top, width, height, rows, col_widths=None):
         for i, w in enumerate(col_widths):
             table.columns[i].width = w
 
-    for r_idx, row in enumerate(rows):
-        for c_idx, cell_text in enumerate(row):
-            cell = table.cell(r_idx, c_idx)
-            cell.text = str(cell_text)
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.size = Pt(10)
-                paragraph.font.name = "맑은 고딕"
-                if r_idx == 0:
-                    paragraph.font.bold = True
-                    paragraph.font.color.rgb = GOLD
-                else:
-                    paragraph.font.color.rgb = LIGHT_GRAY
-                paragraph.alignment = PP_ALIGN.CENTER
-
-            # Cell fill
-            cell_fill = cell.fill
-            cell_fill.solid()
-            if r_idx == 0:
-                cell_fill.fore_color.rgb = RGBColor(50, 30, 20)
-            elif r_idx % 2 == 0:
-                cell_fill.fore_color.rgb = RGBColor(35, 25, 18)
-            else:
-                cell_fill.fore_color.rgb = RGBColor(45, 30, 22)
+    head = text_style(10, GOLD, True, PP_ALIGN.CENTER)
+    body = text_style(10, LIGHT_GRAY, None, PP_ALIGN.CENTER)
+    for r_idx, (tr, row) in enumerate(zip(table._tbl.tr_lst, rows)):
+        style = head if r_idx == 0 else body
+        # Cell fill
+        if r_idx == 0:
+            fill = cell_style(TABLE_HEAD)
+        elif r_idx % 2 == 0:
+            fill = cell_style(TABLE_ROW_ALT)
+        else:
+            fill = cell_style(TABLE_ROW)
+        for tc, cell_text in zip(tr.tc_lst, row):
+            txBody = tc.txBody
+            txBody.clear_content()
+            for line in str(cell_text).split("\n"):
+                styled_p(txBody.add_p(), style, line)
+            tc.replace(tc.tcPr, copy.deepcopy(fill))
 
     return table_shape
 
 
+# ── Slide registry ──
+SLIDES = []     # (builder, inputs) in deck order
+
+
+def deck_slide(*inputs):
+    """Register a slide builder(slide, d). `inputs` names what it reads:
+    GameData fields ("chars", "balance") or prose dicts ("CHAR_LOOKS")."""
+    def register(builder):
+        SLIDES.append((builder, inputs))
+        return builder
+    return register
+
+
 # ════════════════════════════════════════════
 # SLIDE 1: 표지
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
-add_bg(slide)
+@deck_slide()
+def slide_cover(slide, d):
+    add_bg(slide)
 
-# Decorative top bar
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+    # Decorative top bar
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
 
-# Title
-add_text(slide, Inches(0), Inches(1.8), SW, Inches(1.2),
-         "퇴  마  록", 72, GOLD, True, PP_ALIGN.CENTER)
-add_text(slide, Inches(0), Inches(3.0), SW, Inches(0.5),
-         "TOEMAROK", 24, RGBColor(136, 102, 68), False, PP_ALIGN.CENTER)
-add_text(slide, Inches(0), Inches(3.5), SW, Inches(0.5),
-         "한국 신화 뱀서라이크 — 재현용 프롬프트 가이드", 16, MED_GRAY, False, PP_ALIGN.CENTER)
+    # Title
+    add_text(slide, Inches(0), Inches(1.8), SW, Inches(1.2),
+             tr("퇴  마  록"), 72, GOLD, True, PP_ALIGN.CENTER)
+    add_text(slide, Inches(0), Inches(3.0), SW, Inches(0.5),
+             "TOEMAROK", 24, BRONZE, False, PP_ALIGN.CENTER)
+    add_text(slide, Inches(0), Inches(3.5), SW, Inches(0.5),
+             tr("한국 신화 뱀서라이크 — 재현용 프롬프트 가이드"), 16, MED_GRAY, False, PP_ALIGN.CENTER)
 
-# Bottom info
-add_text(slide, Inches(0), Inches(5.8), SW, Inches(0.4),
-         "HTML5 Canvas  •  Pixel Art  •  No External Assets  •  Mobile Optimized", 12, DIM_GRAY, False, PP_ALIGN.CENTER)
-add_text(slide, Inches(0), Inches(6.2), SW, Inches(0.4),
-         "github.com/studiovarem-ui/toemarok", 11, RGBColor(100, 140, 180), False, PP_ALIGN.CENTER)
+    # Bottom info
+    add_text(slide, Inches(0), Inches(5.8), SW, Inches(0.4),
+             "HTML5 Canvas  •  Pixel Art  •  No External Assets  •  Mobile Optimized", 12, DIM_GRAY, False, PP_ALIGN.CENTER)
+    add_text(slide, Inches(0), Inches(6.2), SW, Inches(0.4),
+             "github.com/studiovarem-ui/toemarok", 11, LINK, False, PP_ALIGN.CENTER)
 
-# Bottom bar
-add_shape(slide, Inches(0), Inches(7.44), SW, Inches(0.06), GOLD)
+    # Bottom bar
+    add_shape(slide, Inches(0), Inches(7.44), SW, Inches(0.06), GOLD)
 
 
 # ════════════════════════════════════════════
 # SLIDE 2: 기술 스펙 개요
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "📋 기술 스펙 & 핵심 구조", 28, GOLD, True)
-
-# Left column
-left_lines = [
-    ("▎ 캔버스 & 렌더링", 14, ORANGE, True),
-    ("  • 해상도: 400×700 (세로형 모바일)", 12, LIGHT_GRAY),
-    ("  • CSS flex 중앙정렬, image-rendering: pixelated", 12, LIGHT_GRAY),
-    ("  • 모든 그래픽 Canvas API 직접 렌더링 (외부 이미지 없음)", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 게임 상태 머신", 14, ORANGE, True),
-    ("  title → charSelect → playing ↔ levelUp → gameOver / victory", 12, CYAN),
-    ("", 8),
-    ("▎ 오디오", 14, ORANGE, True),
-    ("  • Web Audio API 프로시저럴 사운드", 12, LIGHT_GRAY),
-    ("  • 종류: hit, kill, levelup, bomb, pickup, boss", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 저장 시스템", 14, ORANGE, True),
-    ("  • localStorage: unlocks, bestTime, bestKills, totalClears", 12, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.8), Inches(5.5), left_lines)
-
-# Right column
-right_lines = [
-    ("▎ 모바일 입력 (중요!)", 14, RED, True),
-    ("  • touch-area div (z-index:10) 위에서 터치 이벤트 처리", 12, LIGHT_GRAY),
-    ("  • screenToCanvas(): canvas.getBoundingClientRect() 사용", 12, CYAN),
-    ("  • touchstart에서 e.preventDefault() → click 차단됨", 12, LIGHT_GRAY),
-    ("  • handleTap() 함수로 touch/click 양쪽에서 통합 호출", 12, GREEN),
-    ("", 8),
-    ("▎ 핵심 버그 방지 패턴", 14, RED, True),
-    ("  • 적 고유 uid (enemyIdCounter++) — 배열 index 사용 금지", 12, LIGHT_GRAY),
-    ("  • 존/궤도 무기의 _tick 추적은 uid 기반", 12, LIGHT_GRAY),
-    ("  • 천둥 슬로우: setTimeout ❌ → 게임타임 타이머 ✅", 12, LIGHT_GRAY),
-    ("  • 호밍 투사체: 타겟 사망시 자동 리타겟", 12, LIGHT_GRAY),
-    ("  • 적 존 대미지: dmg*dt ❌ → 0.5초 틱 ✅", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 파일 구조", 14, ORANGE, True),
-    ("  index.html  /  style.css  /  game.js (~2100줄)", 12, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(6.8), Inches(1.0), Inches(6.0), Inches(5.5), right_lines)
+@deck_slide("lines")
+def slide_spec(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("📋 기술 스펙 & 핵심 구조"), 28, GOLD, True)
+
+    # Left column
+    left_lines = [
+        (tr("▎ 캔버스 & 렌더링"), 14, ORANGE, True),
+        (tr("  • 해상도: 400×700 (세로형 모바일)"), 12, LIGHT_GRAY),
+        (tr("  • CSS flex 중앙정렬, image-rendering: pixelated"), 12, LIGHT_GRAY),
+        (tr("  • 모든 그래픽 Canvas API 직접 렌더링 (외부 이미지 없음)"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 게임 상태 머신"), 14, ORANGE, True),
+        ("  title → charSelect → playing ↔ levelUp → gameOver / victory", 12, CYAN),
+        ("", 8),
+        (tr("▎ 오디오"), 14, ORANGE, True),
+        (tr("  • Web Audio API 프로시저럴 사운드"), 12, LIGHT_GRAY),
+        (tr("  • 종류: hit, kill, levelup, bomb, pickup, boss"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 저장 시스템"), 14, ORANGE, True),
+        ("  • localStorage: unlocks, bestTime, bestKills, totalClears", 12, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.8), Inches(5.5), left_lines)
+
+    # Right column
+    right_lines = [
+        (tr("▎ 모바일 입력 (중요!)"), 14, RED, True),
+        (tr("  • touch-area div (z-index:10) 위에서 터치 이벤트 처리"), 12, LIGHT_GRAY),
+        (tr("  • screenToCanvas(): canvas.getBoundingClientRect() 사용"), 12, CYAN),
+        (tr("  • touchstart에서 e.preventDefault() → click 차단됨"), 12, LIGHT_GRAY),
+        (tr("  • handleTap() 함수로 touch/click 양쪽에서 통합 호출"), 12, GREEN),
+        ("", 8),
+        (tr("▎ 핵심 버그 방지 패턴"), 14, RED, True),
+        (tr("  • 적 고유 uid (enemyIdCounter++) — 배열 index 사용 금지"), 12, LIGHT_GRAY),
+        (tr("  • 존/궤도 무기의 _tick 추적은 uid 기반"), 12, LIGHT_GRAY),
+        (tr("  • 천둥 슬로우: setTimeout ❌ → 게임타임 타이머 ✅"), 12, LIGHT_GRAY),
+        (tr("  • 호밍 투사체: 타겟 사망시 자동 리타겟"), 12, LIGHT_GRAY),
+        (tr("  • 적 존 대미지: dmg*dt ❌ → 0.5초 틱 ✅"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 파일 구조"), 14, ORANGE, True),
+        (tr("  index.html  /  style.css  /  game.js (~{lines}줄)", lines=round(d.lines, -2)), 12, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(6.8), Inches(1.0), Inches(6.0), Inches(5.5), right_lines)
 
 
 # ════════════════════════════════════════════
-# SLIDE 3: 캐릭터 6종
+# SLIDE 3: 캐릭터
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "🎭 캐릭터 6종", 28, GOLD, True)
-
-chars = [
-    ["이름", "설명", "시작무기", "HP", "SPD", "ATK", "RANGE", "해금조건"],
-    ["퇴마사", "균형형", "부적(0)", "150", "130", "1.2", "50", "기본"],
-    ["무녀", "원거리", "신령방울(1)", "120", "120", "1.3", "60", "기본"],
-    ["도깨비", "근접", "방망이(2)", "180", "110", "1.5", "40", "1클리어"],
-    ["구미호", "속도", "여우불(3)", "100", "170", "1.1", "45", "3클리어"],
-    ["장군", "탱커", "신궁(5)", "220", "100", "1.2", "35", "5클리어"],
-    ["산신령", "소환", "천둥(4)", "130", "110", "1.4", "70", "생존900초"],
-]
-add_table(slide, Inches(0.5), Inches(1.1), Inches(12.3), Inches(2.2), chars)
-
-# Sprite descriptions
-add_text(slide, Inches(0.5), Inches(3.5), Inches(12), Inches(0.4),
-         "스프라이트 디자인 (16-20px 픽셀아트)", 16, ORANGE, True)
-
-sprite_lines = [
-    ("퇴마사   하얀 도복, 검은 갓모자, 파란 허리띠, 손에 빨간 부적", 11, LIGHT_GRAY),
-    ("무녀      빨간 치마 흰 저고리, 긴 검은 머리+분홍 꽃장식, 손에 금색 방울", 11, LIGHT_GRAY),
-    ("도깨비   파란 피부, 금색 뿔, 빨간 눈, 큰 갈색 방망이 (쇠스파이크)", 11, LIGHT_GRAY),
-    ("구미호   분홍 한복, 여우귀, 5개 주황꼬리 (흔들림 애니메이션), 여우불 이펙트", 11, LIGHT_GRAY),
-    ("장군      갈색 갑옷+금장식, 빨간 투구, 창", 11, LIGHT_GRAY),
-    ("산신령   흰 도복, 긴 흰 수염, 녹색 오라, 옆에 주황 호랑이", 11, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(0.7), Inches(4.0), Inches(11.5), Inches(3.0), sprite_lines)
+@deck_slide("chars", "weapons", "CHAR_LOOKS")
+def slide_characters(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("🎭 캐릭터 {n}종", n=len(d.chars)), 28, GOLD, True)
+
+    chars = [[tr("이름"), tr("설명"), tr("시작무기"), "HP", "SPD", "ATK", "RANGE", tr("해금조건")]]
+    for c in d.chars:
+        chars.append([c.name, c.desc, f"{d.weapons[c.weapon].name}({c.weapon})",
+                      n(c.hp), n(c.spd), n(c.atk), n(c.range), unlock_label(c)])
+    add_table(slide, Inches(0.5), Inches(1.1), Inches(12.3), Inches(2.2), chars)
+
+    # Sprite descriptions
+    add_text(slide, Inches(0.5), Inches(3.5), Inches(12), Inches(0.4),
+             tr("스프라이트 디자인 (16-20px 픽셀아트)"), 16, ORANGE, True)
+
+    sprite_lines = [(pad(c.name) + CHAR_LOOKS.get(c.name, (c.desc,))[0], 11, LIGHT_GRAY) for c in d.chars]
+    add_multiline(slide, Inches(0.7), Inches(4.0), Inches(11.5), Inches(3.0), sprite_lines)
 
 
 # ════════════════════════════════════════════
-# SLIDE 4: 무기 8종
+# SLIDE 4: 무기
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "⚔️ 무기 8종", 28, GOLD, True)
-
-weapons = [
-    ["ID", "이름", "타입", "쿨타임", "설명", "진화"],
-    ["0", "부적", "projectile", "0.5", "전방 투사체, 레벨=개수", "봉인진: 처치시 범위폭발"],
-    ["1", "신령 방울", "homing", "0.8", "유도탄 min(lv,3)발", "—"],
-    ["2", "도깨비 방망이", "spin", "1.0", "궤도 회전, min(1+lv/2,3)개", "여의봉: 3배크기"],
-    ["3", "여우불", "zone", "1.5", "불꽃 장판, min(1+lv/2,3)개", "삼매화: 9개궤도화염"],
-    ["4", "천둥", "thunder", "1.2", "즉발 낙뢰 min(lv,3)대상", "뇌신: 5체인+마비"],
-    ["5", "신궁", "pierce", "0.6", "관통 화살, lv5=무한관통", "—"],
-    ["6", "용의 숨결", "breath", "1.8", "전방 부채꼴, lv3+화상", "청룡: 화면관통용"],
-    ["7", "귀살검", "slash", "0.4", "전방 베기, lv5:후방도 공격", "—"],
-]
-add_table(slide, Inches(0.3), Inches(1.0), Inches(12.7), Inches(2.8), weapons)
-
-# Projectile rendering
-add_text(slide, Inches(0.5), Inches(4.0), Inches(12), Inches(0.4),
-         "투사체 렌더링 스타일", 16, ORANGE, True)
-
-proj_lines = [
-    ("부적       회전하는 빨간 카드 + 금색 부적문양 + 잔상 트레일", 11, LIGHT_GRAY),
-    ("방울       금색 구슬 + 음파 링 이펙트 (확장되는 원)", 11, LIGHT_GRAY),
-    ("방망이    궤도 회전 곤봉 (나무 손잡이 + 쇠머리 + 스파이크) + 궤도링 표시", 11, LIGHT_GRAY),
-    ("여우불    다층 불꽃 (#FF4400→#FF8844→#FFCC44→#FFF) + 불씨 파티클", 11, LIGHT_GRAY),
-    ("천둥       지그재그 번개 볼트 (fillPath) + 글로우 (반투명 원)", 11, LIGHT_GRAY),
-    ("화살       화살촉 삼각형 + 속도선 잔상 (반투명 가로줄)", 11, LIGHT_GRAY),
-    ("용숨결    evolved: 큰 파란 드래곤 투사체 (3원 몸통 + 노란 눈)", 11, LIGHT_GRAY),
-    ("귀살검    반달형 슬래시 아크 (ctx.arc stroke) + 흰색 하이라이트", 11, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(0.7), Inches(4.5), Inches(11.5), Inches(3.0), proj_lines)
+@deck_slide("weapons", "evolutions")
+def slide_weapons(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("⚔️ 무기 {n}종", n=len(d.weapons)), 28, GOLD, True)
+
+    weapons = [["ID", tr("이름"), tr("타입"), tr("쿨타임"), tr("설명"), tr("진화")]]
+    for i, w in enumerate(d.weapons):
+        evo = evo_for_weapon(d, i)
+        weapons.append([str(i), w.name, w.type, f"{w.base_cd:.1f}", w.desc, f"{evo.name}: {evo.desc}" if evo else "—"])
+    add_table(slide, Inches(0.3), Inches(1.0), Inches(12.7), Inches(2.8), weapons)
+
+    # Projectile rendering
+    add_text(slide, Inches(0.5), Inches(4.0), Inches(12), Inches(0.4),
+             tr("투사체 렌더링 스타일"), 16, ORANGE, True)
+
+    proj_lines = [
+        (tr("부적       회전하는 빨간 카드 + 금색 부적문양 + 잔상 트레일"), 11, LIGHT_GRAY),
+        (tr("방울       금색 구슬 + 음파 링 이펙트 (확장되는 원)"), 11, LIGHT_GRAY),
+        (tr("방망이    궤도 회전 곤봉 (나무 손잡이 + 쇠머리 + 스파이크) + 궤도링 표시"), 11, LIGHT_GRAY),
+        (tr("여우불    다층 불꽃 (#FF4400→#FF8844→#FFCC44→#FFF) + 불씨 파티클"), 11, LIGHT_GRAY),
+        (tr("천둥       지그재그 번개 볼트 (fillPath) + 글로우 (반투명 원)"), 11, LIGHT_GRAY),
+        (tr("화살       화살촉 삼각형 + 속도선 잔상 (반투명 가로줄)"), 11, LIGHT_GRAY),
+        (tr("용숨결    evolved: 큰 파란 드래곤 투사체 (3원 몸통 + 노란 눈)"), 11, LIGHT_GRAY),
+        (tr("귀살검    반달형 슬래시 아크 (ctx.arc stroke) + 흰색 하이라이트"), 11, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(0.7), Inches(4.5), Inches(11.5), Inches(3.0), proj_lines)
 
 
 # ════════════════════════════════════════════
 # SLIDE 5: 패시브 & 진화
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "💎 패시브 8종 & 진화 5종", 28, GOLD, True)
-
-passives = [
-    ["ID", "이름", "스탯", "레벨당", "진화 조합"],
-    ["0", "음양오행", "atk", "+15%", "부적 Lv5 → 봉인진"],
-    ["1", "구미호 가죽", "spd", "+10%", "여우불 Lv5 → 삼매화"],
-    ["2", "풍백 가호", "range", "+12%", "천둥 Lv5 → 뇌신"],
-    ["3", "황금", "exp", "+15%", "방망이 Lv5 → 여의봉"],
-    ["4", "산삼", "regen", "3초/lv, 3+lv*2 회복", "—"],
-    ["5", "여의주", "cdr", "-8%", "용숨결 Lv5 → 청룡"],
-    ["6", "도깨비감투", "dodge", "+10%", "—"],
-    ["7", "삼족오 부적", "crit", "+8%", "—"],
-]
-add_table(slide, Inches(0.3), Inches(1.0), Inches(7.5), Inches(2.8), passives)
-
-# Visual effects
-effect_lines = [
-    ("▎ 패시브 시각 효과 (중요!)", 14, ORANGE, True),
-    ("", 6),
-    ("  산삼 회복     초록색 \"+N\" 숫자 (#44FF44) + 초록 파티클", 12, GREEN),
-    ("  회피 발동     \"회피!\" 하늘색 텍스트 (#88FFFF) + 파란 파티클", 12, CYAN),
-    ("  크리티컬      \"크리!\" 노란 라벨 (#FFDD00) + 큰 대미지 숫자", 12, GOLD),
-    ("", 8),
-    ("▎ 크리티컬 시스템", 14, ORANGE, True),
-    ("  • rollCrit() 함수로 투사체별 개별 판정", 12, LIGHT_GRAY),
-    ("  • 크리시 대미지 ×2", 12, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(8.3), Inches(1.0), Inches(4.5), Inches(3.5), effect_lines)
-
-# Evolutions
-evo_lines = [
-    ("▎ 진화 조건: 무기 Lv5 + 해당 패시브 보유", 14, RED, True),
-    ("", 6),
-    ("  봉인진   부적(0) + 음양오행(0) → 7발 + 처치시 범위폭발", 12, PURPLE),
-    ("  삼매화   여우불(3) + 구미호가죽(1) → 9개 궤도 화염", 12, PURPLE),
-    ("  뇌신      천둥(4) + 풍백가호(2) → 5체인 + 슬로우(1.5초)", 12, PURPLE),
-    ("  여의봉   방망이(2) + 황금(3) → 4궤도 + 넉백", 12, PURPLE),
-    ("  청룡      용숨결(6) + 여의주(5) → 화면 관통 드래곤", 12, PURPLE),
-]
-add_multiline(slide, Inches(0.5), Inches(4.2), Inches(12), Inches(3.0), evo_lines)
+@deck_slide("passives", "weapons", "evolutions", "PASSIVE_NOTES")
+def slide_passives(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("💎 패시브 {n}종 & 진화 {evos}종", n=len(d.passives), evos=len(d.evolutions)), 28, GOLD, True)
+
+    passives = [["ID", tr("이름"), tr("스탯"), tr("레벨당"), tr("진화 조합")]]
+    for i, p in enumerate(d.passives):
+        evo = evo_for_passive(d, i)
+        combo = f"{d.weapons[evo.weapon].name} Lv5 → {evo.name}" if evo else "—"
+        passives.append([str(i), p.name, p.stat, per_level(p), combo])
+    add_table(slide, Inches(0.3), Inches(1.0), Inches(7.5), Inches(2.8), passives)
+
+    # Visual effects
+    effect_lines = [
+        (tr("▎ 패시브 시각 효과 (중요!)"), 14, ORANGE, True),
+        ("", 6),
+        (tr("  산삼 회복     초록색 \"+N\" 숫자 (#44FF44) + 초록 파티클"), 12, GREEN),
+        (tr("  회피 발동     \"회피!\" 하늘색 텍스트 (#88FFFF) + 파란 파티클"), 12, CYAN),
+        (tr("  크리티컬      \"크리!\" 노란 라벨 (#FFDD00) + 큰 대미지 숫자"), 12, GOLD),
+        ("", 8),
+        (tr("▎ 크리티컬 시스템"), 14, ORANGE, True),
+        (tr("  • rollCrit() 함수로 투사체별 개별 판정"), 12, LIGHT_GRAY),
+        (tr("  • 크리시 대미지 ×2"), 12, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(8.3), Inches(1.0), Inches(4.5), Inches(3.5), effect_lines)
+
+    # Evolutions
+    evo_lines = [(tr("▎ 진화 조건: 무기 Lv5 + 해당 패시브 보유"), 14, RED, True), ("", 6)]
+    for e in d.evolutions:
+        evo_lines.append((f"  {pad(e.name)}{d.weapons[e.weapon].name}({e.weapon}) + "
+                          f"{d.passives[e.passive].name}({e.passive}) → {e.desc}", 12, PURPLE))
+    add_multiline(slide, Inches(0.5), Inches(4.2), Inches(12), Inches(3.0), evo_lines)
 
 
 # ════════════════════════════════════════════
-# SLIDE 6: 적 8종
+# SLIDE 6: 적 & 보스
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "👹 적 8종 + 보스 2종", 28, GOLD, True)
-
-enemies = [
-    ["이름", "HP", "SPD", "DMG", "패턴", "등장", "스프라이트"],
-    ["잡귀", "2", "65", "2", "straight", "0초", "보라 유령, 빨간 눈"],
-    ["도깨불", "4", "50", "4", "zigzag", "30초", "파란 도깨비불"],
-    ["물귀신", "6", "40", "4", "aimed", "90초", "녹색 물괴물, 해초머리"],
-    ["야차", "5", "100", "5", "swooper", "150초", "빨간 악귀, 금색 뿔"],
-    ["강시", "16", "30", "6", "tank", "210초", "청록 관복, 노란 부적"],
-    ["원귀", "6", "18", "4", "sniper(투사체)", "270초", "반투명 흰 유령"],
-    ["삼두구", "3", "55", "3", "formation(3동시)", "330초", "3머리 개"],
-    ["이무기", "12", "45", "5", "spiral", "400초", "녹색 뱀용, 뿔"],
-]
-add_table(slide, Inches(0.3), Inches(1.0), Inches(12.7), Inches(2.8), enemies)
-
-# Bosses
-bosses = [
-    ["이름", "HP", "SPD", "DMG", "등장", "패턴"],
-    ["귀왕", "200", "35", "12", "450초", "추적→돌진→범위폭발+잡귀3소환"],
-    ["구미호왕", "500", "30", "15", "900초", "궤도+유도탄→여우불5장판"],
-]
-add_table(slide, Inches(0.3), Inches(4.1), Inches(10), Inches(1.1), bosses)
-
-boss_lines = [
-    ("▎ 보스 스프라이트", 14, ORANGE, True),
-    ("  귀왕: 2~3배 크기, 5개 금색 뿔 왕관, 빛나는 주황 눈, 큰 도끼", 12, LIGHT_GRAY),
-    ("  구미호왕: 거대 9미호, 9개 불꽃 꼬리, 금색 한복, 여우귀", 12, LIGHT_GRAY),
-    ("", 6),
-    ("▎ 적 공통 시스템", 14, ORANGE, True),
-    ("  • 피격 시 흰색 플래시 (hitFlash 0.15초)", 12, LIGHT_GRAY),
-    ("  • 대미지 입은 적만 HP바 표시 (16×2px)", 12, LIGHT_GRAY),
-    ("  • 사망 시 파티클 폭발 + EXP 오브 드롭", 12, LIGHT_GRAY),
-    ("  • 구미호왕 처치 → victory 상태 (승리화면)", 12, GREEN),
-]
-add_multiline(slide, Inches(0.5), Inches(5.3), Inches(12), Inches(2.5), boss_lines)
+@deck_slide("enemies", "bosses", "balance", "PATTERN_LABELS", "ENEMY_LOOKS", "BOSS_NOTES")
+def slide_enemies(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("👹 적 {n}종 + 보스 {bosses}종", n=len(d.enemies), bosses=len(d.bosses)), 28, GOLD, True)
+
+    enemies = [[tr("이름"), "HP", "SPD", "DMG", tr("패턴"), tr("등장"), tr("스프라이트")]]
+    for e in d.enemies:
+        enemies.append([e.name, n(e.hp), n(e.spd), n(e.dmg), PATTERN_LABELS.get(e.pattern, e.pattern),
+                        secs(e.min_time), ENEMY_LOOKS.get(e.name, "")])
+    add_table(slide, Inches(0.3), Inches(1.0), Inches(12.7), Inches(2.8), enemies)
+
+    # Bosses, in order of first appearance
+    boss_times = boss_first_times(d)
+    bosses = [[tr("이름"), "HP", "SPD", "DMG", tr("등장"), tr("패턴")]]
+    for name, times in boss_times.items():
+        b = next(x for x in d.bosses if x.name == name)
+        bosses.append([b.name, n(b.hp), n(b.spd), n(b.dmg), ", ".join(secs(t) for t in times),
+                       BOSS_NOTES.get(b.name, (b.pattern,))[0]])
+    boss_h = 0.37 * len(bosses)
+    add_table(slide, Inches(0.3), Inches(4.1), Inches(10), Inches(boss_h), bosses)
+
+    boss_lines = [(tr("▎ 보스 스프라이트"), 14, ORANGE, True)]
+    for name in boss_times:
+        boss_lines.append((f"  {name}: {BOSS_NOTES.get(name, ('', ''))[1]}", 12, LIGHT_GRAY))
+    boss_lines += [
+        ("", 6),
+        (tr("▎ 적 공통 시스템"), 14, ORANGE, True),
+        (tr("  • 피격 시 흰색 플래시 (hitFlash 0.15초)"), 12, LIGHT_GRAY),
+        (tr("  • 대미지 입은 적만 HP바 표시 (16×2px)"), 12, LIGHT_GRAY),
+        (tr("  • 사망 시 파티클 폭발 + EXP 오브 드롭"), 12, LIGHT_GRAY),
+        (tr("  • 구미호왕 처치 → victory 상태 (승리화면)"), 12, GREEN),
+    ]
+    add_multiline(slide, Inches(0.5), Inches(4.2 + boss_h), Inches(12), Inches(7.3 - 4.2 - boss_h), boss_lines)
 
 
 # ════════════════════════════════════════════
 # SLIDE 7: 밸런스 & 스폰
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "⚖️ 밸런스 & 스폰 시스템", 28, GOLD, True)
-
-bal_left = [
-    ("▎ 스폰 레이트", 16, ORANGE, True),
-    ("", 4),
-    ("  baseRate = 1.2 + gameTime/60 * 0.6", 13, CYAN),
-    ("           + floor(gameTime/60) * 0.3", 13, CYAN),
-    ("", 6),
-    ("  → 시작: ~1.2마리/초", 12, LIGHT_GRAY),
-    ("  → 5분: ~2.7마리/초", 12, LIGHT_GRAY),
-    ("  → 10분: ~4.2마리/초", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 웨이브 버스트 (30초마다)", 16, ORANGE, True),
-    ("", 4),
-    ("  burstCount = 4 + floor(gameTime/60)", 13, CYAN),
-    ("  → 잡귀를 원형 배치로 한꺼번에 소환", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ HP 스케일링", 16, ORANGE, True),
-    ("", 4),
-    ("  hpScale = 1 + gameTime/60 * 0.1", 13, CYAN),
-    ("  → 10분에 적 HP +100%", 12, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.5), Inches(5.5), bal_left)
-
-bal_right = [
-    ("▎ 맵", 16, ORANGE, True),
-    ("", 4),
-    ("  • 반경 1200 원형 맵", 12, LIGHT_GRAY),
-    ("  • 40×40 타일, 해시 기반 색상 변화 + 풀/돌 장식", 12, LIGHT_GRAY),
-    ("  • 경계 접근시 빨간 원 표시", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 적 제한", 16, ORANGE, True),
-    ("", 4),
-    ("  • 최대 200마리", 12, LIGHT_GRAY),
-    ("  • 초과시 가장 먼 적 제거 (sort+pop)", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 경험치", 16, ORANGE, True),
-    ("", 4),
-    ("  • 적 사망 → EXP 오브 드롭", 12, LIGHT_GRAY),
-    ("  • 자석 범위 = range × rangeMul", 12, LIGHT_GRAY),
-    ("  • expToNext = level*10 + level^1.5 * 5", 12, CYAN),
-    ("", 8),
-    ("▎ 폭탄", 16, ORANGE, True),
-    ("", 4),
-    ("  • 쿨다운 30초, 전체 적 50대미지 (보스 25)", 12, LIGHT_GRAY),
-    ("  • 금색 화면 플래시 + 파티클 30개", 12, LIGHT_GRAY),
-]
-add_multiline(slide, Inches(7.0), Inches(1.0), Inches(5.8), Inches(5.8), bal_right)
+@deck_slide("balance")
+def slide_balance(slide, d):
+    bal = d.balance
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("⚖️ 밸런스 & 스폰 시스템"), 28, GOLD, True)
+
+    rate = lambda t: bal.eval(bal.spawn_rate, gameTime=t)
+    head, _, tail = formula(bal.spawn_rate).rpartition(" + ")
+    bal_left = [
+        (tr("▎ 스폰 레이트"), 16, ORANGE, True),
+        ("", 4),
+        (f"  baseRate = {head}", 13, CYAN),
+        (f"           + {tail}", 13, CYAN),
+        ("", 6),
+        (tr("  → 시작: ~{rate:.1f}마리/초", rate=rate(0)), 12, LIGHT_GRAY),
+        (tr("  → 5분: ~{rate:.1f}마리/초", rate=rate(300)), 12, LIGHT_GRAY),
+        (tr("  → 10분: ~{rate:.1f}마리/초", rate=rate(600)), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 웨이브 버스트 ({t}초마다)", t=bal.burst_interval), 16, ORANGE, True),
+        ("", 4),
+        (f"  burstCount = {formula(bal.burst_count)}", 13, CYAN),
+        (tr("  → 잡귀를 원형 배치로 한꺼번에 소환"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ HP 스케일링"), 16, ORANGE, True),
+        ("", 4),
+        (f"  hpScale = {formula(bal.hp_scale)}", 13, CYAN),
+        (tr("  → 10분에 적 HP +{pct:.0f}%", pct=(bal.eval(bal.hp_scale, gameTime=600) - 1) * 100), 12, LIGHT_GRAY),
+        (tr("  → 보스: {t}초마다, 웨이브당 HP +{pct:.0f}%", t=bal.boss_interval, pct=bal.boss_hp_per_wave * 100),
+         12, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.5), Inches(5.5), bal_left)
+
+    bal_right = [
+        (tr("▎ 맵"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  • 반경 {r} 원형 맵", r=bal.map_radius), 12, LIGHT_GRAY),
+        (tr("  • 40×40 타일, 해시 기반 색상 변화 + 풀/돌 장식"), 12, LIGHT_GRAY),
+        (tr("  • 경계 접근시 빨간 원 표시"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 적 제한"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  • 기본 {cap}마리, 프레임 비용에 따라 {lo}~{hi} 자동 조절",
+            cap=bal.enemy_cap, lo=bal.enemy_cap_min, hi=bal.enemy_cap_max), 12, LIGHT_GRAY),
+        (tr("  • 초과시 가장 먼 적 제거 (quickselect)"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 경험치"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  • 적 사망 → EXP 오브 드롭"), 12, LIGHT_GRAY),
+        (tr("  • 자석 범위 = range × rangeMul"), 12, LIGHT_GRAY),
+        (f"  • expToNext = {formula(bal.exp_to_next)}", 12, CYAN),
+        ("", 8),
+        (tr("▎ 폭탄"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  • 쿨다운 {cd}초, 전체 적 {dmg}대미지 (보스 {boss})", cd=bal.bomb_cd, dmg=bal.bomb_dmg, boss=bal.bomb_boss_dmg),
+         12, LIGHT_GRAY),
+        (tr("  • 금색 화면 플래시 + 파티클 30개"), 12, LIGHT_GRAY),
+    ]
+    add_multiline(slide, Inches(7.0), Inches(1.0), Inches(5.8), Inches(5.8), bal_right)
 
 
 # ════════════════════════════════════════════
 # SLIDE 8: UI & 컨트롤
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "🎮 UI & 모바일 컨트롤", 28, GOLD, True)
-
-ui_left = [
-    ("▎ HUD 레이아웃", 16, ORANGE, True),
-    ("", 4),
-    ("  좌상단: 타이머 (MM:SS, 금색, 14px)", 12, LIGHT_GRAY),
-    ("  우상단: 킬 수 (💀 N, 빨간색)", 12, LIGHT_GRAY),
-    ("  중앙 상단: 현재 적 수 (N 요괴, 회색)", 12, LIGHT_GRAY),
-    ("  하단 좌: HP바 (100px, 초록/빨강) + Lv 표시", 12, LIGHT_GRAY),
-    ("  하단: EXP바 (전체 너비, 민트색)", 12, LIGHT_GRAY),
-    ("  좌하단: 무기 아이콘 (22×22 사각형, 이름+레벨)", 12, LIGHT_GRAY),
-    ("  우하단: 폭탄 버튼 (원형, 반경 28px)", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 화면 플래시 이펙트", 16, ORANGE, True),
-    ("", 4),
-    ("  피격: 빨간색 (0.15초)", 12, RGBColor(255, 100, 100)),
-    ("  폭탄: 금색 (0.5초)", 12, GOLD),
-    ("  보스 처치: 금색 (0.3초)", 12, GOLD),
-    ("  승리: 금색 (1.0초)", 12, GOLD),
-]
-add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.8), Inches(5.5), ui_left)
-
-ui_right = [
-    ("▎ 모바일 컨트롤", 16, ORANGE, True),
-    ("", 4),
-    ("  이동: 터치 드래그 (조이스틱식, 5px 데드존)", 12, LIGHT_GRAY),
-    ("  폭탄: 우하단 원형 버튼 터치", 12, LIGHT_GRAY),
-    ("  메뉴: handleTap()으로 터치/클릭 통합", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 키보드 컨트롤", 16, ORANGE, True),
-    ("", 4),
-    ("  이동: 방향키 / WASD", 12, LIGHT_GRAY),
-    ("  폭탄: 스페이스바", 12, LIGHT_GRAY),
-    ("  레벨업: 1, 2, 3 키", 12, LIGHT_GRAY),
-    ("  시작: Enter / Space", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 폭탄 버튼 렌더링", 16, ORANGE, True),
-    ("", 4),
-    ("  대기: 금색 글로우 + '부' 글자 + '폭탄' 라벨", 12, LIGHT_GRAY),
-    ("  쿨다운: 회색 원 + 쿨다운 아크 + 잔여시간 숫자", 12, LIGHT_GRAY),
-    ("", 8),
-    ("▎ 레벨업 UI", 16, ORANGE, True),
-    ("", 4),
-    ("  반투명 검정 오버레이 + 3장 카드 (110×160px)", 12, LIGHT_GRAY),
-    ("  진화 카드: 보라색 배경, 금색 텍스트", 12, PURPLE),
-]
-add_multiline(slide, Inches(7.0), Inches(1.0), Inches(5.8), Inches(6.0), ui_right)
+@deck_slide()
+def slide_controls(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("🎮 UI & 모바일 컨트롤"), 28, GOLD, True)
+
+    ui_left = [
+        (tr("▎ HUD 레이아웃"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  좌상단: 타이머 (MM:SS, 금색, 14px)"), 12, LIGHT_GRAY),
+        (tr("  우상단: 킬 수 (💀 N, 빨간색)"), 12, LIGHT_GRAY),
+        (tr("  중앙 상단: 현재 적 수 (N 요괴, 회색)"), 12, LIGHT_GRAY),
+        (tr("  하단 좌: HP바 (100px, 초록/빨강) + Lv 표시"), 12, LIGHT_GRAY),
+        (tr("  하단: EXP바 (전체 너비, 민트색)"), 12, LIGHT_GRAY),
+        (tr("  좌하단: 무기 아이콘 (22×22 사각형, 이름+레벨)"), 12, LIGHT_GRAY),
+        (tr("  우하단: 폭탄 버튼 (원형, 반경 28px)"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 화면 플래시 이펙트"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  피격: 빨간색 (0.15초)"), 12, PINK),
+        (tr("  폭탄: 금색 (0.5초)"), 12, GOLD),
+        (tr("  보스 처치: 금색 (0.3초)"), 12, GOLD),
+        (tr("  승리: 금색 (1.0초)"), 12, GOLD),
+    ]
+    add_multiline(slide, Inches(0.5), Inches(1.0), Inches(5.8), Inches(5.5), ui_left)
+
+    ui_right = [
+        (tr("▎ 모바일 컨트롤"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  이동: 터치 드래그 (조이스틱식, 5px 데드존)"), 12, LIGHT_GRAY),
+        (tr("  폭탄: 우하단 원형 버튼 터치"), 12, LIGHT_GRAY),
+        (tr("  메뉴: handleTap()으로 터치/클릭 통합"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 키보드 컨트롤"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  이동: 방향키 / WASD"), 12, LIGHT_GRAY),
+        (tr("  폭탄: 스페이스바"), 12, LIGHT_GRAY),
+        (tr("  레벨업: 1, 2, 3 키"), 12, LIGHT_GRAY),
+        (tr("  시작: Enter / Space"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 폭탄 버튼 렌더링"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  대기: 금색 글로우 + '부' 글자 + '폭탄' 라벨"), 12, LIGHT_GRAY),
+        (tr("  쿨다운: 회색 원 + 쿨다운 아크 + 잔여시간 숫자"), 12, LIGHT_GRAY),
+        ("", 8),
+        (tr("▎ 레벨업 UI"), 16, ORANGE, True),
+        ("", 4),
+        (tr("  반투명 검정 오버레이 + 3장 카드 (110×160px)"), 12, LIGHT_GRAY),
+        (tr("  진화 카드: 보라색 배경, 금색 텍스트"), 12, PURPLE),
+    ]
+    add_multiline(slide, Inches(7.0), Inches(1.0), Inches(5.8), Inches(6.0), ui_right)
 
 
 # ════════════════════════════════════════════
 # SLIDE 9: 전체 프롬프트 (1/2)
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), RED)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "📝 재현용 프롬프트 (1/2)", 28, RED, True)
-
-prompt1 = """한국 신화 뱀서라이크(Vampire Survivors류) 게임 "퇴마록"을 HTML5 Canvas 단일 파일(game.js)로 만들어줘.
-외부 이미지/라이브러리 없이 Canvas API로 모든 픽셀아트를 직접 그려야 해.
-GitHub Pages로 배포할 거야. repo: studiovarem-ui/toemarok
+@deck_slide("chars", "weapons", "CHAR_LOOKS", "PROMPT_1")
+def slide_prompt_1(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), RED)
 
-## 기술 스펙
-- 캔버스: 400×700, CSS flex 중앙정렬, image-rendering: pixelated
-- 모바일 최적화: touch-area div(z-index:10), canvas.getBoundingClientRect()로 좌표 변환
-- touchstart에서 e.preventDefault() 사용하므로 click 이벤트 차단됨 → handleTap() 함수를 만들어서 touchstart와 click 양쪽에서 호출
-- 상태: title → charSelect → playing ↔ levelUp → gameOver / victory
-- Web Audio API로 효과음 (hit, kill, levelup, bomb, pickup, boss)
-- localStorage 저장 (unlocks, bestTime, bestKills, totalClears)
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("📝 재현용 프롬프트 (1/2)"), 28, RED, True)
 
-## 캐릭터 6종 (각각 고유 픽셀아트 스프라이트 함수)
-퇴마사(균형, 부적(0), HP:150 SPD:130 ATK:1.2 RANGE:50, 기본해금)
-무녀(원거리, 신령방울(1), HP:120 SPD:120 ATK:1.3 RANGE:60, 기본해금)
-도깨비(근접, 방망이(2), HP:180 SPD:110 ATK:1.5 RANGE:40, 1클리어)
-구미호(속도, 여우불(3), HP:100 SPD:170 ATK:1.1 RANGE:45, 3클리어)
-장군(탱커, 신궁(5), HP:220 SPD:100 ATK:1.2 RANGE:35, 5클리어)
-산신령(소환, 천둥(4), HP:130 SPD:110 ATK:1.4 RANGE:70, 생존900초)
+    char_specs = "\n".join(
+        f"{c.name}({c.desc}, {d.weapons[c.weapon].name}({c.weapon}), HP:{n(c.hp)} SPD:{n(c.spd)} "
+        f"ATK:{n(c.atk)} RANGE:{n(c.range)}, {unlock_text(c)})" for c in d.chars)
+    char_looks = ", ".join(f"{c.name}({CHAR_LOOKS[c.name][1]})" for c in d.chars if c.name in CHAR_LOOKS)
 
-각 캐릭터는 16-20px 상세 픽셀아트: 퇴마사(하얀 도복+검은 갓+부적), 무녀(빨간치마+꽃장식+방울),
-도깨비(파란피부+금뿔+방망이), 구미호(분홍한복+5꼬리애니+여우불),
-장군(갈색갑옷+빨간투구+창), 산신령(흰도복+흰수염+녹색오라+호랑이)"""
+    prompt1 = tr(PROMPT_1, n=len(d.chars), char_specs=char_specs, char_looks=char_looks)
 
-add_multiline(slide, Inches(0.4), Inches(0.9), Inches(12.5), Inches(6.3), [
-    (prompt1, 10, LIGHT_GRAY)
-])
+    add_multiline(slide, Inches(0.4), Inches(0.9), Inches(12.5), Inches(6.3), [
+        (prompt1, 10, LIGHT_GRAY)
+    ])
 
 
 # ════════════════════════════════════════════
 # SLIDE 10: 전체 프롬프트 (2/2)
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), RED)
-
-add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
-         "📝 재현용 프롬프트 (2/2)", 28, RED, True)
-
-prompt2 = """## 무기 8종
-부적(projectile,cd:0.5,레벨=개수,evolved:7발+처치시범위폭발) / 신령방울(homing,cd:0.8,min(lv,3)발)
-도깨비방망이(spin,cd:1.0,궤도회전,min(1+lv/2,3)개,evolved:4개+넉백) / 여우불(zone,cd:1.5,evolved:9궤도화염)
-천둥(thunder,cd:1.2,즉발min(lv,3)대상,evolved:5체인+슬로우1.5초 게임타임기반)
-신궁(pierce,cd:0.6,min(lv,3)발,lv5:무한관통) / 용의숨결(breath,cd:1.8,부채꼴,lv3+화상,evolved:관통드래곤)
-귀살검(slash,cd:0.4,전방베기,lv5:후방도공격)
-
-투사체별 개별 크리티컬 판정(rollCrit()), 크리시 "크리!" + 대미지×2
-
-## 패시브 8종: 음양오행(atk+15%), 구미호가죽(spd+10%), 풍백가호(range+12%), 황금(exp+15%),
-산삼(regen: 3초/lv간격, 3+lv*2회복, 초록숫자+파티클), 여의주(cdr-8%),
-도깨비감투(dodge+10%, "회피!"텍스트+파란파티클), 삼족오부적(crit+8%, "크리!"텍스트)
-
-## 진화: 부적+음양오행=봉인진 / 여우불+구미호가죽=삼매화 / 천둥+풍백가호=뇌신
-방망이+황금=여의봉 / 용숨결+여의주=청룡
-
-## 적 8종: 잡귀(hp:2,spd:65,dmg:2,straight,0초) 도깨불(4,50,4,zigzag,30초)
-물귀신(6,40,4,aimed,90초) 야차(5,100,5,swooper,150초) 강시(16,30,6,tank,210초)
-원귀(6,18,4,sniper투사체,270초) 삼두구(3,55,3,formation3마리,330초) 이무기(12,45,5,spiral,400초)
-
-## 보스: 귀왕(HP:200,SPD:35,DMG:12,450초,추적→돌진→폭발+소환)
-구미호왕(HP:500,SPD:30,DMG:15,900초,궤도+유도탄→여우불장판, 처치시 victory화면)
-
-## 밸런스: 스폰=1.2+gameTime/60*0.6+floor(gameTime/60)*0.3
-웨이브30초마다=4+floor(gameTime/60), HP스케일=1+gameTime/60*0.1
-맵반경1200, 적max200(먼적제거), 폭탄cd30초(전체50대미지,보스25)
-
-## 버그방지: 적uid사용(_tick추적), 천둥슬로우=게임타임타이머(setTimeout금지),
-호밍리타겟, 적존대미지=0.5초틱(dmg*dt금지)
-
-game.js가 길면 여러 파트로 나눠서 cat >>으로 이어붙여.
-완성 후 GitHub Pages 배포."""
-
-add_multiline(slide, Inches(0.4), Inches(0.9), Inches(12.5), Inches(6.3), [
-    (prompt2, 10, LIGHT_GRAY)
-])
+@deck_slide("weapons", "passives", "evolutions", "enemies", "bosses", "balance",
+            "WEAPON_NOTES", "PASSIVE_NOTES", "PATTERN_LABELS", "BOSS_NOTES", "PROMPT_2")
+def slide_prompt_2(slide, d):
+    bal = d.balance
+    boss_times = boss_first_times(d)
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), RED)
+
+    add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.5),
+             tr("📝 재현용 프롬프트 (2/2)"), 28, RED, True)
+
+    weapon_specs = "\n".join(" / ".join(weapon_spec(w) for w in d.weapons[i:i + 2]) for i in range(0, len(d.weapons), 2))
+    passive_specs = ", ".join(passive_spec(p) for p in d.passives)
+    evo_specs = " / ".join(f"{d.weapons[e.weapon].name.replace(' ', '')}+{d.passives[e.passive].name.replace(' ', '')}={e.name}"
+                           for e in d.evolutions)
+    enemy_specs = " ".join(enemy_spec(i, e) for i, e in enumerate(d.enemies))
+    boss_specs = "\n".join(
+        f"{b.name}(HP:{n(b.hp)},SPD:{n(b.spd)},DMG:{n(b.dmg)},{'/'.join(secs(t) for t in boss_times[b.name])},"
+        f"{BOSS_NOTES.get(b.name, (b.pattern,))[0]})" for b in (next(x for x in d.bosses if x.name == nm) for nm in boss_times))
+
+    prompt2 = tr(PROMPT_2, weapons=len(d.weapons), weapon_specs=weapon_specs, passives=len(d.passives),
+                 passive_specs=passive_specs, evo_specs=evo_specs, enemies=len(d.enemies), enemy_specs=enemy_specs,
+                 boss_interval=bal.boss_interval, boss_hp=bal.boss_hp_per_wave * 100, boss_specs=boss_specs,
+                 spawn=formula(bal.spawn_rate).replace(' ', ''), burst_interval=bal.burst_interval,
+                 burst=formula(bal.burst_count).replace(' ', ''), hp_scale=formula(bal.hp_scale).replace(' ', ''),
+                 map_radius=bal.map_radius, cap=bal.enemy_cap,
+                 bomb_cd=bal.bomb_cd, bomb_dmg=bal.bomb_dmg, bomb_boss=bal.bomb_boss_dmg)
+
+    add_multiline(slide, Inches(0.4), Inches(0.9), Inches(12.5), Inches(6.3), [
+        (prompt2, 10, LIGHT_GRAY)
+    ])
 
 
 # ════════════════════════════════════════════
 # SLIDE 11: 마무리
 # ════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide)
-add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
-
-add_multiline(slide, Inches(0), Inches(2.0), SW, Inches(4.0), [
-    ("퇴마록 재현 가이드", 36, GOLD, True, PP_ALIGN.CENTER),
-    ("", 12),
-    ("이 프롬프트로 동일한 게임을 처음부터 재현할 수 있습니다", 16, LIGHT_GRAY, False, PP_ALIGN.CENTER),
-    ("", 12),
-    ("📁  3 파일: index.html + style.css + game.js (~2100줄)", 14, MED_GRAY, False, PP_ALIGN.CENTER),
-    ("🎭  6 캐릭터  •  ⚔️ 8 무기  •  💎 8 패시브  •  🔄 5 진화", 14, MED_GRAY, False, PP_ALIGN.CENTER),
-    ("👹  8 적 타입  •  💀 2 보스  •  🏆 승리 화면", 14, MED_GRAY, False, PP_ALIGN.CENTER),
-    ("", 16),
-    ("studiovarem-ui.github.io/toemarok", 14, RGBColor(100, 180, 255), False, PP_ALIGN.CENTER),
-])
-
-add_shape(slide, Inches(0), Inches(7.44), SW, Inches(0.06), GOLD)
-
-
-# ── Save ──
-output_path = "/Users/jaehoho/Desktop/j-hoho/ai/game_03/퇴마록_재현_프롬프트.pptx"
-prs.save(output_path)
-print(f"✅ PPT saved: {output_path}")
-print(f"   Slides: {len(prs.slides)}")
+@deck_slide("lines", "chars", "weapons", "passives", "evolutions", "enemies", "bosses")
+def slide_closing(slide, d):
+    add_bg(slide)
+    add_shape(slide, Inches(0), Inches(0), SW, Inches(0.06), GOLD)
+
+    add_multiline(slide, Inches(0), Inches(2.0), SW, Inches(4.0), [
+        (tr("퇴마록 재현 가이드"), 36, GOLD, True, PP_ALIGN.CENTER),
+        ("", 12),
+        (tr("이 프롬프트로 동일한 게임을 처음부터 재현할 수 있습니다"), 16, LIGHT_GRAY, False, PP_ALIGN.CENTER),
+        ("", 12),
+        (tr("📁  3 파일: index.html + style.css + game.js (~{lines}줄)", lines=round(d.lines, -2)),
+         14, MED_GRAY, False, PP_ALIGN.CENTER),
+        (tr("🎭  {chars} 캐릭터  •  ⚔️ {weapons} 무기  •  💎 {passives} 패시브  •  🔄 {evos} 진화",
+            chars=len(d.chars), weapons=len(d.weapons), passives=len(d.passives), evos=len(d.evolutions)),
+         14, MED_GRAY, False, PP_ALIGN.CENTER),
+        (tr("👹  {enemies} 적 타입  •  💀 {bosses} 보스  •  🏆 승리 화면", enemies=len(d.enemies), bosses=len(d.bosses)),
+         14, MED_GRAY, False, PP_ALIGN.CENTER),
+        ("", 16),
+        ("studiovarem-ui.github.io/toemarok", 14, BLUE, False, PP_ALIGN.CENTER),
+    ])
+
+    add_shape(slide, Inches(0), Inches(7.44), SW, Inches(0.06), GOLD)
+
+
+# ── Build cache ──
+def _input(d, name):
+    return globals()[name] if name.isupper() else getattr(d, name)
+
+
+def _render_helpers():
+    """Module functions the builders call, directly or through other helpers.
+
+    Found from the global names in their code, so CLI and batch code stays
+    out of the slide fingerprints.
+    """
+    found = {}
+    todo = [inspect.unwrap(b).__code__ for b, _ in SLIDES]
+    while todo:
+        code = todo.pop()
+        todo.extend(c for c in code.co_consts if inspect.iscode(c))     # nested defs, lambdas
+        for name in code.co_names:
+            f = globals().get(name)
+            f = inspect.unwrap(f) if callable(f) else None     # lru_cache'd text_style, cell_style
+            if inspect.isfunction(f) and f.__module__ == __name__ and name not in found:
+                found[name] = f
+                todo.append(f.__code__)
+    return [found[name] for name in sorted(found)]
+
+
+def _shared_key():
+    """What every slide depends on: render helpers, palette, style, string table, slide size, python-pptx."""
+    helpers = _render_helpers()
+    h = hashlib.sha256(f"v{CACHE_VERSION} pptx {pptx.__version__} {SW}x{SH} {LOCALE}\n".encode())
+    h.update(repr(sorted(deck_strings.STRINGS.get(LOCALE, {}).items())).encode())
+    for name in PALETTE + STYLE:
+        h.update(f"{name}={globals()[name]}\n".encode())
+    for f in helpers:
+        h.update(inspect.getsource(f).encode())
+    return h.digest()
+
+
+def fingerprint(builder, inputs, d, shared):
+    h = hashlib.sha256(shared)
+    h.update(inspect.getsource(builder).encode())
+    for name in inputs:
+        h.update(f"{name}={_input(d, name)!r}\n".encode())
+    return h.hexdigest()
+
+
+def _file_sha(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _write_atomic(path, blob):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def prune_cache():
+    """Delete cached slides that no manifest lists, and manifests whose deck is gone.
+
+    Returns the number of slide files removed.
+    """
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    names = os.listdir(CACHE_DIR)
+    keep = set()
+    for name in names:
+        if not (name.startswith("out-") and name.endswith(".json")):
+            continue
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not os.path.exists(entry.get("output", "")):
+            os.remove(path)
+            continue
+        keep.update(entry.get("slides", ()))
+    stale = [name for name in names if name.endswith(".xml") and name[:-4] not in keep]
+    for name in stale:
+        os.remove(os.path.join(CACHE_DIR, name))
+    return len(stale)
+
+
+def build(output=OUTPUT, slides=None, force=False, quiet=False, prune=True):
+    """Build the deck at `output` from the 1-based `slides` (default all) in
+    the active locale and palette.
+
+    Returns {"output", "saved", "slides", "reused", "pruned"}; saved is False
+    when the existing file already matched and nothing was written. After a
+    save the cache is pruned, unless `prune` is False (batch workers leave it
+    to build_batch, so one never deletes slides another is reading).
+    """
+    output = os.path.abspath(output)
+    d = localise(gamedata.load())
+    chosen = SLIDES if slides is None else [SLIDES[i - 1] for i in slides]
+    shared = _shared_key()
+    prints = [fingerprint(builder, inputs, d, shared) for builder, inputs in chosen]
+    deck = hashlib.sha256(" ".join(prints).encode()).hexdigest()
+    result = {"output": output, "saved": False, "slides": len(chosen), "reused": len(chosen), "pruned": 0}
+
+    # one manifest per output, so batch workers never write the same file
+    manifest = os.path.join(CACHE_DIR, f"out-{hashlib.sha256(output.encode()).hexdigest()[:16]}.json")
+    entry = None
+    if os.path.exists(manifest):
+        with open(manifest, encoding="utf-8") as f:
+            entry = json.load(f)
+    if not force and entry and entry["deck"] == deck and entry["sha"] == _file_sha(output):
+        if not quiet:
+            print(f"✅ PPT up to date: {output}")
+        return result
+
+    prs = Presentation()
+    prs.slide_width = SW
+    prs.slide_height = SH
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    reused = 0
+    for (builder, _), fp in zip(chosen, prints):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
+        cached = os.path.join(CACHE_DIR, f"{fp}.xml")
+        if not force and os.path.exists(cached):
+            # Slides hold no relationships besides their layout (rId1), so the
+            # stored XML drops straight into a fresh blank slide part.
+            with open(cached, "rb") as f:
+                slide.part._element = parse_xml(f.read())
+            reused += 1
+        else:
+            builder(slide, d)
+            _write_atomic(cached, slide.part.blob)
+
+    tmp = f"{output}.{os.getpid()}.tmp"
+    prs.save(tmp)
+    os.replace(tmp, output)
+    entry = {"output": output, "deck": deck, "sha": _file_sha(output), "slides": prints}
+    _write_atomic(manifest, json.dumps(entry, ensure_ascii=False, indent=1).encode("utf-8"))
+    result.update(saved=True, reused=reused, pruned=prune_cache() if prune else 0)
+    if not quiet:
+        print(f"✅ PPT saved: {output}")
+        print(f"   Slides: {len(prs.slides)} (reused {reused}, built {len(prs.slides) - reused})"
+              + (f", pruned {result['pruned']} stale" if result["pruned"] else ""))
+    return result
+
+
+# ── Batch ──
+def build_variant(variant, force=False):
+    """Pool task: build one {"locale", "palette", "slides", "output"} variant.
+
+    Workers are reused across tasks, so both globals are set every time.
+    """
+    use_locale(variant["locale"])
+    use_palette(variant["palette"])
+    t0 = time.perf_counter()
+    result = build(variant["output"], variant["slides"], force, quiet=True, prune=False)
+    return {**variant, **result, "seconds": time.perf_counter() - t0}
+
+
+def variant_matrix(output, locales, palettes, subsets):
+    """Every locale × palette × slide subset, each with its own output path."""
+    stem, ext = os.path.splitext(output)
+    variants = []
+    for locale in locales:
+        for palette in palettes:
+            for slides in subsets:
+                tag = f"-{locale}-{palette}" + (f"-s{'-'.join(map(str, slides))}" if slides else "")
+                variants.append({"locale": locale, "palette": palette, "slides": slides, "output": stem + tag + ext})
+    return variants
+
+
+def build_batch(variants, jobs=None, force=False):
+    """Build `variants` in a process pool and print a per-variant summary."""
+    t0 = time.perf_counter()
+    jobs = min(jobs or os.cpu_count() or 1, len(variants))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(build_variant, variants, [force] * len(variants)))
+    pruned = prune_cache() if any(r["saved"] for r in results) else 0
+    wall = time.perf_counter() - t0
+
+    print(f"{'variant':<16} {'slides':>6} {'reused':>6} {'time':>7}  output")
+    for r in results:
+        name = f"{r['locale']}/{r['palette']}"
+        state = "" if r["saved"] else "  (up to date)"
+        print(f"{name:<16} {r['slides']:>6} {r['reused']:>6} {r['seconds']:>6.2f}s  {r['output']}{state}")
+    print(f"✅ {len(results)} decks in {wall:.2f}s wall, {sum(r['seconds'] for r in results):.2f}s total "
+          f"on {jobs} worker{'s' if jobs > 1 else ''}" + (f", pruned {pruned} stale slides" if pruned else ""))
+    return results
+
+
+def slide_list(text):
+    """'3,5-7' → [3, 5, 6, 7]"""
+    picked = []
+    for part in text.split(","):
+        lo, _, hi = part.strip().partition("-")
+        picked.extend(range(int(lo), int(hi or lo) + 1))
+    if not picked or not all(1 <= i <= len(SLIDES) for i in picked):
+        raise argparse.ArgumentTypeError(f"slides are numbered 1-{len(SLIDES)}: {text}")
+    return picked
+
+
+def choices(allowed):
+    """argparse type for a comma list drawn from `allowed`."""
+    def parse(text):
+        picked = [x.strip() for x in text.split(",")]
+        bad = [x for x in picked if x not in allowed]
+        if bad:
+            raise argparse.ArgumentTypeError(f"unknown {', '.join(bad)}; choose from {', '.join(allowed)}")
+        return picked
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default=OUTPUT,
+                        help="deck path; a batch adds -<locale>-<palette> to the file name")
+    parser.add_argument("--slides", type=slide_list, action="append",
+                        help="1-based subset, e.g. 3,5-7; repeat for several subsets")
+    parser.add_argument("--locale", type=choices(LOCALES), default=["ko"], help=f"comma list of {', '.join(LOCALES)}")
+    parser.add_argument("--palette", type=choices(tuple(PALETTES)), default=["dark"],
+                        help=f"comma list of {', '.join(PALETTES)}")
+    parser.add_argument("-j", "--jobs", type=int, help="batch worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache")
+    args = parser.parse_args(argv)
+
+    subsets = args.slides or [None]
+    if len(args.locale) * len(args.palette) * len(subsets) == 1:
+        use_locale(args.locale[0])
+        use_palette(args.palette[0])
+        build(args.output, subsets[0], args.force)
+    else:
+        build_batch(variant_matrix(args.output, args.locale, args.palette, subsets), args.jobs, args.force)
+
+
+if __name__ == "__main__":
+    main()
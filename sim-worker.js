@@ -0,0 +1,19 @@
+// ============================================
+// 퇴마록 - simulation worker (?worker=1)
+// ============================================
+// Loads game.js inside a Worker and hands control to runSimWorker(); see
+// SIMULATION WORKER in game.js. game.js touches the DOM at load time, so it
+// gets inert stand-ins for the few objects it reaches for.
+const noop = () => {};
+function stubCanvas() {
+    const g = new Proxy({}, { get: (o, k) => (k in o ? o[k] : noop), set: (o, k, v) => { o[k] = v; return true; } });
+    return { width: 400, height: 700, style: {}, addEventListener: noop, getContext: () => g,
+        getBoundingClientRect: () => ({ left: 0, top: 0, width: 400, height: 700 }) };
+}
+self.window = self;
+self.innerWidth = 400; self.innerHeight = 700;
+self.document = { getElementById: stubCanvas, createElement: stubCanvas, addEventListener: noop };
+self.requestAnimationFrame = noop;
+
+importScripts('game.js' + self.location.search);
+runSimWorker();
@@ -0,0 +1,113 @@
+// ============================================
+// 퇴마록 - offline service worker
+// ============================================
+// VERSION and asset-manifest.json are written by build.js. Each version
+// gets its own cache, filled completely on install, and assets are always
+// served from the cache of the version that is active, so a page never mixes
+// files from two builds. The game asks a waiting worker to take over on the
+// title screen (see OFFLINE CACHE in game.js).
+// The BGM tracks go in a separate cache shared across versions and keyed by
+// content hash. They are cached on first play, not on install.
+const VERSION = '775591d22a4e';
+const CACHE = 'toemarok-' + VERSION;
+const BGM_CACHE = 'toemarok-bgm';
+let manifest = null;
+const bgmFills = new Map(); // hashed key -> pending background fill of BGM_CACHE
+
+function loadManifest() {
+    if (manifest) return Promise.resolve(manifest);
+    return caches.open(CACHE)
+        .then((c) => c.match('asset-manifest.json'))
+        .then((r) => r || fetch('asset-manifest.json?v=' + VERSION, { cache: 'no-store' }))
+        .then((r) => r.clone().json().then((m) => { manifest = m; return m; }));
+}
+
+// Cache key for a same-origin path: its content-hashed URL, whatever query
+// the page used (the sim worker passes the page's ?flags through).
+function hashedKey(m, name) { return m.files[name] ? name + '?v=' + m.files[name] : null; }
+
+self.addEventListener('install', (ev) => {
+    ev.waitUntil(fetch('asset-manifest.json?v=' + VERSION, { cache: 'no-store' }).then((r) => r.json()).then((m) => {
+        manifest = m;
+        return caches.open(CACHE).then((c) => Promise.all([
+            c.put('asset-manifest.json', new Response(JSON.stringify(m), { headers: { 'Content-Type': 'application/json' } })),
+            ...m.precache.map((name) => fetch(hashedKey(m, name), { cache: 'no-store' }).then((r) => {
+                if (!r.ok) throw new Error(name + ': ' + r.status);
+                return c.put(hashedKey(m, name), r);
+            })),
+        ]));
+    }));
+});
+
+self.addEventListener('activate', (ev) => {
+    ev.waitUntil(loadManifest().then((m) => Promise.all([
+        caches.keys().then((keys) => Promise.all(keys
+            .filter((k) => k.startsWith('toemarok-') && k !== CACHE && k !== BGM_CACHE)
+            .map((k) => caches.delete(k)))),
+        // Drop BGM bodies whose hash is no longer in the manifest
+        caches.open(BGM_CACHE).then((c) => c.keys().then((reqs) => Promise.all(reqs.map((req) => {
+            const u = new URL(req.url);
+            const name = u.pathname.split('/').pop();
+            return u.searchParams.get('v') === m.files[name] ? null : c.delete(req);
+        })))),
+    ])));
+});
+
+self.addEventListener('message', (ev) => {
+    if (ev.data && ev.data.type === 'skipWaiting') self.skipWaiting();
+});
+
+self.addEventListener('fetch', (ev) => {
+    const req = ev.request;
+    if (req.method !== 'GET') return;
+    const url = new URL(req.url);
+    if (url.origin !== self.location.origin) return;
+    const scope = new URL(self.registration.scope).pathname;
+    const name = url.pathname === scope ? 'index.html' : url.pathname.slice(scope.length);
+    ev.respondWith(loadManifest().then((m) => {
+        if (m.lazy.includes(name)) return serveBgm(ev, m, name, req);
+        const key = hashedKey(m, name);
+        if (!key) return fetch(req);
+        return caches.open(CACHE).then((c) => c.match(key)).then((hit) => hit || fetch(req));
+    }).catch(() => fetch(req)));
+});
+
+// The <audio> element asks for byte ranges. A cached track is answered by
+// slicing it. On a miss, the range request goes to the network, so playback
+// starts at once, and the whole file is fetched and cached in the background,
+// once per track however many ranges are asked for while that fetch runs.
+function serveBgm(ev, m, name, req) {
+    const key = hashedKey(m, name);
+    return caches.open(BGM_CACHE).then((c) => c.match(key).then((hit) => {
+        if (hit) return rangeOf(hit, req.headers.get('Range'));
+        let fill = bgmFills.get(key);
+        if (!fill) {
+            fill = fetch(key).then((r) => (r.ok && r.status === 200 ? c.put(key, r) : null)).catch(() => {})
+                .then(() => { bgmFills.delete(key); });
+            bgmFills.set(key, fill);
+        }
+        ev.waitUntil(fill);
+        return fetch(req);
+    }));
+}
+
+function rangeOf(resp, range) {
+    const m = range && /^bytes=(\d*)-(\d*)$/.exec(range);
+    if (!m) return resp;
+    return resp.blob().then((blob) => {
+        const size = blob.size;
+        let start = m[1] === '' ? size - parseInt(m[2], 10) : parseInt(m[1], 10);
+        let end = m[1] !== '' && m[2] !== '' ? parseInt(m[2], 10) : size - 1;
+        start = Math.max(0, start); end = Math.min(size - 1, end);
+        if (start > end) return new Response(null, { status: 416, headers: { 'Content-Range': `bytes */${size}` } });
+        return new Response(blob.slice(start, end + 1), {
+            status: 206,
+            headers: {
+                'Content-Type': resp.headers.get('Content-Type') || 'audio/mpeg',
+                'Content-Range': `bytes ${start}-${end}/${size}`,
+                'Content-Length': String(end - start + 1),
+                'Accept-Ranges': 'bytes',
+            },
+        });
+    });
+}